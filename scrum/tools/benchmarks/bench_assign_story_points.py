@@ -0,0 +1,94 @@
+""" Benchmark Board.assign_story_points on synthetic boards of growing size
+
+Prints the time taken per board and per card. Per-card time staying flat as the board grows
+shows that assigning story points scales linearly with the number of cards.
+
+Usage:
+    python benchmarks/bench_assign_story_points.py [max_cards]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from sprint_utils import load_config
+from trello.board import Board
+
+SIZES = (1000, 5000, 10000, 25000, 50000)
+REPEATS = 3
+
+
+def make_board_data(n_cards, board_config):
+    """ Build synthetic cards, lists and custom field data for a board of n_cards
+
+    Args:
+        n_cards (int): Number of cards on the board
+        board_config (dict): Board configuration holding the story point custom field IDs
+
+    Returns:
+        tuple: (cards, lists, custom_fields_data)
+    """
+    lists = [{"id": f"list{i}", "name": name} for i, name in enumerate(("To Do", "Doing", "Done"))]
+    cards = []
+    custom_fields_data = []
+    for i in range(n_cards):
+        card_id = f"{i:024x}"
+        cards.append({
+            "id": card_id,
+            "shortLink": f"s{i}",
+            "name": f"Card {i}",
+            "labels": [{"name": "UNPLANNED"}] if i % 5 == 0 else [],
+            "idList": f"list{i % 3}",
+            "idMembers": []
+        })
+        # Leave every tenth card out of the custom field data entirely
+        if i % 10 == 0:
+            continue
+        custom_fields_data.append({
+            "id": card_id,
+            "customFieldItems": [
+                {"idCustomField": board_config['sp_total_id'], "value": {"number": str(i % 8)}},
+                {"idCustomField": board_config['sp_spent_id'], "value": {"number": str(i % 5)}}
+            ]
+        })
+    return cards, lists, custom_fields_data
+
+
+def time_assign_story_points(n_cards, board_config):
+    """ Time Board.assign_story_points for a synthetic board, keeping the best of REPEATS runs
+
+    Args:
+        n_cards (int): Number of cards on the board
+        board_config (dict): Board configuration holding the story point custom field IDs
+
+    Returns:
+        float: Seconds taken by the fastest run
+    """
+    cards, lists, custom_fields_data = make_board_data(n_cards, board_config)
+    best = float("inf")
+    for _ in range(REPEATS):
+        board = Board(None, cards, lists=lists, custom_fields_data=custom_fields_data)
+        board.extract_cards(calc_sp=False)
+        start = time.perf_counter()
+        board.assign_story_points()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(max_cards):
+    """ Print timings for each board size up to max_cards """
+    board_config = load_config(parent_path / "config.json")['board']
+    print(f"{'cards':>8}{'seconds':>12}{'us/card':>10}")
+    for n_cards in SIZES:
+        if n_cards > max_cards:
+            break
+        seconds = time_assign_story_points(n_cards, board_config)
+        print(f"{n_cards:>8}{seconds:>12.4f}{seconds / n_cards * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZES[-1])
@@ -0,0 +1,108 @@
+""" Benchmark the memory held per Card for a large synthetic board
+
+Compares the slotted Card against LegacyCard, a copy of the previous dictionary-based layout,
+by measuring the memory still allocated once the parsed JSON has been released.
+
+Usage:
+    python benchmarks/bench_card_memory.py [n_cards]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from trello.card import Card
+
+N_CARDS = 100000
+LABELS = ("User Story", "Internal Work", "UNPLANNED", "RETRO", "Change", "SWARM")
+LISTS = ("To Do", "Doing", "Review", "Done")
+
+
+class LegacyCard:
+    """ Card layout before slots: per-instance __dict__ and a story points dictionary """
+    def __init__(self, card_id, story_points, short_link='', title='', labels=None,
+                 list_name='', id_members=None):
+        self.card_id = card_id
+        self.short_link = short_link
+        self.story_points = story_points
+        self.title = title
+        self.labels = labels
+        self.list_name = list_name
+        self.id_members = id_members
+
+
+def make_board_json(n_cards):
+    """ Serialize a synthetic board so each run parses its own copy of every string
+
+    Args:
+        n_cards (int): Number of cards on the board
+
+    Returns:
+        str: The board cards as JSON
+    """
+    cards = [
+        {
+            "id": f"{i:024x}",
+            "shortLink": f"{i:08x}",
+            "name": f"Card {i}",
+            "labels": [LABELS[i % len(LABELS)], LABELS[(i + 1) % len(LABELS)]],
+            "list": LISTS[i % len(LISTS)],
+            "idMembers": [f"{i % 9:024x}"]
+        }
+        for i in range(n_cards)
+    ]
+    return json.dumps(cards)
+
+
+def measure(card_class, board_json):
+    """ Measure the bytes held by cards built from the board JSON
+
+    Args:
+        card_class (type): Card or LegacyCard
+        board_json (str): The board cards as JSON
+
+    Returns:
+        int: Bytes still allocated after the parsed JSON is released
+    """
+    gc.collect()
+    tracemalloc.start()
+    raw_cards = json.loads(board_json)
+    cards = [
+        card_class(
+            card_id=raw["id"],
+            story_points={"total": 3, "spent": 1, "remaining": 2},
+            short_link=raw["shortLink"],
+            title=raw["name"],
+            labels=raw["labels"],
+            list_name=raw["list"],
+            id_members=raw["idMembers"]
+        )
+        for raw in raw_cards
+    ]
+    del raw_cards
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(cards) > 0
+    return held
+
+
+def main(n_cards):
+    """ Print bytes per card before and after """
+    board_json = make_board_json(n_cards)
+    legacy_bytes = measure(LegacyCard, board_json)
+    slotted_bytes = measure(Card, board_json)
+    print(f"{'layout':<10}{'total MB':>10}{'bytes/card':>12}")
+    for name, held in (("legacy", legacy_bytes), ("slotted", slotted_bytes)):
+        print(f"{name:<10}{held / 1e6:>10.1f}{held / n_cards:>12.0f}")
+    print(f"reduction: {1 - slotted_bytes / legacy_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else N_CARDS)
@@ -0,0 +1,78 @@
+""" Print how well past sprint recommendations predicted the completed story points
+  Every stored board snapshot saved right after a sprint summary is replayed
+  through the story point calculation and the recommendation, and compared with
+  the planned points completed in the following sprint.
+"""
+
+# Set working directry for module imports
+import argparse
+import json
+import os
+import sys
+os.chdir("/home/pocdart/pocdart_documentation/scrum/tools/")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+# Import local modules
+from sprint_backtest import DEFAULT_CACHE_PATH, run_backtest
+from sprint_utils import load_config
+from trello.api import TrelloAPI
+from trello.board import Board
+from trello.cache import ResponseCache
+from trello.db import SprintDBManager
+from trello.fleet import get_fleet_configs
+
+def main(use_cache=True, processes=None, as_json=False):
+    """ Print backtest error statistics per board
+
+    Args:
+        use_cache (bool): Reuse recent Trello responses and earlier backtest results
+        processes (int): Worker processes evaluating snapshots
+        as_json (bool): Print the full report, including every sprint, as JSON
+    """
+    # Load configuration
+    config = load_config("config.json")
+    board_configs = get_fleet_configs(config)
+    # Snapshots only hold cards, so take the list names from the live boards
+    cache = ResponseCache() if use_cache else None
+    lists_by_board = {}
+    for board_config in board_configs:
+        trello_api = TrelloAPI(
+            board_id=board_config['board_id'],
+            api_key=board_config['api_key'],
+            api_token=board_config['api_token'],
+            cache=cache
+        )
+        lists_by_board[board_config['board_id']] = trello_api.get_board_lists(
+            fields=Board.LIST_FIELDS)
+
+    report = run_backtest(
+        SprintDBManager(config['mysql']),
+        board_configs,
+        lists_by_board,
+        processes=processes,
+        cache_path=DEFAULT_CACHE_PATH if use_cache else None
+    )
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return
+
+    def format_stat(value):
+        return "-" if value is None else f"{value:.2f}"
+
+    print(f"{'Board':<30} {'Sprints':>7} {'MAE':>8} {'Bias':>8} {'RMSE':>8}")
+    for board in report['boards']:
+        print(f"{board['name'][:30]:<30} {board['sprints']:>7} {format_stat(board['mae']):>8} "
+              f"{format_stat(board['bias']):>8} {format_stat(board['rmse']):>8}")
+    print(f"\n{report['snapshots']} snapshots, {report['cache_hits']} cached, "
+          f"{report['elapsed_seconds']:.2f}s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always fetch fresh board data and re-evaluate every snapshot")
+    parser.add_argument("--processes", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    args = parser.parse_args()
+    main(use_cache=not args.no_cache, processes=args.processes, as_json=args.json)
@@ -3,6 +3,7 @@
 """
 
 # Set working directry for module imports
+import argparse
 import os
 import sys
 from colorama import Fore, Style
@@ -13,22 +14,28 @@ sys.path.append(parent)
 
 # Import local modules
 from sprint_utils import load_config
-from trello.api import TrelloAPI
+from trello.async_api import SyncTrelloAPI
 from trello.board import Board
-def main():
-    """ Generate report on Trello board stats including work type and SP totals by owner """
+from trello.cache import ResponseCache
+from trello.members import DEFAULT_CACHE_PATH, MemberDirectory
+def main(use_cache=True):
+    """ Generate report on Trello board stats including work type and SP totals by owner
+
+    Args:
+        use_cache (bool): Reuse recent Trello responses cached on disk
+    """
     # Load configuration
     board_config = load_config("config.json")['board']
     # Initialize database manager and Trello API
-    trello_api = TrelloAPI(
+    trello_api = SyncTrelloAPI(
         board_id=board_config['board_id'],
         api_key=board_config['api_key'],
-            api_token=board_config['api_token']
+            api_token=board_config['api_token'],
+        cache=ResponseCache() if use_cache else None
     )
 
     # Get board data
-    board_data = trello_api.get_board_cards()
-    board = Board(trello_api, board_data)
+    board = Board.from_snapshot(trello_api)
     board.extract_cards(calc_sp = True)
 
     # By label
@@ -63,9 +70,12 @@ def main():
     # SP totals stratified by owner
     # Initialize result object
     sp_by_owner = {}
-    # Create owner id-name mapping
+    # Create owner id-name mapping from cached members, the snapshot, or one board request
+    member_directory = MemberDirectory(
+        trello_api, cache_path=DEFAULT_CACHE_PATH if use_cache else None)
+    member_directory.add_members(board.get_members())
     members = trello_api.get_board_member_ids()
-    owner_lookup = {value: trello_api.get_member_details(value)["fullName"] for value in members}
+    owner_lookup = member_directory.get_full_names(members)
     # Iterate cards
     for card in board.get_cards():
         # Extract members
@@ -97,4 +107,7 @@ def main():
     print('Members with zero story points assigned: ' + ', '.join(no_points))
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--no-cache", action="store_true", help="Always fetch fresh board data")
+    args = parser.parse_args()
+    main(use_cache=not args.no_cache)
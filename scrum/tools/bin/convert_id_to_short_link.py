@@ -1,7 +1,14 @@
-""" Convert a Trello card ID to the associated shortLink """
+""" Convert Trello card IDs to the associated shortLinks
+
+    Pass card IDs as arguments, or pass none (or "-") to read whitespace-separated IDs from
+    stdin for bulk conversion. Cards are looked up directly in batches of ten, so converting
+    thousands of IDs takes a few hundred small requests instead of downloading the board.
+"""
 
 ## Get SP from current system
-import os, sys
+import argparse
+import os
+import sys
 os.chdir("/home/pocdart/pocdart_documentation/scrum/tools/")
 current = os.path.dirname(os.path.realpath(__file__))
 parent = os.path.dirname(current)
@@ -9,30 +16,48 @@ sys.path.append(parent)
 
 # Import local modules
 from sprint_utils import load_config
-from trello.api import TrelloAPI
-from trello.board import Board
+from trello.async_api import SyncTrelloAPI
+from trello.cache import ResponseCache
+
+def main(card_id, use_cache=True):
+    """ Print card short links given card IDs
 
-def main(card_id):
-    """ Print card short link given card_id
+    A single card ID prints a list holding its short link (empty if the card is not found).
+    Several card IDs print one "card_id short_link" line each, leaving the short link empty
+    for cards that are not found.
 
     Args:
-        card_id (str, hex): Trello card ID
+        card_id (str or list of str, hex): Trello card ID, or a list of them
+        use_cache (bool): Reuse recent Trello responses cached on disk
     """
     # Load configuration
     board_config = load_config("config.json")['board']
-    # Initialize database manager and Trello API
-    trello_api = TrelloAPI(
+    # Initialize Trello API
+    trello_api = SyncTrelloAPI(
         board_id=board_config['board_id'],
         api_key=board_config['api_key'],
-            api_token=board_config['api_token']
+        api_token=board_config['api_token'],
+        cache=ResponseCache() if use_cache else None
     )
-    # Get board data
-    board_data = trello_api.get_board_cards()
-    board = Board(trello_api, board_data)
-    board.extract_cards(calc_sp = False)
+    card_ids = [card_id] if isinstance(card_id, str) else list(card_id)
+    # Look up only the requested cards, projected onto their short link
+    with trello_api:
+        cards = trello_api.get_cards(card_ids, fields=("shortLink",))
     # Print results to console
-    print([card.get_short_link() for card in board.get_cards() if card.get_card_id() == card_id])
+    if isinstance(card_id, str):
+        card = cards.get(card_id)
+        print([card["shortLink"]] if card else [])
+        return
+    for requested_id in card_ids:
+        card = cards.get(requested_id)
+        print(f"{requested_id} {card['shortLink'] if card else ''}")
 
 if __name__ == "__main__":
-    card_id = sys.argv[1]
-    main(card_id)
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("card_ids", nargs="*", help="Trello card IDs; read from stdin if omitted")
+    parser.add_argument("--no-cache", action="store_true", help="Always fetch fresh card data")
+    args = parser.parse_args()
+    ids = args.card_ids
+    if not ids or ids == ["-"]:
+        ids = sys.stdin.read().split()
+    main(ids[0] if len(ids) == 1 else ids, use_cache=not args.no_cache)
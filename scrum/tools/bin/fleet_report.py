@@ -0,0 +1,60 @@
+""" Print a consolidated story point report for every board in the fleet
+  Boards are listed in the "fleet" list of config.json; each entry is merged over
+  the "board" block, so it only needs the settings that differ, e.g. "board_id",
+  "name", "sprint_calc_card" and "unplanned_template_card".
+"""
+
+# Set working directry for module imports
+import argparse
+import json
+import os
+import sys
+os.chdir("/home/pocdart/pocdart_documentation/scrum/tools/")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+# Import local modules
+from sprint_utils import load_config
+from trello.cache import ResponseCache
+from trello.fleet import get_fleet_configs, run_fleet
+
+def main(use_cache=True, max_concurrency=8, processes=None, output_path=None):
+    """ Print the fleet report as JSON
+
+    Args:
+        use_cache (bool): Reuse recent Trello responses cached on disk
+        max_concurrency (int): Most boards fetched at once
+        processes (int): Worker processes calculating story points
+        output_path (str): File to write the report to instead of printing it
+    """
+    # Load configuration
+    config = load_config("config.json")
+    report = run_fleet(
+        get_fleet_configs(config),
+        max_concurrency=max_concurrency,
+        processes=processes,
+        cache=ResponseCache() if use_cache else None
+    )
+    output = json.dumps(report, indent=2)
+    if output_path is None:
+        print(output)
+        return
+    with open(output_path, "w", encoding="utf-8") as output_file:
+        output_file.write(output)
+    print(f"{report['succeeded']} boards processed, {report['failed']} failed, "
+          f"{report['boards_per_second']:.2f} boards/s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--no-cache", action="store_true", help="Always fetch fresh board data")
+    parser.add_argument("--concurrency", type=int, default=8, help="Most boards fetched at once")
+    parser.add_argument("--processes", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", metavar="FILE", help="Write the JSON report to FILE")
+    args = parser.parse_args()
+    main(
+        use_cache=not args.no_cache,
+        max_concurrency=args.concurrency,
+        processes=args.processes,
+        output_path=args.output
+    )
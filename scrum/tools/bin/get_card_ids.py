@@ -1,6 +1,7 @@
 """ Print a pipe-deliimeted list of card short_links for all cards on the board """
 
 # Set working directry for module imports
+import argparse
 import os
 import sys
 os.chdir("/home/pocdart/pocdart_documentation/scrum/tools/")
@@ -12,20 +13,25 @@ sys.path.append(parent)
 from sprint_utils import load_config
 from trello.api import TrelloAPI
 from trello.board import Board
+from trello.cache import ResponseCache
 
-def main():
-    """ Print pipe-delimited list of card short links """
+def main(use_cache=True):
+    """ Print pipe-delimited list of card short links
+
+    Args:
+        use_cache (bool): Reuse recent Trello responses cached on disk
+    """
     # Load configuration
     board_config = load_config("config.json")['board']
     # Initialize database manager and Trello API
     trello_api = TrelloAPI(
         board_id=board_config['board_id'],
         api_key=board_config['api_key'],
-        api_token=board_config['api_token']
+        api_token=board_config['api_token'],
+        cache=ResponseCache() if use_cache else None
     )
     # Get board data
-    board_data = trello_api.get_board_cards()
-    board = Board(trello_api, board_data)
+    board = Board.from_snapshot(trello_api)
     board.extract_cards(calc_sp = False)
     # Compile list of short_links
     card_links = []
@@ -36,4 +42,7 @@ def main():
     print(output)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--no-cache", action="store_true", help="Always fetch fresh board data")
+    args = parser.parse_args()
+    main(use_cache=not args.no_cache)
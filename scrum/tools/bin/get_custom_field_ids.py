@@ -4,6 +4,7 @@
 """
 
 ## Get SP from current system
+import argparse
 import os
 import sys
 import pprint
@@ -15,16 +16,22 @@ sys.path.append(parent)
 # Import local modules
 from sprint_utils import load_config
 from trello.api import TrelloAPI
+from trello.cache import ResponseCache
 
-def main():
-    """ Print custom fields json object from first card with custom fields data populated """
+def main(use_cache=True):
+    """ Print custom fields json object from first card with custom fields data populated
+
+    Args:
+        use_cache (bool): Reuse recent Trello responses cached on disk
+    """
     # Load configuration
     board_config = load_config("config.json")['board']
     # Initialize database manager and Trello API
     trello_api = TrelloAPI(
         board_id=board_config['board_id'],
         api_key=board_config['api_key'],
-            api_token=board_config['api_token']
+            api_token=board_config['api_token'],
+        cache=ResponseCache() if use_cache else None
     )
 
     custom_fields_data = trello_api.get_custom_fields_data()
@@ -32,4 +39,7 @@ def main():
     pprint.pp(populated_custom_fields[0])
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--no-cache", action="store_true", help="Always fetch fresh board data")
+    args = parser.parse_args()
+    main(use_cache=not args.no_cache)
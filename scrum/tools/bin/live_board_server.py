@@ -0,0 +1,69 @@
+""" Serve live story point totals kept current by Trello webhook callbacks
+  Register a Trello webhook for the board pointing at this server, then query
+  GET /calcs for the totals. With --replay, apply recorded webhook payloads from
+  a JSON file to the current board and print the resulting totals instead.
+"""
+
+# Set working directry for module imports
+import argparse
+import json
+import os
+import sys
+os.chdir("/home/pocdart/pocdart_documentation/scrum/tools/")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+# Import local modules
+from sprint_utils import load_config
+from trello.api import TrelloAPI
+from trello.board import Board
+from trello.webhook import LiveBoard, make_server, replay
+
+def main(host="127.0.0.1", port=8080, replay_path=None):
+    """ Serve live story point totals, or print them after replaying recorded payloads
+
+    Args:
+        host (str): Address to listen on
+        port (int): Port to listen on
+        replay_path (str): JSON file holding a list of recorded webhook payloads
+    """
+    # Load configuration
+    board_config = load_config("config.json")['board']
+    # Initialize Trello API; the live board must start from fresh data, so nothing is cached
+    trello_api = TrelloAPI(
+        board_id=board_config['board_id'],
+        api_key=board_config['api_key'],
+        api_token=board_config['api_token']
+    )
+    live_board = LiveBoard(Board.from_snapshot(trello_api), api=trello_api)
+
+    if replay_path is not None:
+        with open(replay_path, encoding="utf-8") as replay_file:
+            print(json.dumps(replay(live_board, json.load(replay_file)), indent=2))
+        return
+
+    # Callbacks are only checked when the application secret is configured
+    server = make_server(
+        live_board,
+        host=host,
+        port=port,
+        secret=board_config.get('webhook_secret'),
+        callback_url=board_config.get('webhook_callback_url')
+    )
+    print(f"Serving live board on http://{host}:{port}/calcs")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="Print totals after applying recorded webhook payloads")
+    args = parser.parse_args()
+    main(host=args.host, port=args.port, replay_path=args.replay)
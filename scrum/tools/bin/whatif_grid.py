@@ -0,0 +1,60 @@
+""" Print the recommended story points for every combination of sprint controls
+  Each control takes a single value, an inclusive range such as 8-12, a range
+  with a step such as 0-10:2, or a comma separated list of those; controls left
+  out use the interactive script's defaults.
+"""
+
+# Set working directry for module imports
+import argparse
+import os
+import sys
+os.chdir("/home/pocdart/pocdart_documentation/scrum/tools/")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+# Import local modules
+from sprint_utils import load_config
+from sprint_whatif import CONTROL_NAMES, evaluate_grid, format_grid, parse_range
+from trello.api import TrelloAPI
+from trello.board import Board
+from trello.cache import ResponseCache
+
+def main(control_ranges, use_cache=True):
+    """ Print the what-if table for the current board
+
+    Args:
+        control_ranges (dict): Values to evaluate, keyed by sprint control name
+        use_cache (bool): Reuse recent Trello responses cached on disk
+    """
+    # Load configuration
+    board_config = load_config("config.json")['board']
+    # Initialize Trello API
+    trello_api = TrelloAPI(
+        board_id=board_config['board_id'],
+        api_key=board_config['api_key'],
+        api_token=board_config['api_token'],
+        cache=ResponseCache() if use_cache else None
+    )
+    # Get board data
+    board = Board.from_snapshot(trello_api)
+    board.extract_cards()
+    grid = evaluate_grid(
+        board.calculate_story_points(),
+        board.get_unplanned_past_sprints(),
+        board.get_retro_past_sprints(),
+        control_ranges
+    )
+    print(format_grid(grid))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    for control_name in CONTROL_NAMES:
+        parser.add_argument(f"--{control_name.replace('_', '-')}", dest=control_name,
+                            type=parse_range, metavar="RANGE")
+    parser.add_argument("--no-cache", action="store_true", help="Always fetch fresh board data")
+    args = parser.parse_args()
+    main(
+        {name: getattr(args, name) for name in CONTROL_NAMES if getattr(args, name) is not None},
+        use_cache=not args.no_cache
+    )
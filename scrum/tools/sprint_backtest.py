@@ -0,0 +1,337 @@
+"""
+sprint_backtest.py
+
+This module replays stored board snapshots through the story point calculation and the sprint
+recommendation, and measures how well each recommendation predicted the planned story points
+the team then completed.
+
+Each sprint_summary row records a finished sprint. The board snapshot saved right after it is
+the board the recommendation was made from, the row holds the controls of the finished sprint
+and the members of the coming one, and the next row holds the length, vacation days and
+completed planned points of the sprint that followed. Snapshots are streamed from the
+database and evaluated in a process pool. The story points of each snapshot are cached on disk
+by content, so later runs only evaluate snapshots saved since. Snapshots archived before the
+cards' custom field data was stored use the story points recorded on their sprint summary row
+and the past sprints on their sprint summary card.
+
+Functions:
+    - pair_snapshots: Pairs each finished sprint with the snapshot saved right after it.
+    - summarize_errors: Computes error statistics of recommendations against actual points.
+    - run_backtest: Backtests the recommendation over every stored sprint of each board.
+
+Example Usage:
+    config = load_config("config.json")
+    report = run_backtest(SprintDBManager(config['mysql']), [config['board']], lists_by_board)
+    print(report["boards"][0]["mae"])
+"""
+
+import bisect
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import timedelta
+from pathlib import Path
+
+from sprint_math import recommend_story_points
+from trello.aggregator import CATEGORIES
+from trello.board import parse_past_sprints
+from trello.fleet import process_board
+from trello.snapshot import content_hash
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / ".cache" / "backtest.json"
+DEFAULT_MAX_LAG = timedelta(days=1)
+
+# Board settings that change the story points calculated from a snapshot
+RESULT_CONFIG_KEYS = ("sp_total_id", "sp_spent_id", "sprint_calc_card", "unplanned_template_card")
+
+
+def pair_snapshots(summaries, snapshots, max_lag=DEFAULT_MAX_LAG):
+    """
+    Pairs each finished sprint with the snapshot saved right after it.
+
+    Only the first snapshot saved within max_lag of a sprint summary is used, and only for
+    sprints followed by another one, since the next sprint holds the actual outcome.
+
+    Args:
+        summaries (list of dict): The board's sprint_summary rows, oldest first.
+        snapshots (iterable of dict): The board's snapshots with 'created_at', oldest first.
+        max_lag (timedelta, optional): Longest time between a summary and its snapshot.
+            Defaults to one day.
+
+    Yields:
+        tuple: The snapshot, its sprint summary and the next sprint summary.
+    """
+    created = [summary['created_at'] for summary in summaries]
+    paired = set()
+    for snapshot in snapshots:
+        index = bisect.bisect_right(created, snapshot['created_at']) - 1
+        if index < 0 or index + 1 >= len(summaries) or index in paired:
+            continue
+        if snapshot['created_at'] - created[index] > max_lag:
+            continue
+        paired.add(index)
+        yield snapshot, summaries[index], summaries[index + 1]
+
+
+def summarize_errors(errors):
+    """
+    Computes error statistics of recommendations against actual points.
+
+    Args:
+        errors (list of float): Recommended minus actual points, one per sprint.
+
+    Returns:
+        dict: The mean absolute error 'mae', mean error 'bias' and root mean square error
+            'rmse', each None if there are no errors.
+    """
+    if not errors:
+        return {"mae": None, "bias": None, "rmse": None}
+    return {
+        "mae": statistics.fmean(abs(error) for error in errors),
+        "bias": statistics.fmean(errors),
+        "rmse": math.sqrt(statistics.fmean(error * error for error in errors))
+    }
+
+
+def _sprint_controls(summary, next_summary):
+    """
+    Builds the sprint controls the recommendation was made with.
+
+    Args:
+        summary (dict): The finished sprint's summary.
+        next_summary (dict): The following sprint's summary.
+
+    Returns:
+        dict: Sprint controls as returned by sprint_math.prompt_for_sprint_controls.
+    """
+    return {
+        'last_sprint_days': summary['length_days'],
+        'next_sprint_days': next_summary['length_days'],
+        'missed_last_sprint': summary['vacation_days'],
+        'missed_next_sprint': next_summary['vacation_days'],
+        'members': summary['members']
+    }
+
+
+def _summary_result(board_config, lists, cards, summary):
+    """
+    Builds the result of a snapshot saved without the cards' custom field data.
+
+    The story points are those recorded on the snapshot's sprint summary row, and the past
+    sprints are read from the sprint summary card, as Board.extract_cards does.
+
+    Args:
+        board_config (dict): The board configuration.
+        lists (list of dict): The board's lists.
+        cards (list of dict): The snapshot's cards.
+        summary (dict): The sprint summary row the snapshot was saved with.
+
+    Returns:
+        dict: The snapshot's result, as returned by trello.fleet.process_board.
+    """
+    list_names = {list_obj['id']: list_obj['name'] for list_obj in lists}
+    unplanned_past_sprints, retro_past_sprints = [], []
+    for card in cards:
+        if (card.get('id') == board_config['sprint_calc_card']
+                and "Monitoring" not in list_names.get(card.get('idList'), '')):
+            unplanned_past_sprints, retro_past_sprints = parse_past_sprints(card.get('desc', ''))
+    calcs = {
+        category: {
+            "total": summary.get(f"{category}_total"),
+            "spent": summary[f"{category}_completed"],
+            "remaining": summary.get(f"{category}_remaining")
+        }
+        for category in CATEGORIES
+    }
+    return {
+        "cards": len(cards),
+        "calcs": calcs,
+        "unplanned_past_sprints": unplanned_past_sprints,
+        "retro_past_sprints": retro_past_sprints
+    }
+
+
+def _cache_key(board_config, lists, cards):
+    """
+    Identifies the story points of a snapshot by everything they are calculated from.
+
+    Returns:
+        str: The cache key.
+    """
+    key_data = {
+        "cards": content_hash(cards),
+        "lists": content_hash(lists),
+        "config": {key: board_config.get(key) for key in RESULT_CONFIG_KEYS}
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _load_cache(cache_path):
+    """
+    Reads cached snapshot results.
+
+    Returns:
+        dict: Results keyed by cache key; empty if the cache is disabled, missing or unreadable.
+    """
+    if cache_path is None:
+        return {}
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_path, entries):
+    """ Writes the snapshot results atomically """
+    if cache_path is None:
+        return
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump(entries, tmp_file)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _score_sprint(snapshot_id, summary, next_summary, result):
+    """
+    Compares the recommendation made from one snapshot with the next sprint's outcome.
+
+    Returns:
+        dict: The sprint's 'recommendation', 'actual' completed planned points and 'error',
+            or the 'error_message' if no recommendation could be made.
+    """
+    row = {"snapshot_id": snapshot_id, "start_date": str(next_summary['start_date'])}
+    if "error_message" in result:
+        row["error_message"] = result["error_message"]
+        return row
+    try:
+        recommendation = recommend_story_points(
+            result['calcs'],
+            result['unplanned_past_sprints'],
+            result['retro_past_sprints'],
+            _sprint_controls(summary, next_summary)
+        )
+    except (statistics.StatisticsError, ZeroDivisionError) as e:
+        # Boards without sprint history or with zero-length controls cannot be scored
+        row["error_message"] = f"{type(e).__name__}: {e}"
+        return row
+    actual = next_summary['planned_completed']
+    row.update({"recommendation": recommendation, "actual": actual,
+                "error": recommendation - actual})
+    return row
+
+
+def run_backtest(
+        sprint_db_manager,
+        board_configs,
+        lists_by_board,
+        processes=None,
+        cache_path=DEFAULT_CACHE_PATH,
+        max_lag=DEFAULT_MAX_LAG,
+        clock=time.perf_counter):
+    """
+    Backtests the recommendation over every stored sprint of each board.
+
+    Args:
+        sprint_db_manager (SprintDBManager): The database manager instance.
+        board_configs (list of dict): The board configurations, e.g. from get_fleet_configs().
+        lists_by_board (dict): The lists of each board keyed by board ID; snapshots only store
+            cards, so list names are taken from these.
+        processes (int, optional): Worker processes evaluating snapshots.
+            Defaults to the number of CPUs.
+        cache_path (str or Path, optional): JSON file caching the story points of each
+            snapshot, or None to disable caching. Defaults to `.cache/backtest.json` under
+            the tools directory.
+        max_lag (timedelta, optional): Longest time between a sprint summary and the snapshot
+            it is paired with. Defaults to one day.
+        clock (callable, optional): Returns the current time in seconds.
+            Defaults to time.perf_counter.
+
+    Returns:
+        dict: Per-board 'mae', 'bias', 'rmse' and sprint 'results' under 'boards', with the
+            number of 'snapshots' evaluated, 'cache_hits' and 'elapsed_seconds'.
+    """
+    started = clock()
+    cache = _load_cache(cache_path)
+    processes = processes or os.cpu_count() or 1
+    # Keep a bounded number of snapshots in flight so the archive is never all in memory
+    max_in_flight = processes * 4
+    rows = {board_config['board_id']: [] for board_config in board_configs}
+    results = {}
+    in_flight = {}
+    cache_hits = 0
+
+    def collect(futures):
+        for future in futures:
+            key = in_flight.pop(future)
+            try:
+                results[key] = cache[key] = future.result()
+            except Exception as e:
+                # One unreadable snapshot must not stop the rest of the archive
+                results[key] = {"error_message": f"{type(e).__name__}: {e}"}
+
+    with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn")) as pool:
+        for board_config in board_configs:
+            board_id = board_config['board_id']
+            lists = lists_by_board[board_id]
+            summaries = sprint_db_manager.get_sprint_summary_from_db(board_id)
+            snapshots = sprint_db_manager.iter_board_data_from_db(board_id=board_id)
+            for snapshot, summary, next_summary in pair_snapshots(summaries, snapshots, max_lag):
+                cards = snapshot['json_data']
+                if not all('customFieldItems' in card for card in cards):
+                    # Snapshots saved before story points were stored with the cards
+                    results[snapshot['id']] = _summary_result(board_config, lists, cards, summary)
+                    rows[board_id].append((snapshot['id'], summary, next_summary, snapshot['id']))
+                    continue
+                key = _cache_key(board_config, lists, cards)
+                rows[board_id].append((snapshot['id'], summary, next_summary, key))
+                if key in cache:
+                    results[key] = cache[key]
+                    cache_hits += 1
+                    continue
+                if key in results or key in in_flight.values():
+                    continue
+                if len(in_flight) >= max_in_flight:
+                    collect(wait(in_flight, return_when=FIRST_COMPLETED).done)
+                future = pool.submit(
+                    process_board, board_config, {"cards": cards, "lists": lists})
+                in_flight[future] = key
+        collect(list(in_flight))
+    _save_cache(cache_path, cache)
+
+    boards = []
+    for board_config in board_configs:
+        board_id = board_config['board_id']
+        sprints = [
+            _score_sprint(snapshot_id, summary, next_summary, results[key])
+            for snapshot_id, summary, next_summary, key in rows[board_id]
+        ]
+        errors = [sprint["error"] for sprint in sprints if "error" in sprint]
+        boards.append({
+            "board_id": board_id,
+            "name": board_config.get('name', board_id),
+            "sprints": len(errors),
+            **summarize_errors(errors),
+            "results": sprints
+        })
+    return {
+        "boards": boards,
+        "snapshots": sum(len(board_rows) for board_rows in rows.values()),
+        "cache_hits": cache_hits,
+        "elapsed_seconds": clock() - started
+    }
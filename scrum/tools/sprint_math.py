@@ -15,6 +15,8 @@ Functions:
     - prompt_for_board_insert: Determines whether to insert board data into the database.
     - get_board_data: Retrieve board data either from the database or from the live Trello board.
     - compute_recommendation: Compute the recommended number of story points for the next sprint.
+    - recommend_story_points: Apply the recommendation formula to past sprint story points.
+    - compute_forecast: Forecast story point commitments for the next sprint by confidence.
     - insert_sprint_summary: Insert the sprint summary data into the database.
 
 Example:
@@ -24,14 +26,24 @@ Example:
 
 import statistics
 import math
-import json
 from datetime import date
 
 from trello.db import SprintDBManager
-from trello.api import TrelloAPI
+from trello.async_api import SyncTrelloAPI
 from trello.board import Board
+from trello.sync import BoardSync
+from sprint_forecast import forecast_story_points, get_completed_history
 from sprint_utils import load_config
 
+# Sprint control values used when the user enters none
+SPRINT_CONTROL_DEFAULTS = {
+    "last_sprint_days": 10,
+    "next_sprint_days": 10,
+    "missed_last_sprint": 0,
+    "missed_next_sprint": 0,
+    "members": 8
+}
+
 def validate_user_input(user_input):
     """Validates the user input to ensure it is a valid integer.
 
@@ -63,13 +75,12 @@ def prompt_for_sprint_controls():
         "missed_next_sprint": "total days planned missed next Sprint",
         "members": "members working this coming Sprint"
     }
-    defaults = [10, 10, 0, 0, 8]
 
     sprint_controls = {}
 
     # Loop through the variables and prompt the user for each value
-    for i, (var_name, description) in enumerate(variables.items()):
-        default = defaults[i]
+    for var_name, description in variables.items():
+        default = SPRINT_CONTROL_DEFAULTS[var_name]
         user_input = input(
             f"Enter number of {description} (default: {default}): ")
         if user_input == "":
@@ -139,13 +150,14 @@ def prompt_for_manual_corrections(story_points):
     return story_points
 
 
-def show_sp_calculations(story_points, recommendation=None):
+def show_sp_calculations(story_points, recommendation=None, forecast=None):
     """
     Displays the calculated story points in a formatted manner.
 
     Args:
         story_points (dict): The calculated story points.
         recommendation (int, optional): The recommended story points for the next sprint.
+        forecast (dict, optional): The forecast commitments for the next sprint.
     """
     results = (
         f"SP Planned  : {str(story_points['planned']['total']).rjust(2)}(T), "
@@ -163,6 +175,12 @@ def show_sp_calculations(story_points, recommendation=None):
             "======================\n"
             f"SP: Target for next sprint: {str(recommendation)}\n"
         )
+    if forecast is not None:
+        commitments = forecast['commitments']
+        results += (
+            f"SP: Commitment at {'/'.join(f'P{level}' for level in commitments)}: "
+            f"{'/'.join(str(points) for points in commitments.values())}\n"
+        )
     print(results)
 
 
@@ -195,7 +213,7 @@ def main():
 
     # Initialize database manager and Trello API
     sprint_db_manager = SprintDBManager(mysql_config)
-    trello_api = TrelloAPI(
+    trello_api = SyncTrelloAPI(
         board_id=board_config['board_id'],
         api_key=board_config['api_key'],
         api_token=board_config['api_token']
@@ -205,11 +223,21 @@ def main():
     sprint_controls = prompt_for_sprint_controls()
     board_source = prompt_for_board_source()
 
+    # Boards loaded from the database still need the live lists and custom fields, so
+    # request those concurrently rather than one after another
+    if board_source == 0:
+        trello_api.prefetch(include_cards=False, list_fields=Board.LIST_FIELDS)
+
     # Get board data
-    board_data = get_board_data(sprint_db_manager, trello_api, board_source)
+    board_snapshot = get_board_data(
+        sprint_db_manager,
+        trello_api,
+        board_source,
+        incremental_sync=board_config.get('incremental_sync', False)
+    )
 
     # Process board data
-    board = Board(trello_api, board_data)
+    board = Board.from_snapshot(trello_api, board_snapshot)
     board.extract_cards()
     story_points = board.calculate_story_points()
 
@@ -221,6 +249,14 @@ def main():
     recommendation = compute_recommendation(
         board, story_points, sprint_controls)
 
+    # Forecast commitments from the recent sprints
+    forecast = compute_forecast(
+        board,
+        story_points,
+        sprint_controls,
+        sprint_db_manager.get_sprint_summary_from_db(board_config['board_id'])
+    )
+
     # Insert sprint summary data into the database
     insert_sprint_summary(
         sprint_db_manager,
@@ -230,29 +266,30 @@ def main():
 
     # Print final results
     print("\nFINAL RESULTS:")
-    show_sp_calculations(story_points, recommendation)
+    show_sp_calculations(story_points, recommendation, forecast)
 
     # Optionally save board data to database
     if prompt_for_board_insert() == 0:
-        board_data = {
-            'board_id': board_config['board_id'],
-            'board_name': 'SPRINT-Now Board',
-            'json_data': json.dumps(board.get_data())
-        }
-        sprint_db_manager.insert_data('boards', board_data)
+        sprint_db_manager.store_board_snapshot(
+            board_config['board_id'], 'SPRINT-Now Board', board.get_data())
 
 
-def get_board_data(sprint_db_manager, trello_api, board_source):
+def get_board_data(sprint_db_manager, trello_api, board_source, incremental_sync=False):
     """
     Retrieve board data either from the database or from the live Trello board.
 
+    Live boards are fetched as a single snapshot holding the cards, lists and custom fields.
+
     Args:
         sprint_db_manager (SprintDBManager): The database manager instance.
-        trello_api (TrelloAPI): The Trello API instance.
+        trello_api (SyncTrelloAPI): The Trello API instance.
         board_source (int): Indicator of the source of the board data (0 for DB, else live board).
+        incremental_sync (bool, optional): Bring a locally stored copy of the live board up to
+            date from the board's recent actions instead of downloading it. Defaults to False.
 
     Returns:
-        dict: The board data in JSON format.
+        dict: A board snapshot for Board.from_snapshot; boards loaded from the database
+            only hold their 'cards'.
     """
     board_data = None
     if board_source == 0:
@@ -275,14 +312,23 @@ def get_board_data(sprint_db_manager, trello_api, board_source):
                 input("Please enter the ID of the old board you'd like to load: "))
             try:
                 # Attempt to retrieve board data from the database
-                board_data = sprint_db_manager.get_board_data_from_db(
-                    assigned_board_id=user_board_id
-                )
+                board_data = {
+                    'cards': sprint_db_manager.get_board_data_from_db(
+                        assigned_board_id=user_board_id
+                    )
+                }
             except Exception as e:
                 print(f"Error: {e}\nPulling data from live board...")
+    if board_data is None and incremental_sync:
+        # Replay the live board's actions since the last run onto the stored copy
+        board_data = BoardSync(trello_api).sync()
     if board_data is None:
         # Fetch board data from the live Trello board
-        board_data = trello_api.get_board_cards()
+        board_data = trello_api.get_board_snapshot(
+            card_fields=Board.CARD_FIELDS,
+            list_fields=Board.LIST_FIELDS,
+            member_fields=Board.MEMBER_FIELDS
+        )
     return board_data
 
 
@@ -295,13 +341,35 @@ def compute_recommendation(board, story_points, sprint_controls):
         story_points (dict): Dictionary containing calculated story points.
         sprint_controls (dict): Dictionary containing sprint control data.
 
+    Returns:
+        int: The recommended number of story points.
+    """
+    return recommend_story_points(
+        story_points,
+        board.get_unplanned_past_sprints(),
+        board.get_retro_past_sprints(),
+        sprint_controls
+    )
+
+
+def recommend_story_points(story_points, unplanned_past_sprints, retro_past_sprints,
+                           sprint_controls):
+    """
+    Apply the recommendation formula to past sprint story points.
+
+    Args:
+        story_points (dict): Dictionary containing calculated story points.
+        unplanned_past_sprints (list of int): Unplanned story points of past sprints, oldest first.
+        retro_past_sprints (list of int): Retro story points of past sprints, oldest first.
+        sprint_controls (dict): Dictionary containing sprint control data.
+
     Returns:
         int: The recommended number of story points.
     """
     # Calculate average unplanned and retro leftover points from the past six
     # sprints
-    avg_unplanned = statistics.median(board.get_unplanned_past_sprints()[-6:])
-    avg_retro_leftover = statistics.median(board.get_retro_past_sprints()[-6:])
+    avg_unplanned = statistics.median(unplanned_past_sprints[-6:])
+    avg_retro_leftover = statistics.median(retro_past_sprints[-6:])
 
     # Adjustments based on sprint length and team availability
     length_adjustment = sprint_controls['last_sprint_days'] / \
@@ -326,6 +394,34 @@ def compute_recommendation(board, story_points, sprint_controls):
     return recommendation
 
 
+def compute_forecast(board, story_points, sprint_controls, sprint_summaries):
+    """
+    Forecast story point commitments for the next sprint by confidence.
+
+    Args:
+        board (Board): The Board instance containing card data.
+        story_points (dict): Dictionary containing calculated story points.
+        sprint_controls (dict): Dictionary containing sprint control data.
+        sprint_summaries (list of dict): The board's past sprint_summary rows, oldest first.
+
+    Returns:
+        dict: The commitments keyed by confidence level and their mean, as returned by
+            sprint_forecast.forecast_story_points.
+    """
+    # The sprint just finished is not in the database yet
+    completed_history = get_completed_history(sprint_summaries) + [
+        story_points['planned']['spent']
+        + story_points['unplanned']['spent']
+        + story_points['retro']['spent']
+    ]
+    return forecast_story_points(
+        completed_history,
+        board.get_unplanned_past_sprints(),
+        board.get_retro_past_sprints(),
+        sprint_controls
+    )
+
+
 def insert_sprint_summary(sprint_db_manager, board_id,
                           sprint_controls, story_points):
     """
@@ -336,6 +432,9 @@ def insert_sprint_summary(sprint_db_manager, board_id,
         board_id (str): The ID of the Trello board.
         sprint_controls (dict): Dictionary containing sprint control data.
         story_points (dict): Dictionary containing calculated story points.
+
+    Returns:
+        int: The ID of the inserted sprint summary.
     """
     # Prepare sprint summary data
     sprint_summary_data = {
@@ -355,7 +454,7 @@ def insert_sprint_summary(sprint_db_manager, board_id,
         'retro_remaining': story_points['retro']['remaining'],
     }
     # Insert data into the 'sprint_summary' table
-    sprint_db_manager.insert_data('sprint_summary', sprint_summary_data)
+    return sprint_db_manager.insert_data('sprint_summary', sprint_summary_data)
 
 
 if __name__ == "__main__":
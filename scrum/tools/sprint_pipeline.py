@@ -0,0 +1,368 @@
+"""
+sprint_pipeline.py
+
+This module runs the sprint_math workflow without prompts, so it can be scheduled and run for
+every board in one job.
+
+The values sprint_math.main asks for are read from a JSON job file or command line arguments
+instead. Each board goes through the fetch, extract, calculate, recommend and persist stages,
+each a function of a shared context, so stages can be reused, replaced or run on their own.
+Every stage is timed, and the results of all boards are printed as one JSON document.
+
+A job file may hold:
+    - sprint_controls: Sprint control values; missing ones take the interactive defaults.
+    - corrections: Story point overrides, e.g. {"planned": {"spent": 21}}.
+    - board_source: "live" (default), "sync" for an incremental sync, or "db".
+    - db_board_id: ID of the stored board to load when board_source is "db".
+    - forecast: Whether to forecast commitments (default true).
+    - store_summary: Whether to insert the sprint summary (default true).
+    - store_snapshot: Whether to store the board snapshot (default false).
+    - boards: Per-board overrides of any of the above, keyed by board ID. Sprint controls
+      and corrections are merged value by value with the job's.
+
+Functions:
+    - get_board_job: Builds the job settings of one board.
+    - fetch_stage: Loads the board snapshot.
+    - extract_stage: Builds the board and extracts its cards.
+    - calculate_stage: Calculates the story points and applies the corrections.
+    - recommend_stage: Computes the recommendation and the forecast.
+    - persist_stage: Stores the sprint summary and, optionally, the board snapshot.
+    - run_pipeline: Runs the stages for one board and returns its results.
+    - run_jobs: Runs the pipeline for several boards concurrently.
+    - main: Command line entry point.
+
+Example:
+    python sprint_pipeline.py --job job.json --fleet --output results.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sprint_math import (SPRINT_CONTROL_DEFAULTS, compute_forecast, compute_recommendation,
+                         insert_sprint_summary)
+from sprint_utils import load_config
+from trello.async_api import SyncTrelloAPI
+from trello.board import Board
+from trello.db import SprintDBManager
+from trello.fleet import get_fleet_configs
+from trello.sync import BoardSync
+
+BOARD_SOURCES = ("live", "sync", "db")
+
+
+def fetch_stage(context):
+    """
+    Loads the board snapshot from the live board, an incremental sync or the database.
+
+    Args:
+        context (dict): The pipeline context; sets 'snapshot'.
+
+    Raises:
+        ValueError: If the board source is unknown or a database board has no ID.
+    """
+    job = context['job']
+    source = job.get('board_source', 'live')
+    if source not in BOARD_SOURCES:
+        raise ValueError(f"Unknown board source: {source}")
+    trello_api = context['trello_api']
+    if source == 'db':
+        if job.get('db_board_id') is None:
+            raise ValueError("A db_board_id is required to load a board from the database")
+        # Stored boards only hold their cards, so the lists come from the live board
+        trello_api.prefetch(include_cards=False, list_fields=Board.LIST_FIELDS)
+        context['snapshot'] = {
+            'cards': context['sprint_db_manager'].get_board_data_from_db(
+                assigned_board_id=job['db_board_id'])
+        }
+    elif source == 'sync':
+        context['snapshot'] = BoardSync(trello_api).sync()
+    else:
+        context['snapshot'] = trello_api.get_board_snapshot(
+            card_fields=Board.CARD_FIELDS,
+            list_fields=Board.LIST_FIELDS,
+            member_fields=Board.MEMBER_FIELDS
+        )
+
+
+def extract_stage(context):
+    """
+    Builds the board from the snapshot and extracts its cards.
+
+    Args:
+        context (dict): The pipeline context; sets 'board'.
+    """
+    board = Board.from_snapshot(
+        context['trello_api'], context['snapshot'], board_config=context['board_config'])
+    board.extract_cards()
+    context['board'] = board
+
+
+def calculate_stage(context):
+    """
+    Calculates the story points and applies the job's corrections.
+
+    Args:
+        context (dict): The pipeline context; sets 'story_points'.
+
+    Raises:
+        ValueError: If a correction names an unknown story point.
+    """
+    story_points = context['board'].calculate_story_points()
+    for category, values in context['job'].get('corrections', {}).items():
+        for key, value in values.items():
+            if key not in story_points.get(category, {}):
+                raise ValueError(f"Unknown story point correction: {category}.{key}")
+            story_points[category][key] = int(value)
+    context['story_points'] = story_points
+
+
+def recommend_stage(context):
+    """
+    Computes the recommendation and, with a database, the forecast commitments.
+
+    Args:
+        context (dict): The pipeline context; sets 'sprint_controls', 'recommendation'
+            and 'forecast'.
+    """
+    sprint_controls = {**SPRINT_CONTROL_DEFAULTS, **context['job'].get('sprint_controls', {})}
+    board = context['board']
+    story_points = context['story_points']
+    context['sprint_controls'] = sprint_controls
+    context['recommendation'] = compute_recommendation(board, story_points, sprint_controls)
+    context['forecast'] = None
+    sprint_db_manager = context['sprint_db_manager']
+    if context['job'].get('forecast', True) and sprint_db_manager is not None:
+        context['forecast'] = compute_forecast(
+            board,
+            story_points,
+            sprint_controls,
+            sprint_db_manager.get_sprint_summary_from_db(context['board_config']['board_id'])
+        )
+
+
+def persist_stage(context):
+    """
+    Stores the sprint summary and, if requested, the board snapshot.
+
+    Args:
+        context (dict): The pipeline context; sets 'summary_id' and 'snapshot_id'.
+    """
+    job = context['job']
+    sprint_db_manager = context['sprint_db_manager']
+    board_id = context['board_config']['board_id']
+    context['summary_id'] = None
+    context['snapshot_id'] = None
+    if sprint_db_manager is None:
+        return
+    if job.get('store_summary', True):
+        context['summary_id'] = insert_sprint_summary(
+            sprint_db_manager, board_id, context['sprint_controls'], context['story_points'])
+    if job.get('store_snapshot', False):
+        context['snapshot_id'] = sprint_db_manager.store_board_snapshot(
+            board_id,
+            context['board_config'].get('name', 'SPRINT-Now Board'),
+            context['board'].get_data()
+        )
+
+
+STAGES = (
+    ("fetch", fetch_stage),
+    ("extract", extract_stage),
+    ("calculate", calculate_stage),
+    ("recommend", recommend_stage),
+    ("persist", persist_stage)
+)
+
+# Context entries reported in the results
+RESULT_KEYS = (
+    "sprint_controls", "story_points", "recommendation", "forecast", "summary_id", "snapshot_id"
+)
+
+
+def get_board_job(job, board_id, sprint_controls=None):
+    """
+    Builds the job settings of one board.
+
+    The board's overrides under 'boards' are merged into the job; 'sprint_controls' and each
+    category of 'corrections' are merged value by value, so an override keeps the values it
+    does not name. The given sprint controls are applied last.
+
+    Args:
+        job (dict): The job settings.
+        board_id (str): The Trello board ID.
+        sprint_controls (dict, optional): Sprint controls taking precedence over the job's,
+            e.g. from the command line. Defaults to None.
+
+    Returns:
+        dict: The board's job settings.
+    """
+    overrides = job.get('boards', {}).get(board_id, {})
+    board_job = {**job, **overrides}
+    board_job['sprint_controls'] = {
+        **job.get('sprint_controls', {}),
+        **overrides.get('sprint_controls', {}),
+        **(sprint_controls or {})
+    }
+    corrections = {
+        category: dict(values) for category, values in job.get('corrections', {}).items()
+    }
+    for category, values in overrides.get('corrections', {}).items():
+        corrections[category] = {**corrections.get(category, {}), **values}
+    board_job['corrections'] = corrections
+    return board_job
+
+
+def run_pipeline(board_config, job, sprint_db_manager=None, trello_api=None, stages=STAGES,
+                 sprint_controls=None, clock=time.perf_counter):
+    """
+    Runs the stages for one board and returns its results.
+
+    Args:
+        board_config (dict): The board configuration.
+        job (dict): The job settings; overrides under 'boards' for this board are applied.
+        sprint_db_manager (SprintDBManager, optional): The database manager. Without one,
+            nothing is forecast or stored. Defaults to None.
+        trello_api (SyncTrelloAPI, optional): The Trello API. Defaults to one created, and
+            closed afterwards, from the board configuration.
+        stages (tuple, optional): The (name, function) stages to run in order.
+            Defaults to STAGES.
+        sprint_controls (dict, optional): Sprint controls taking precedence over the job's,
+            including the board's overrides. Defaults to None.
+        clock (callable, optional): Returns the current time in seconds.
+            Defaults to time.perf_counter.
+
+    Returns:
+        dict: The board's results and the seconds each stage took under 'timings'. If a stage
+            fails, 'error' holds the stage and message, and later stages are not run.
+    """
+    board_id = board_config['board_id']
+    job = get_board_job(job, board_id, sprint_controls)
+    owns_api = trello_api is None
+    if owns_api:
+        trello_api = SyncTrelloAPI(
+            board_id=board_id,
+            api_key=board_config['api_key'],
+            api_token=board_config['api_token']
+        )
+    context = {
+        "board_config": board_config,
+        "job": job,
+        "sprint_db_manager": sprint_db_manager,
+        "trello_api": trello_api
+    }
+    result = {"board_id": board_id, "name": board_config.get('name', board_id), "timings": {}}
+    try:
+        for name, stage in stages:
+            started = clock()
+            try:
+                stage(context)
+            except Exception as e:
+                result["error"] = {"stage": name, "message": f"{type(e).__name__}: {e}"}
+                break
+            finally:
+                result["timings"][name] = clock() - started
+    finally:
+        if owns_api:
+            trello_api.close()
+    result.update({key: context[key] for key in RESULT_KEYS if key in context})
+    return result
+
+
+def run_jobs(board_configs, job, sprint_db_manager=None, workers=4, sprint_controls=None,
+             clock=time.perf_counter):
+    """
+    Runs the pipeline for several boards concurrently.
+
+    Args:
+        board_configs (list of dict): The board configurations.
+        job (dict): The job settings.
+        sprint_db_manager (SprintDBManager, optional): The database manager. Defaults to None.
+        workers (int, optional): Boards run at once. Defaults to 4.
+        sprint_controls (dict, optional): Sprint controls taking precedence over the job's.
+            Defaults to None.
+        clock (callable, optional): Returns the current time in seconds.
+            Defaults to time.perf_counter.
+
+    Returns:
+        dict: The results of each board under 'boards', the 'failed' count and
+            'elapsed_seconds'.
+    """
+    started = clock()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        boards = list(executor.map(
+            lambda board_config: run_pipeline(
+                board_config, job, sprint_db_manager=sprint_db_manager,
+                sprint_controls=sprint_controls, clock=clock),
+            board_configs
+        ))
+    return {
+        "boards": boards,
+        "failed": sum(1 for board in boards if "error" in board),
+        "elapsed_seconds": clock() - started
+    }
+
+
+def main(argv=None):
+    """ Run the pipeline headless and print the results as JSON
+
+    Args:
+        argv (list of str, optional): Command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: 0 if every board succeeded, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Run sprint_math without prompts.")
+    parser.add_argument("--job", metavar="FILE", help="JSON job file")
+    parser.add_argument("--config", default="config.json", help="Configuration file")
+    parser.add_argument("--fleet", action="store_true",
+                        help="Run every board in the configuration's fleet list")
+    parser.add_argument("--source", choices=BOARD_SOURCES, help="Where to load the board from")
+    parser.add_argument("--db-board-id", type=int, help="Stored board to load with --source db")
+    parser.add_argument("--store-snapshot", action="store_true",
+                        help="Store the board snapshot in the database")
+    parser.add_argument("--no-summary", action="store_true",
+                        help="Do not insert the sprint summary")
+    parser.add_argument("--workers", type=int, default=4, help="Boards run at once")
+    parser.add_argument("--output", metavar="FILE", help="Write the results to FILE")
+    for control_name in SPRINT_CONTROL_DEFAULTS:
+        parser.add_argument(f"--{control_name.replace('_', '-')}", dest=control_name, type=int)
+    args = parser.parse_args(argv)
+
+    # Command line arguments take precedence over the job file
+    job = {}
+    if args.job:
+        with open(args.job, encoding="utf-8") as job_file:
+            job = json.load(job_file)
+    controls = {
+        name: getattr(args, name) for name in SPRINT_CONTROL_DEFAULTS
+        if getattr(args, name) is not None
+    }
+    if args.source:
+        job['board_source'] = args.source
+    if args.db_board_id is not None:
+        job['db_board_id'] = args.db_board_id
+    if args.store_snapshot:
+        job['store_snapshot'] = True
+    if args.no_summary:
+        job['store_summary'] = False
+
+    config = load_config(args.config)
+    board_configs = get_fleet_configs(config) if args.fleet else [config['board']]
+    results = run_jobs(
+        board_configs, job, sprint_db_manager=SprintDBManager(config['mysql']),
+        workers=args.workers, sprint_controls=controls)
+
+    output = json.dumps(results, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output)
+    else:
+        print(output)
+    return 1 if results['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
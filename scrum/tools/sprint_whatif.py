@@ -0,0 +1,157 @@
+"""
+sprint_whatif.py
+
+This module evaluates the sprint recommendation for every combination of sprint control
+values, so planners can compare staffing scenarios without rerunning the interactive script.
+
+Each control takes a range of values. The recommendation formula is applied to the whole
+Cartesian grid of them at once with NumPy broadcasting, so grids of thousands of scenarios are
+evaluated instantly, and the results are printed as a compact table.
+
+Functions:
+    - parse_range: Parses a control range such as "8-12", "8-12:2" or "6,8,10".
+    - evaluate_grid: Evaluates the recommendation for every combination of control values.
+    - format_grid: Formats an evaluated grid as a compact text table.
+
+Example Usage:
+    grid = evaluate_grid(story_points, unplanned_past_sprints, retro_past_sprints,
+                         {"members": parse_range("5-8"), "missed_next_sprint": parse_range("0-10")})
+    print(format_grid(grid))
+"""
+
+import statistics
+
+import numpy as np
+
+from sprint_math import SPRINT_CONTROL_DEFAULTS
+
+# Controls in grid axis order
+CONTROL_NAMES = tuple(SPRINT_CONTROL_DEFAULTS)
+
+# Controls that divide the recommendation, so must be positive
+POSITIVE_CONTROLS = ("last_sprint_days", "next_sprint_days", "members")
+
+
+def parse_range(text):
+    """
+    Parses a control range.
+
+    Args:
+        text (str): A single value ("8"), an inclusive range ("8-12"), a range with a step
+            ("8-12:2") or a comma separated list of any of those ("6,8-10").
+
+    Returns:
+        list of int: The values in order, without duplicates.
+
+    Raises:
+        ValueError: If the text is not a valid range.
+    """
+    values = []
+    for part in text.split(","):
+        part = part.strip()
+        bounds, _, step = part.partition(":")
+        start, separator, stop = bounds.partition("-")
+        start = int(start)
+        stop = int(stop) if separator else start
+        step = int(step) if step else 1
+        if step <= 0 or stop < start:
+            raise ValueError(f"Invalid range: {part}")
+        values.extend(range(start, stop + 1, step))
+    return list(dict.fromkeys(values))
+
+
+def evaluate_grid(story_points, unplanned_past_sprints, retro_past_sprints, control_ranges,
+                  base_controls=None):
+    """
+    Evaluates the recommendation for every combination of control values.
+
+    Gives the same values as sprint_math.recommend_story_points for each combination.
+
+    Args:
+        story_points (dict): Dictionary containing calculated story points.
+        unplanned_past_sprints (list of int): Unplanned story points of past sprints, oldest first.
+        retro_past_sprints (list of int): Retro story points of past sprints, oldest first.
+        control_ranges (dict): Values to evaluate, keyed by control name.
+        base_controls (dict, optional): Values of the controls not given a range.
+            Defaults to SPRINT_CONTROL_DEFAULTS.
+
+    Returns:
+        dict: The values of each control under 'axes', in CONTROL_NAMES order, and the
+            'recommendations' array with one axis per control.
+
+    Raises:
+        ValueError: If a control is unknown, has no values or a dividing control is not
+            positive.
+    """
+    unknown = set(control_ranges) - set(CONTROL_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown sprint controls: {', '.join(sorted(unknown))}")
+    controls = {**SPRINT_CONTROL_DEFAULTS, **(base_controls or {})}
+    axes = {}
+    for name in CONTROL_NAMES:
+        values = np.asarray(control_ranges.get(name, [controls[name]]), dtype=np.float64)
+        if values.size == 0:
+            raise ValueError(f"No values for {name}")
+        if name in POSITIVE_CONTROLS and (values <= 0).any():
+            raise ValueError(f"{name} must be positive")
+        axes[name] = values
+
+    # Only the controls vary across the grid; the rest of the formula is a single number
+    base = (
+        story_points['planned']['spent']
+        + story_points['unplanned']['spent']
+        + story_points['retro']['spent']
+        - statistics.median(unplanned_past_sprints[-6:])
+        - statistics.median(retro_past_sprints[-6:])
+    )
+    grid = dict(zip(CONTROL_NAMES, np.ix_(*(axes[name] for name in CONTROL_NAMES))))
+    length_adjustment = grid['last_sprint_days'] / grid['next_sprint_days']
+    pto_adjustment = (grid['missed_next_sprint'] - grid['missed_last_sprint']) / grid['members']
+    recommendations = np.ceil(base / length_adjustment - pto_adjustment).astype(np.int64)
+    return {
+        "axes": {name: values.astype(np.int64) for name, values in axes.items()},
+        "recommendations": recommendations
+    }
+
+
+def format_grid(grid):
+    """
+    Formats an evaluated grid as a compact text table.
+
+    Controls with a single value are listed once above the table. The last varying control
+    becomes the columns and every combination of the other varying controls is a row.
+
+    Args:
+        grid (dict): Result of evaluate_grid().
+
+    Returns:
+        str: The table.
+    """
+    axes = grid['axes']
+    varying = [name for name in CONTROL_NAMES if len(axes[name]) > 1]
+    fixed = [f"{name}={axes[name][0]}" for name in CONTROL_NAMES if len(axes[name]) == 1]
+    lines = [f"Fixed: {', '.join(fixed)}"] if fixed else []
+
+    # Drop the single value axes, leaving the varying controls in order
+    recommendations = grid['recommendations'].reshape(
+        [len(axes[name]) for name in varying] or [1])
+    if not varying:
+        lines.append(f"Recommendation: {recommendations[0]}")
+        return "\n".join(lines)
+
+    column_name, row_names = varying[-1], varying[:-1]
+    width = max(len(str(value)) for value in recommendations.flat)
+    widths = [max(len(name), width) for name in row_names]
+    cell = max(width, max(len(str(value)) for value in axes[column_name]))
+    header = [name.rjust(row_width) for name, row_width in zip(row_names, widths)]
+    lines.append(" ".join(header + [f"{column_name}:"]
+                          + [str(value).rjust(cell) for value in axes[column_name]]))
+    label_width = len(column_name) + 1
+    for index in np.ndindex(*recommendations.shape[:-1]):
+        labels = [
+            str(axes[name][position]).rjust(row_width)
+            for name, position, row_width in zip(row_names, index, widths)
+        ]
+        values = [str(value).rjust(cell) for value in recommendations[index]]
+        lines.append(" ".join(labels + [" " * label_width] + values))
+    return "\n".join(lines)
@@ -0,0 +1,24 @@
+-- Compressed, content-addressed board snapshots referenced from `boards`.
+-- Safe to run again: existing tables and columns are left as they are.
+
+CREATE TABLE IF NOT EXISTS board_snapshots (
+    content_hash CHAR(64) NOT NULL PRIMARY KEY,
+    codec VARCHAR(16) NOT NULL,
+    payload LONGBLOB NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Links each saved board to its snapshot; older rows keep NULL and their inline json_data.
+-- MySQL has no ADD COLUMN IF NOT EXISTS, so the column is only added when missing.
+SET @has_snapshot_hash = (
+    SELECT COUNT(*) FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'boards' AND COLUMN_NAME = 'snapshot_hash'
+);
+SET @add_snapshot_hash = IF(
+    @has_snapshot_hash = 0,
+    'ALTER TABLE boards ADD COLUMN snapshot_hash CHAR(64) NULL',
+    'DO 0'
+);
+PREPARE add_snapshot_hash FROM @add_snapshot_hash;
+EXECUTE add_snapshot_hash;
+DEALLOCATE PREPARE add_snapshot_hash;
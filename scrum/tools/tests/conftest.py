@@ -0,0 +1,127 @@
+"""
+conftest.py
+
+This module holds the helpers shared by the offline tests: a builder for cards as Trello
+returns them in a board snapshot, and a fake Trello API serving those cards, so no requests are
+sent and no config.json is needed.
+
+Helpers:
+    - make_card: Builds a card with its story point custom field items.
+    - FakeTrelloAPI: Serves a board's cards, lists and actions, and records card writes.
+"""
+
+import copy
+import threading
+
+BOARD_ID = "b" * 24
+SP_TOTAL = "sp_total"
+SP_SPENT = "sp_spent"
+BOARD_CONFIG = {
+    "board_id": BOARD_ID,
+    "sp_total_id": SP_TOTAL,
+    "sp_spent_id": SP_SPENT,
+    "sprint_calc_card": "calc",
+    "unplanned_template_card": "template"
+}
+LISTS = [
+    {"id": "todo", "name": "To Do"},
+    {"id": "doing", "name": "Doing"},
+    {"id": "done", "name": "Done"}
+]
+
+
+def make_card(card_id, id_list="todo", labels=(), total=None, spent=None):
+    """
+    Builds a card as returned in a board snapshot.
+
+    Story points left as None have no custom field item, as on a card never estimated.
+
+    Returns:
+        dict: The card.
+    """
+    items = [
+        {"idCustomField": custom_field_id, "value": {"number": str(value)}}
+        for custom_field_id, value in ((SP_TOTAL, total), (SP_SPENT, spent))
+        if value is not None
+    ]
+    return {
+        "id": card_id,
+        "shortLink": f"s{card_id}",
+        "name": f"Card {card_id}",
+        "labels": [{"id": label, "name": label} for label in labels],
+        "idList": id_list,
+        "idMembers": [],
+        "desc": "",
+        "customFieldItems": items
+    }
+
+
+class FakeTrelloAPI:
+    """
+    Stands in for TrelloAPI, serving a board's cards, lists and actions from memory.
+
+    Args:
+        cards (list of dict, optional): The board's cards. Defaults to none.
+        lists (list of dict, optional): The board's lists. Defaults to LISTS.
+        errors (dict, optional): Errors raised by put_custom_fields, in order, keyed by
+            card ID. Defaults to none.
+        on_fetch (callable, optional): Called while get_cards is answering. Defaults to None.
+    """
+    def __init__(self, cards=(), lists=LISTS, errors=None, on_fetch=None):
+        self.board_id = BOARD_ID
+        self.cards = {card["id"]: card for card in copy.deepcopy(list(cards))}
+        self.lists = copy.deepcopy(lists)
+        self.actions = []
+        self.members = []
+        self.errors = {card_id: list(queued) for card_id, queued in (errors or {}).items()}
+        self.on_fetch = on_fetch
+        self.calls = []
+        self.requested = []
+        self.writes = []
+        self.lock = threading.Lock()
+
+    def get_board_snapshot(self, **kwargs):
+        """ Return every card and list of the board """
+        self.calls.append("snapshot")
+        return {
+            "id": BOARD_ID,
+            "cards": copy.deepcopy(list(self.cards.values())),
+            "lists": copy.deepcopy(self.lists),
+            "members": copy.deepcopy(self.members)
+        }
+
+    def get_board_changes(self, since, action_types, list_fields=None, limit=1000,
+                          member_fields=None):
+        """ Return the actions after since, newest first, with the lists and members """
+        self.calls.append("changes")
+        ids = [recorded["id"] for recorded in self.actions]
+        start = ids.index(since) + 1 if since in ids else 0
+        newer = list(reversed(self.actions[start:]))
+        return {
+            "actions": copy.deepcopy(newer[:limit]),
+            "lists": copy.deepcopy(self.lists),
+            "members": copy.deepcopy(self.members)
+        }
+
+    def get_cards(self, card_ids, fields=None, custom_field_items=False):
+        """ Return the requested cards with their board and archive state, None if unknown """
+        self.calls.append("cards")
+        self.requested.extend(card_ids)
+        if self.on_fetch is not None:
+            self.on_fetch()
+        return {
+            card_id: dict(copy.deepcopy(self.cards[card_id]), closed=False, idBoard=BOARD_ID)
+            if card_id in self.cards else None
+            for card_id in card_ids
+        }
+
+    def put_custom_fields(self, card_id, values):
+        """ Record the write or raise the next queued error """
+        with self.lock:
+            self.writes.append((card_id, values))
+            if self.errors.get(card_id):
+                raise self.errors[card_id].pop(0)
+        return {}
+
+    def close(self):
+        """ Nothing to release """
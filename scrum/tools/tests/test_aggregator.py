@@ -0,0 +1,111 @@
+"""
+test_aggregator.py
+
+This module contains unit tests for the StoryPointAggregator class, ensuring that per-card
+contributions add up to the same totals as the vectorized calculation and that recalculating is
+idempotent.
+
+Tests:
+    - test_update_all: Tests that the totals match the columnar calculation on repeated calls.
+    - test_update_and_remove: Tests that changed and removed cards move the totals by delta.
+    - test_board_calculate_story_points: Tests repeated and partial Board calculations.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from trello.aggregator import StoryPointAggregator
+from trello.board import Board
+from trello.card import Card
+from trello.columnar import CardColumns
+
+
+def card(card_id, total, spent, labels, list_name):
+    """
+    Builds a card with the given story points.
+
+    Returns:
+        Card: The card.
+    """
+    return Card(
+        card_id=card_id,
+        story_points={"total": total, "spent": spent, "remaining": max(total - spent, 0)},
+        labels=labels,
+        list_name=list_name
+    )
+
+
+def make_cards():
+    """
+    Builds cards covering each story point category.
+
+    Returns:
+        list: Card instances.
+    """
+    return [
+        card("planned_done", 3, 3, ["User Story"], "Done"),
+        card("planned_over", 1, 3, [], "Doing"),
+        card("unplanned_open", 2, 1, ["UNPLANNED"], "Doing"),
+        card("unplanned_over", 1, 2, ["UNPLANNED", "RETRO"], "Done - Sprint 4"),
+        card("retro_open", 2, 0, ["RETRO"], "To Do"),
+        card("retro_started", 2, 1, ["RETRO"], "Doing")
+    ]
+
+
+def test_update_all():
+    # Arrange
+    aggregator = StoryPointAggregator()
+    cards = make_cards()
+
+    # Act
+    aggregator.update_all(cards)
+    first = aggregator.get_calcs()
+    aggregator.update_all(cards)
+
+    # Assert
+    assert first == CardColumns.from_cards(cards).calculate_story_points()
+    assert aggregator.get_calcs() == first
+    assert len(aggregator) == len(cards)
+
+
+def test_update_and_remove():
+    # Arrange
+    aggregator = StoryPointAggregator()
+    cards = make_cards()
+    aggregator.update_all(cards)
+
+    # Act: move the open retro card to Done, then drop the planned card in progress
+    cards[4] = card("retro_open", 2, 2, ["RETRO"], "Done")
+    changed = aggregator.update(cards[4])
+    unchanged = aggregator.update(cards[0])
+    removed = aggregator.remove("planned_over")
+
+    # Assert
+    assert (changed, unchanged, removed) == (True, False, True)
+    assert "planned_over" not in aggregator
+    del cards[1]
+    assert aggregator.get_calcs() == CardColumns.from_cards(cards).calculate_story_points()
+
+
+def test_board_calculate_story_points():
+    # Arrange
+    board = Board(None, board_data=[], lists=[], custom_fields_data=[])
+    board.cards = make_cards()
+    expected = CardColumns.from_cards(board.cards).calculate_story_points()
+
+    # Act
+    board.calculate_story_points()
+    repeated = board.calculate_story_points()
+    columnar = board.calculate_story_points(columnar=True)
+    board.cards[2] = card("unplanned_open", 5, 1, ["UNPLANNED"], "Doing")
+    partial = board.calculate_story_points(cards=[board.cards[2]])
+
+    # Assert
+    assert repeated == expected
+    assert columnar == expected
+    assert partial == CardColumns.from_cards(board.cards).calculate_story_points()
+    assert partial["unplanned"]["total"] == expected["unplanned"]["total"] + 3
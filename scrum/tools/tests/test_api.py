@@ -11,6 +11,12 @@ Tests:
     - test_get_custom_fields_data: Tests the get_custom_fields_data method.
     - test_get_member_details: Tests the get_member_details method.
     - test_get_board_member_ids: Tests the get_board_member_ids method.
+    - test_connection_reuse: Tests that the pooled session reuses connections.
+    - test_get_board_snapshot: Tests the get_board_snapshot method.
+    - test_field_projection: Tests that requested fields limit the card payload.
+    - test_response_cache: Tests that cached responses are served without a request.
+    - test_get_card: Tests the get_card method.
+    - test_get_cards: Tests batched card lookups, including cards that do not exist.
 
 """
 
@@ -23,6 +29,8 @@ parent_path = Path(__file__).parent.parent
 sys.path.append(str(parent_path))
 
 from trello.api import TrelloAPI
+from trello.board import Board
+from trello.cache import ResponseCache
 from sprint_utils import load_config
 
 
@@ -117,4 +125,87 @@ def test_get_member_details(trello_api):
 def test_get_board_member_ids(trello_api):
     """ Verify a member id exists in the output of get_board_member_ids() """
     member_ids = trello_api.get_board_member_ids()
-    assert "56f2b2493ac46542079684d0" in member_ids
\ No newline at end of file
+    assert "56f2b2493ac46542079684d0" in member_ids
+
+def test_connection_reuse(board_config):
+    """ Verify consecutive requests share one kept-alive connection """
+    with TrelloAPI(
+        board_id=board_config['board_id'],
+        api_key=board_config['api_key'],
+        api_token=board_config['api_token']
+    ) as api:
+        api.get_board_lists()
+        api.get_board_member_ids()
+        stats = api.get_connection_stats()
+    assert stats["requests"] == 2
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 1
+
+
+def test_get_board_snapshot(trello_api, board_config):
+    """
+    Tests that get_board_snapshot returns nested cards, lists and members in one request.
+
+    Args:
+        trello_api (TrelloAPI): The TrelloAPI instance fixture.
+        board_config (dict): The board configuration fixture.
+    """
+    # Act: Call get_board_snapshot method with the fields Board reads
+    snapshot = trello_api.get_board_snapshot(
+        card_fields=Board.CARD_FIELDS,
+        list_fields=Board.LIST_FIELDS,
+        member_fields=Board.MEMBER_FIELDS
+    )
+
+    # Assert: Verify the nested resources are present and projected
+    assert len(snapshot['lists']) > 0
+    assert len(snapshot['members']) > 0
+    card_ids = [card['id'] for card in snapshot['cards']]
+    assert board_config['sprint_calc_card'] in card_ids
+    assert 'customFieldItems' in snapshot['cards'][0].keys()
+    assert 'badges' not in snapshot['cards'][0].keys()
+
+
+def test_field_projection(trello_api):
+    """ Verify get_board_cards only returns the fields Board consumes when asked to """
+    cards = trello_api.get_board_cards(fields=Board.CARD_FIELDS)
+    assert len(cards) > 0
+    assert set(cards[0].keys()) <= set(Board.CARD_FIELDS)
+
+
+def test_response_cache(board_config, tmp_path):
+    """ Verify a repeated request is served from the cache and the token is never stored """
+    cache = ResponseCache(tmp_path)
+    with TrelloAPI(
+        board_id=board_config['board_id'],
+        api_key=board_config['api_key'],
+        api_token=board_config['api_token'],
+        cache=cache
+    ) as api:
+        lists = api.get_board_lists()
+        cached_lists = api.get_board_lists()
+        stats = api.get_connection_stats()
+    assert cached_lists == lists
+    assert stats["requests"] == 1
+    assert api.get_cache_stats()["hits"] == 1
+    for entry_path in tmp_path.iterdir():
+        assert board_config['api_token'] not in entry_path.read_text()
+
+
+def test_get_card(trello_api, board_config):
+    """ Verify get_card returns the requested card projected onto the requested fields """
+    card = trello_api.get_card(board_config['slack_card'], fields=("id", "shortLink"))
+    assert card['id'] == board_config['slack_card']
+    assert set(card.keys()) == {"id", "shortLink"}
+
+
+def test_get_cards(trello_api, board_config):
+    """ Verify get_cards resolves more cards than fit in one batch and flags missing ones """
+    card_ids = [card['id'] for card in trello_api.get_board_cards(fields=("id",))][:15]
+    missing_id = "0" * 24
+
+    cards = trello_api.get_cards(card_ids + [missing_id], fields=("id", "shortLink"))
+
+    assert list(cards) == card_ids + [missing_id]
+    assert all(cards[card_id]['id'] == card_id for card_id in card_ids)
+    assert cards[missing_id] is None
@@ -0,0 +1,109 @@
+"""
+test_async_api.py
+
+This module contains unit tests for the AsyncTrelloAPI and SyncTrelloAPI classes, ensuring that
+concurrent requests return the same data as the synchronous TrelloAPI.
+
+Tests:
+    - test_get_board_data: Tests concurrent retrieval of cards, lists and custom fields.
+    - test_get_members_details: Tests concurrent retrieval of member details.
+    - test_prefetch: Tests that SyncTrelloAPI hands out prefetched data to getters.
+    - test_prefetch_fields: Tests that prefetched data is only served for the same fields.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+import pytest
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from trello.async_api import AsyncTrelloAPI, SyncTrelloAPI
+from trello.board import Board
+from sprint_utils import load_config
+
+
+@pytest.fixture(scope='module')
+def board_config():
+    """
+    Fixture to load the board configuration.
+
+    Returns:
+        dict: The board configuration dictionary.
+    """
+    return load_config(parent_path / "config.json")['board']
+
+
+def test_get_board_data(board_config):
+    """
+    Tests that get_board_data returns cards, lists and custom fields in one concurrent call.
+
+    Args:
+        board_config (dict): The board configuration fixture.
+    """
+    async def fetch():
+        async with AsyncTrelloAPI(
+            board_id=board_config['board_id'],
+            api_key=board_config['api_key'],
+            api_token=board_config['api_token']
+        ) as api:
+            return await api.get_board_data()
+
+    board_data = asyncio.run(fetch())
+
+    assert set(board_data.keys()) == {"cards", "lists", "custom_fields"}
+    card_ids = [card['id'] for card in board_data["cards"]]
+    assert board_config['sprint_calc_card'] in card_ids
+    assert len(board_data["lists"]) > 0
+    assert 'customFieldItems' in board_data["custom_fields"][0].keys()
+
+
+def test_get_members_details(board_config):
+    """ Verify concurrent member lookups resolve a known member's full name """
+    with SyncTrelloAPI(
+        board_id=board_config['board_id'],
+        api_key=board_config['api_key'],
+        api_token=board_config['api_token']
+    ) as api:
+        member_ids = api.get_board_member_ids()
+        details = api.get_members_details(member_ids)
+    assert set(details.keys()) == set(member_ids)
+    assert details["56f2b2493ac46542079684d0"]["fullName"] == "Alexander Maclay"
+
+
+def test_prefetch(board_config):
+    """ Verify prefetched results are served once and then requested again """
+    with SyncTrelloAPI(
+        board_id=board_config['board_id'],
+        api_key=board_config['api_key'],
+        api_token=board_config['api_token']
+    ) as api:
+        api.prefetch(include_cards=False)
+        lists = api.get_board_lists()
+        stats_before = api.async_api.api.get_connection_stats()
+        assert stats_before["requests"] == 2
+        assert len(lists) > 0
+        # Cards were not prefetched, so this goes to the API
+        cards = api.get_board_cards()
+        assert len(cards) > 0
+        assert api.async_api.api.get_connection_stats()["requests"] == 3
+
+
+def test_prefetch_fields(board_config):
+    """ Verify prefetched lists are not served to a getter asking for other fields """
+    with SyncTrelloAPI(
+        board_id=board_config['board_id'],
+        api_key=board_config['api_key'],
+        api_token=board_config['api_token']
+    ) as api:
+        api.prefetch(include_cards=False, list_fields=Board.LIST_FIELDS)
+        # All fields were asked for, so this goes to the API
+        lists = api.get_board_lists()
+        assert api.async_api.api.get_connection_stats()["requests"] == 3
+        assert set(lists[0].keys()) > set(Board.LIST_FIELDS)
+        # The projected lists are still held for a matching getter
+        projected = api.get_board_lists(fields=Board.LIST_FIELDS)
+        assert api.async_api.api.get_connection_stats()["requests"] == 3
+        assert set(projected[0].keys()) <= set(Board.LIST_FIELDS)
@@ -0,0 +1,159 @@
+"""
+test_backtest.py
+
+This module contains unit tests for the sprint recommendation backtest. A fake database manager
+serves synthetic sprint summaries and board snapshots, so no MySQL server or config.json is
+needed.
+
+Tests:
+    - test_pair_snapshots: Tests pairing finished sprints with the snapshot saved after them.
+    - test_summarize_errors: Tests the error statistics.
+    - test_run_backtest: Tests the report and that a second run reuses the cached results.
+    - test_run_backtest_without_custom_fields: Tests snapshots archived without custom field data.
+"""
+
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from conftest import BOARD_CONFIG, BOARD_ID, make_card
+from sprint_backtest import pair_snapshots, run_backtest, summarize_errors
+
+LISTS = [{"id": "done", "name": "Done"}]
+START = datetime(2024, 1, 5, 17)
+
+
+def make_summary(sprint, planned_completed, unplanned_completed=0, retro_completed=0):
+    """
+    Builds the sprint_summary row of a sprint ending two weeks after the previous one.
+
+    Returns:
+        dict: The row.
+    """
+    return {
+        "board_id": BOARD_ID,
+        "start_date": date(2024, 1, 5) + timedelta(weeks=2 * sprint),
+        "length_days": 10,
+        "members": 5,
+        "vacation_days": 0,
+        "planned_completed": planned_completed,
+        "unplanned_completed": unplanned_completed,
+        "retro_completed": retro_completed,
+        "created_at": START + timedelta(weeks=2 * sprint)
+    }
+
+
+def make_snapshot(snapshot_id, created_at, spent, custom_fields=True):
+    """
+    Builds a stored snapshot with one done card and the sprint summary card.
+
+    Without custom_fields, the cards are stored as archived before this data was kept.
+
+    Returns:
+        dict: The snapshot as yielded by SprintDBManager.iter_board_data_from_db.
+    """
+    cards = [
+        make_card("c1", id_list="done", total=spent, spent=spent),
+        {**make_card("calc", id_list="done"), "desc": "SP Unplanned: 2(T) SP Retro: 1(T)"}
+    ]
+    if not custom_fields:
+        for card in cards:
+            del card["customFieldItems"]
+    return {"id": snapshot_id, "board_id": BOARD_ID, "created_at": created_at, "json_data": cards}
+
+
+class FakeDBManager:
+    """ Serves sprint summaries and snapshots of one board """
+    def __init__(self, summaries, snapshots):
+        self.summaries = summaries
+        self.snapshots = snapshots
+
+    def get_sprint_summary_from_db(self, board_id):
+        """ Return the board's sprint summaries, oldest first """
+        return [summary for summary in self.summaries if summary["board_id"] == board_id]
+
+    def iter_board_data_from_db(self, board_id=None, fetch_size=50):
+        """ Yield the board's snapshots, oldest first """
+        yield from (snapshot for snapshot in self.snapshots if snapshot["board_id"] == board_id)
+
+
+def test_pair_snapshots():
+    # Arrange
+    summaries = [make_summary(sprint, 10) for sprint in range(3)]
+    snapshots = [
+        make_snapshot(1, START - timedelta(hours=1), 5),            # before any sprint
+        make_snapshot(2, START + timedelta(minutes=5), 5),          # paired with sprint 0
+        make_snapshot(3, START + timedelta(hours=2), 5),            # sprint 0 already paired
+        make_snapshot(4, START + timedelta(weeks=1), 5),            # too long after sprint 0
+        make_snapshot(5, START + timedelta(weeks=2, minutes=1), 5), # paired with sprint 1
+        make_snapshot(6, START + timedelta(weeks=4, minutes=1), 5)  # last sprint has no outcome
+    ]
+
+    # Act
+    pairs = list(pair_snapshots(summaries, snapshots))
+
+    # Assert
+    assert [(snapshot["id"], summary, next_summary) for snapshot, summary, next_summary in pairs] \
+        == [(2, summaries[0], summaries[1]), (5, summaries[1], summaries[2])]
+
+
+def test_summarize_errors():
+    # Act
+    stats = summarize_errors([2, -4, 2])
+
+    # Assert
+    assert stats["mae"] == pytest.approx(8 / 3)
+    assert stats["bias"] == 0
+    assert stats["rmse"] == pytest.approx(8 ** 0.5)
+    assert summarize_errors([]) == {"mae": None, "bias": None, "rmse": None}
+
+
+def test_run_backtest(tmp_path):
+    # Arrange
+    summaries = [make_summary(sprint, completed) for sprint, completed in enumerate((0, 12, 15))]
+    snapshots = [
+        make_snapshot(sprint + 1, summary["created_at"] + timedelta(minutes=1), spent)
+        for sprint, (summary, spent) in enumerate(zip(summaries, (13, 16, 20)))
+    ]
+    db_manager = FakeDBManager(summaries, snapshots)
+    cache_path = tmp_path / "backtest.json"
+
+    # Act
+    report = run_backtest(
+        db_manager, [BOARD_CONFIG], {BOARD_ID: LISTS}, processes=2, cache_path=cache_path)
+    cached_report = run_backtest(
+        db_manager, [BOARD_CONFIG], {BOARD_ID: LISTS}, processes=2, cache_path=cache_path)
+
+    # Assert
+    # Each recommendation is the spent points less the median unplanned and retro points
+    board = report["boards"][0]
+    assert [(row["recommendation"], row["actual"]) for row in board["results"]] == [
+        (10, 12), (13, 15)]
+    assert (board["sprints"], board["mae"], board["bias"], board["rmse"]) == (2, 2, -2, 2)
+    assert (report["snapshots"], report["cache_hits"]) == (2, 0)
+    assert cached_report["boards"][0]["results"] == board["results"]
+    assert cached_report["cache_hits"] == 2
+
+
+def test_run_backtest_without_custom_fields(tmp_path):
+    # Arrange
+    summaries = [make_summary(0, 13, 2, 1), make_summary(1, 12)]
+    snapshots = [make_snapshot(1, summaries[0]["created_at"] + timedelta(minutes=1), 99,
+                               custom_fields=False)]
+    db_manager = FakeDBManager(summaries, snapshots)
+
+    # Act
+    report = run_backtest(db_manager, [BOARD_CONFIG], {BOARD_ID: LISTS}, processes=1,
+                          cache_path=tmp_path / "backtest.json")
+
+    # Assert
+    # The sprint summary row's 13 + 2 + 1 completed points, less the median unplanned and retro
+    # points on the sprint summary card; the cards' own points are not available
+    results = report["boards"][0]["results"]
+    assert [(row["recommendation"], row["actual"]) for row in results] == [(13, 12)]
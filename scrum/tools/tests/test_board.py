@@ -9,6 +9,10 @@ Test Cases:
     - `test_calculate_story_points`: Tests the `calculate_story_points`
         method of the `Board` class using stored board data.
     - `test_assign_story_points`: Tests that Board can parse and assign story points to its cards
+    - `test_from_snapshot`: Tests that a Board built from one snapshot request matches
+        a Board built from separate requests.
+    - `test_assign_story_points_missing_card`: Tests that cards missing from the custom field
+        data default to zero story points.
 """
 
 import sys
@@ -22,7 +26,7 @@ sys.path.append(str(parent_path))
 
 from sprint_utils import load_config, load_test_board_data
 from trello.api import TrelloAPI
-from trello.board import Board
+from trello.board import Board, index_custom_fields
 from trello.card import Card
 
 
@@ -186,3 +190,52 @@ def test_assign_story_points(monkeypatch, trello_api, card_id, expected_seq):
     # Extract story points from target card_id
     sp_values = [x.get_story_points() for x in board.get_cards() if x.get_card_id() == card_id]
     assert sp_values[0] == expected
+
+
+def test_from_snapshot(trello_api):
+    """
+    Tests that `Board.from_snapshot` produces the same cards and story points as `Board`.
+
+    Args:
+        trello_api (TrelloAPI): Fixture providing a `TrelloAPI` instance.
+
+    Notes:
+        This test depends on the live Trello board data.
+    """
+    # Arrange: Build one board from separate requests and one from a single snapshot
+    board = Board(trello_api)
+    board.extract_cards()
+    snapshot_board = Board.from_snapshot(trello_api)
+    snapshot_board.extract_cards()
+
+    # Assert: Verify both boards hold the same cards and totals
+    assert len(snapshot_board.get_members()) > 0
+    assert sorted(card.get_card_id() for card in snapshot_board.get_cards()) == sorted(
+        card.get_card_id() for card in board.get_cards())
+    assert snapshot_board.calculate_story_points() == board.calculate_story_points()
+
+
+def test_assign_story_points_missing_card(trello_api):
+    """
+    Tests that `assign_story_points` defaults cards absent from the custom field data to zero.
+
+    Args:
+        trello_api (TrelloAPI): Fixture providing a `TrelloAPI` instance.
+    """
+    # Arrange: Drop one known card from the stored custom field data
+    test_board_data = load_test_board_data(
+        parent_path / "card_json_archive/test_board_data.json")
+    custom_fields_data = load_test_board_data(
+        parent_path / "card_json_archive/custom_fields_data.json")
+    missing_card_id = "65a94cda728ee2a7a77f85a7"
+    custom_fields_data = [x for x in custom_fields_data if x['id'] != missing_card_id]
+    assert missing_card_id not in index_custom_fields(custom_fields_data)
+
+    # Act: Assign story points from the incomplete custom field data
+    board = Board(trello_api, test_board_data, custom_fields_data=custom_fields_data)
+    board.extract_cards()
+
+    # Assert: Verify the missing card has no story points and others are unaffected
+    sp_values = {x.get_card_id(): x.get_story_points() for x in board.get_cards()}
+    assert sp_values[missing_card_id] == {"total": 0, "spent": 0, "remaining": 0}
+    assert sp_values["65a94cda728ee2a7a77f85b9"] == {"total": 1, "spent": 2, "remaining": 0}
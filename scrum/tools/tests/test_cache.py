@@ -0,0 +1,103 @@
+"""
+test_cache.py
+
+This module contains unit tests for the ResponseCache class, covering cache keys, freshness,
+revalidation and size-bounded eviction without contacting the Trello API.
+
+Tests:
+    - test_make_key: Tests that keys ignore the API key, token and parameter order.
+    - test_lookup_freshness: Tests per-endpoint TTLs and entry validators.
+    - test_revalidated: Tests that revalidating renews an expired entry.
+    - test_eviction: Tests that the least recently used entries are evicted first.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from trello.cache import ResponseCache
+
+BOARD_URL = "https://api.trello.com/1/boards/abc"
+
+
+class FakeClock:
+    """ Clock advanced by hand """
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_make_key():
+    """
+    Tests that the key depends on the request only, not on the credentials or parameter order.
+    """
+    key = ResponseCache.make_key("GET", BOARD_URL, {"fields": "id", "cards": "visible"})
+
+    assert key == ResponseCache.make_key(
+        "get", BOARD_URL, {"cards": "visible", "fields": "id", "key": "k", "token": "t"})
+    assert key != ResponseCache.make_key("GET", BOARD_URL, {"fields": "id,name"})
+
+
+def test_lookup_freshness(tmp_path):
+    """
+    Tests that entries are served while fresh, using the TTL of their endpoint.
+    """
+    clock = FakeClock()
+    cache = ResponseCache(tmp_path, ttls=((r"/lists$", 600),), default_ttl=60, clock=clock)
+    cache.store("GET", BOARD_URL, None, '{"id": "abc"}', {"ETag": '"v1"'})
+    cache.store("GET", BOARD_URL + "/lists", None, "[]")
+
+    clock.now += 120
+    board_entry = cache.lookup("GET", BOARD_URL)
+    lists_entry = cache.lookup("GET", BOARD_URL + "/lists")
+
+    assert board_entry.json() == {"id": "abc"}
+    assert not board_entry.is_fresh(clock())
+    assert board_entry.get_validators() == {"If-None-Match": '"v1"'}
+    assert lists_entry.is_fresh(clock())
+    assert cache.lookup("GET", BOARD_URL + "/cards") is None
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_revalidated(tmp_path):
+    """
+    Tests that an entry confirmed unchanged is fresh again, also for a new cache instance.
+    """
+    clock = FakeClock()
+    cache = ResponseCache(tmp_path, clock=clock)
+    cache.store("GET", BOARD_URL, None, "[]", {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    clock.now += 3600
+
+    entry = cache.lookup("GET", BOARD_URL)
+    cache.revalidated(entry)
+
+    reopened = ResponseCache(tmp_path, clock=clock)
+    assert reopened.lookup("GET", BOARD_URL).is_fresh(clock())
+    assert cache.get_stats()["revalidated"] == 1
+
+
+def test_eviction(tmp_path):
+    """
+    Tests that storing beyond max_bytes evicts the least recently used entries.
+    """
+    clock = FakeClock()
+    cache = ResponseCache(tmp_path, max_bytes=500, clock=clock)
+    body = "x" * 100
+    for name in ("a", "b", "c"):
+        cache.store("GET", f"{BOARD_URL}/{name}", None, body)
+
+    # Act: Use 'a', then store a fourth entry
+    cache.lookup("GET", f"{BOARD_URL}/a")
+    cache.store("GET", f"{BOARD_URL}/d", None, body)
+
+    # Assert: Verify 'b' was evicted and the size bound holds
+    assert cache.lookup("GET", f"{BOARD_URL}/b") is None
+    assert cache.lookup("GET", f"{BOARD_URL}/a") is not None
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= 500
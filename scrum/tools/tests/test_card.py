@@ -7,6 +7,8 @@ are correctly implemented.
 Tests:
     - test_get_story_points: Tests the retrieval of story points.
     - test_set_story_points: Tests the modification of story points.
+    - test_default_collections_not_shared: Tests that cards do not share label or member defaults.
+    - test_missing_list_name: Tests that a missing list name is stored as an empty string.
 """
 
 import sys
@@ -84,3 +86,39 @@ def test_set_story_points():
     assert test_card.get_total_story_points() == 10
     assert test_card.get_spent_story_points() == 5
     assert test_card.get_remaining_story_points() == 5
+
+
+def test_default_collections_not_shared():
+    """
+    Tests that default labels and members are immutable and independent per card.
+    """
+    # Arrange: Create two cards relying on the defaults and one with labels
+    first_card = Card(card_id='Noble141', story_points={})
+    second_card = Card(card_id='Noble142', story_points={})
+    labelled_card = Card(card_id='Noble143', story_points={}, labels=['RETRO'])
+
+    # Assert: Verify defaults are empty tuples and missing story points default to 0
+    assert first_card.get_labels() == ()
+    assert first_card.get_id_members() == ()
+    assert first_card.get_story_points() == {'total': 0, 'spent': 0, 'remaining': 0}
+    assert second_card.get_labels() == ()
+    assert labelled_card.get_labels() == ('RETRO',)
+
+    # Assert: Verify slotted cards reject unknown attributes
+    with pytest.raises(AttributeError):
+        first_card.story_points = {}
+
+
+def test_missing_list_name():
+    """
+    Tests that a card whose list is unknown gets an empty list name.
+    """
+    # Act: Create a card without a list name, then set and clear one
+    test_card = Card(card_id='Noble141', story_points={}, list_name=None)
+    assert test_card.get_list_name() == ''
+    test_card.set_list_name('Done')
+    assert test_card.get_list_name() == 'Done'
+    test_card.set_list_name(None)
+
+    # Assert: Verify the name was cleared to an empty string
+    assert test_card.get_list_name() == ''
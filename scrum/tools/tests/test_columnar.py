@@ -0,0 +1,78 @@
+"""
+test_columnar.py
+
+This module contains unit tests for the CardColumns class, ensuring that the vectorized story
+point totals match the per-card calculation in Board.calculate_story_points.
+
+Tests:
+    - test_from_cards: Tests the conversion of Card objects to column arrays.
+    - test_calculate_story_points: Tests the vectorized story point totals.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from trello.card import Card
+from trello.columnar import CardColumns
+
+
+def make_cards():
+    """
+    Builds cards covering each story point category.
+
+    Returns:
+        list: Card instances.
+    """
+    def card(card_id, total, spent, labels, list_name):
+        return Card(
+            card_id=card_id,
+            story_points={"total": total, "spent": spent, "remaining": max(total - spent, 0)},
+            labels=labels,
+            list_name=list_name
+        )
+
+    return [
+        card("planned_done", 3, 3, ["User Story"], "Done"),
+        card("planned_over", 1, 3, [], "Doing"),
+        card("unplanned_open", 2, 1, ["UNPLANNED"], "Doing"),
+        card("unplanned_over", 1, 2, ["UNPLANNED", "RETRO"], "Done - Sprint 4"),
+        card("retro_open", 2, 0, ["RETRO"], "To Do"),
+        card("retro_started", 2, 1, ["RETRO"], "Doing")
+    ]
+
+
+def test_from_cards():
+    """
+    Tests that story points, list names and labels are encoded as columns.
+    """
+    columns = CardColumns.from_cards(make_cards())
+
+    assert len(columns) == 6
+    assert columns.total.dtype == np.int32
+    assert columns.total.tolist() == [3, 1, 2, 1, 2, 2]
+    assert columns.list_names == ["Done", "Doing", "Done - Sprint 4", "To Do"]
+    assert columns.list_codes.tolist() == [0, 1, 1, 2, 3, 1]
+    assert columns.has_label("RETRO").tolist() == [False, False, False, True, True, True]
+    assert not columns.has_label("Missing").any()
+
+
+def test_calculate_story_points():
+    """
+    Tests that the vectorized totals match the expected per-card calculation.
+    """
+    # Retro totals include the points spent above total on planned and unplanned cards
+    expected = {
+        "planned": {"total": 6, "spent": 5, "remaining": 1},
+        "unplanned": {"total": 3, "spent": 2, "remaining": 1},
+        "retro": {"total": 5, "spent": 3, "remaining": 2}
+    }
+
+    results = CardColumns.from_cards(make_cards()).calculate_story_points()
+
+    assert results == expected
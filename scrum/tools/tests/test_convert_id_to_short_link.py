@@ -23,3 +23,11 @@ def test_main(capfd):
     captured = capfd.readouterr()
     expected_message = "Q9EAW7j2"
     assert expected_message in captured.out
+
+def test_main_many(capfd):
+    # Call target method with several IDs, one of them unknown
+    main([board_config["slack_card"], "0" * 24])
+    # Check for one line per ID, with an empty short link for the unknown card
+    captured = capfd.readouterr()
+    assert f'{board_config["slack_card"]} Q9EAW7j2' in captured.out
+    assert f'{"0" * 24} \n' in captured.out
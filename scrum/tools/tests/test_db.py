@@ -7,7 +7,13 @@ Test Cases:
     - test_connect_to_db: Tests the database connection.
     - test_insert_data: Tests the insertion of board data and sprint summary data.
     - test_get_data_from_db: Tests the retrieval of board data and sprint summary data.
+    - test_pooled_connection_reuse: Tests that pooled mode reuses connections per database.
+    - test_insert_many: Tests batched insertion of many sprint summary rows.
+    - test_iter_board_data_from_db: Tests streaming retrieval of stored board snapshots.
+    - test_store_board_snapshot: Tests compressed, deduplicated snapshot storage.
+    - test_store_board_snapshot_delta: Tests delta-encoded snapshot history and reconstruction.
 """
+import json
 import sys
 from datetime import date
 from pathlib import Path
@@ -19,6 +25,7 @@ sys.path.append(str(parent_path))
 
 from sprint_utils import load_config, load_test_board_data
 from trello.db import SprintDBManager
+from trello.snapshot import content_hash, decode_snapshot, is_delta
 
 
 @pytest.fixture(scope='module')
@@ -198,3 +205,153 @@ def test_get_data_from_db(
     # Assert: Verify the sprint summary
     assert sprint_summaries is not None
     assert len(sprint_summaries) == 1
+
+
+def test_pooled_connection_reuse():
+    """
+    Tests that pooled mode hands the same server connection back out after it is closed.
+    """
+    # Arrange: Enable pooling with a single connection per database
+    mysql_config = load_config(parent_path / "config.json")['mysql']
+    pooled_manager = SprintDBManager({**mysql_config, 'pool_size': 1})
+
+    # Act: Run two queries, each of which returns its connection to the pool
+    first_id = pooled_manager.execute_query(query="SELECT CONNECTION_ID();")[0][0]
+    second_id = pooled_manager.execute_query(query="SELECT CONNECTION_ID();")[0][0]
+
+    # Assert: Verify both queries ran on the same connection
+    assert first_id == second_id
+
+
+def test_insert_many(sprint_db_manager, sprint_summary_data):
+    """
+    Tests that insert_many writes every row across batches and returns their ID range.
+
+    Args:
+        sprint_db_manager (SprintDBManager): The database manager fixture.
+        sprint_summary_data (dict): The sprint summary data fixture.
+    """
+    # Arrange: Build enough rows to span several batches
+    rows = [dict(sprint_summary_data, members=i) for i in range(25)]
+
+    # Act: Insert the rows in batches of 10
+    first_id, last_id = sprint_db_manager.insert_many(
+        table='sprint_summary', rows=rows, batch_size=10)
+
+    try:
+        # Assert: Verify every row was inserted within the returned ID range
+        results = sprint_db_manager.execute_query(
+            query=f"SELECT members FROM sprint_summary WHERE id BETWEEN {first_id} AND {last_id};")
+        assert last_id - first_id + 1 == len(rows)
+        assert sorted(row[0] for row in results) == list(range(25))
+    finally:
+        # Cleanup: delete the inserted rows
+        sprint_db_manager.execute_query(
+            query=f"DELETE FROM sprint_summary WHERE id BETWEEN {first_id} AND {last_id};")
+
+
+def test_iter_board_data_from_db(sprint_db_manager, insert_board_data):
+    """
+    Tests that iter_board_data_from_db streams parsed snapshots and can be abandoned early.
+
+    Args:
+        sprint_db_manager (SprintDBManager): The database manager fixture.
+        insert_board_data (int): The board data insertion fixture.
+    """
+    # Act: Stream the snapshots stored for the test board
+    snapshots = list(sprint_db_manager.iter_board_data_from_db(board_id="J117", fetch_size=1))
+
+    # Assert: Verify the inserted snapshot was parsed
+    assert insert_board_data in [snapshot['id'] for snapshot in snapshots]
+    assert all(len(snapshot['json_data']) == 73 for snapshot in snapshots)
+
+    # Act: Stop after the first row of a query, then reuse the manager
+    rows = sprint_db_manager.iter_query("SELECT id FROM boards;", fetch_size=1)
+    next(rows)
+    rows.close()
+
+    # Assert: Verify the connection was left usable
+    assert sprint_db_manager.execute_query(query="SELECT 1;") == [(1,)]
+
+
+def test_store_board_snapshot(sprint_db_manager, board_data):
+    """
+    Tests that store_board_snapshot deduplicates unchanged boards and reads back transparently.
+
+    Args:
+        sprint_db_manager (SprintDBManager): The database manager fixture.
+        board_data (dict): The board data fixture.
+    """
+    # Arrange: Use a board ID with no stored snapshots
+    cards = json.loads(board_data['json_data'])
+    changed_cards = cards[:-1]
+
+    # Act: Store the same board twice, then a changed board
+    first_id = sprint_db_manager.store_board_snapshot("J118", "Test Board", cards)
+    repeat_id = sprint_db_manager.store_board_snapshot("J118", "Test Board", cards)
+    changed_id = sprint_db_manager.store_board_snapshot("J118", "Test Board", changed_cards)
+
+    try:
+        # Assert: Verify the unchanged board reused its row and rows only hold the hash
+        assert repeat_id == first_id
+        assert changed_id != first_id
+        rows = sprint_db_manager.execute_query(
+            query="SELECT json_data, snapshot_hash FROM boards WHERE board_id = 'J118' "
+                  "ORDER BY id;")
+        assert [snapshot_hash for _, snapshot_hash in rows] == [
+            content_hash(cards), content_hash(changed_cards)]
+        assert all(len(json_data) < 100 for json_data, _ in rows)
+        # Assert: Verify both read back decompressed
+        assert sprint_db_manager.get_board_data_from_db(assigned_board_id=first_id) == cards
+        assert sprint_db_manager.get_board_data_from_db(
+            assigned_board_id=changed_id) == changed_cards
+        snapshots = list(sprint_db_manager.iter_board_data_from_db(board_id="J118"))
+        assert [snapshot['json_data'] for snapshot in snapshots] == [cards, changed_cards]
+    finally:
+        # Cleanup: delete the board rows and their snapshots
+        sprint_db_manager.execute_query(query="DELETE FROM boards WHERE board_id = 'J118';")
+        sprint_db_manager.execute_query(
+            query="DELETE FROM board_snapshots WHERE content_hash IN "
+                  f"('{content_hash(cards)}', '{content_hash(changed_cards)}');")
+
+
+def test_store_board_snapshot_delta(board_data):
+    """
+    Tests that delta mode stores keyframes at the configured interval and rebuilds every snapshot.
+
+    Args:
+        board_data (dict): The board data fixture.
+    """
+    # Arrange: Store deltas with a keyframe every third snapshot
+    mysql_config = load_config(parent_path / "config.json")['mysql']
+    manager = SprintDBManager(dict(mysql_config, snapshot_mode="delta", keyframe_interval=3))
+    cards = json.loads(board_data['json_data'])
+    history = [cards[:len(cards) - i] for i in range(5)]
+
+    # Act: Store the history, then rebuild it with an empty cache
+    row_ids = [manager.store_board_snapshot("J119", "Test Board", snapshot)
+               for snapshot in history]
+    reader = SprintDBManager(mysql_config)
+    hashes = [content_hash(snapshot) for snapshot in history]
+
+    try:
+        # Assert: Verify every snapshot is rebuilt by its row, hash and in history order
+        for row_id, snapshot_hash, snapshot in zip(row_ids, hashes, history):
+            assert reader.get_board_data_from_db(assigned_board_id=row_id) == snapshot
+            assert reader.get_snapshot(snapshot_hash) == snapshot
+        assert [row['json_data'] for row in SprintDBManager(mysql_config)
+                .iter_board_data_from_db(board_id="J119")] == history
+        # Assert: Verify keyframes start each chain
+        payloads = reader.execute_query(
+            query="SELECT content_hash, payload FROM board_snapshots WHERE content_hash IN "
+                  f"({', '.join(repr(snapshot_hash) for snapshot_hash in hashes)});")
+        deltas = {snapshot_hash: is_delta(decode_snapshot(payload))
+                  for snapshot_hash, payload in payloads}
+        assert [deltas[snapshot_hash] for snapshot_hash in hashes] == [
+            False, True, True, False, True]
+    finally:
+        # Cleanup: delete the board rows and their snapshots
+        manager.execute_query(query="DELETE FROM boards WHERE board_id = 'J119';")
+        manager.execute_query(
+            query="DELETE FROM board_snapshots WHERE content_hash IN "
+                  f"({', '.join(repr(snapshot_hash) for snapshot_hash in hashes)});")
@@ -0,0 +1,109 @@
+"""
+test_fleet.py
+
+This module contains unit tests for the fleet mode. A fake async client serves synthetic board
+snapshots, so no requests are sent and no config.json is needed.
+
+Tests:
+    - test_get_fleet_configs: Tests merging fleet entries over the board block.
+    - test_process_board: Tests the story points calculated for one snapshot.
+    - test_run_fleet: Tests the consolidated report, including a board that fails to fetch.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from conftest import make_card
+from trello.fleet import get_fleet_configs, process_board, run_fleet
+
+BOARD_BLOCK = {
+    "api_key": "key",
+    "api_token": "token",
+    "sp_total_id": "sp_total",
+    "sp_spent_id": "sp_spent",
+    "sprint_calc_card": "calc",
+    "unplanned_template_card": "template"
+}
+
+
+def make_snapshot(points):
+    """
+    Builds a board snapshot with one planned card per story point value, plus the sprint
+    summary card.
+
+    Returns:
+        dict: The snapshot.
+    """
+    cards = [make_card(f"c{index}", total=total) for index, total in enumerate(points)]
+    cards.append({**make_card("calc"), "desc": "SP Unplanned: 4(T) SP Retro: 2(T)"})
+    return {"cards": cards, "lists": [{"id": "todo", "name": "To Do"}], "members": []}
+
+
+class FakeAsyncAPI:
+    """ Serves the snapshot of one board, failing for the board named 'broken' """
+    snapshots = {"b1": make_snapshot([1, 2]), "b2": make_snapshot([5])}
+
+    def __init__(self, board_config):
+        self.board_id = board_config["board_id"]
+        self.closed = False
+
+    async def get_board_snapshot(self, **kwargs):
+        """ Return the board's snapshot """
+        if self.board_id not in self.snapshots:
+            raise ConnectionError("board unreachable")
+        return self.snapshots[self.board_id]
+
+    def close(self):
+        """ Record that the client was closed """
+        self.closed = True
+
+
+def test_get_fleet_configs():
+    # Arrange
+    config = {"board": {**BOARD_BLOCK, "board_id": "main"}}
+
+    # Act
+    single = get_fleet_configs(config)
+    fleet = get_fleet_configs({**config, "fleet": [{"board_id": "b1", "sprint_calc_card": "x"}]})
+
+    # Assert
+    assert single == [config["board"]]
+    assert fleet == [{**BOARD_BLOCK, "board_id": "b1", "sprint_calc_card": "x"}]
+    with pytest.raises(ValueError):
+        get_fleet_configs({"board": BOARD_BLOCK, "fleet": [{"name": "no id"}]})
+
+
+def test_process_board():
+    # Act
+    result = process_board({**BOARD_BLOCK, "board_id": "b1"}, make_snapshot([1, 2]))
+
+    # Assert
+    assert result["cards"] == 2
+    assert result["calcs"]["planned"] == {"total": 3, "spent": 0, "remaining": 3}
+    assert result["unplanned_past_sprints"] == [4]
+    assert result["retro_past_sprints"] == [2]
+
+
+def test_run_fleet():
+    # Arrange
+    board_configs = [
+        {**BOARD_BLOCK, "board_id": board_id, "name": f"Team {board_id}"}
+        for board_id in ("b1", "broken", "b2")
+    ]
+
+    # Act
+    report = run_fleet(board_configs, max_concurrency=2, processes=2, api_factory=FakeAsyncAPI)
+
+    # Assert
+    assert [board["name"] for board in report["boards"]] == ["Team b1", "Team broken", "Team b2"]
+    assert (report["succeeded"], report["failed"]) == (2, 1)
+    assert report["boards"][1]["error"] == "ConnectionError: board unreachable"
+    assert report["boards"][2]["calcs"]["planned"]["total"] == 5
+    assert report["totals"]["planned"] == {"total": 8, "spent": 0, "remaining": 8}
+    assert report["boards_per_second"] > 0
@@ -0,0 +1,88 @@
+"""
+test_forecast.py
+
+This module contains unit tests for the Monte Carlo sprint forecast.
+
+Tests:
+    - test_constant_history: Tests that a history without variation forecasts the recommendation.
+    - test_commitments: Tests commitment ordering and reproducibility with a seed.
+    - test_get_completed_history: Tests totalling completed points from sprint summaries.
+    - test_empty_history: Tests the error raised without history.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from sprint_forecast import forecast_story_points, get_completed_history
+from sprint_math import recommend_story_points
+
+SPRINT_CONTROLS = {
+    'last_sprint_days': 10,
+    'next_sprint_days': 8,
+    'missed_last_sprint': 2,
+    'missed_next_sprint': 6,
+    'members': 4
+}
+
+
+def test_constant_history():
+    # Arrange
+    story_points = {
+        "planned": {"spent": 30},
+        "unplanned": {"spent": 6},
+        "retro": {"spent": 4}
+    }
+    expected = recommend_story_points(story_points, [5], [3], SPRINT_CONTROLS)
+
+    # Act
+    forecast = forecast_story_points([40], [5], [3], SPRINT_CONTROLS, simulations=1000)
+
+    # Assert
+    # (40 - 5 - 3) / 1.25 - 1 = 24.6, which the recommendation rounds up and commitments down
+    assert forecast["commitments"] == {50: expected - 1, 80: expected - 1, 95: expected - 1}
+    assert forecast["mean"] == pytest.approx(24.6)
+
+
+def test_commitments():
+    # Arrange
+    history = ([40, 35, 50, 42, 38, 45, 10], [5, 8, 3, 6], [2, 4, 1])
+
+    # Act
+    forecast = forecast_story_points(*history, SPRINT_CONTROLS, seed=7)
+    repeated = forecast_story_points(*history, SPRINT_CONTROLS, seed=7)
+
+    # Assert
+    commitments = forecast["commitments"]
+    assert list(commitments) == [50, 80, 95]
+    assert commitments[50] >= commitments[80] >= commitments[95]
+    assert commitments[50] > commitments[95]
+    assert repeated == forecast
+    # Only the last six sprints are resampled, so the oldest sprint's 40 points never recur
+    unwindowed = forecast_story_points(*history, SPRINT_CONTROLS, seed=7, window=7)
+    assert unwindowed["mean"] > forecast["mean"]
+
+
+def test_get_completed_history():
+    # Arrange
+    summaries = [
+        {"planned_completed": 20, "unplanned_completed": 5, "retro_completed": 1},
+        {"planned_completed": 18, "unplanned_completed": 0, "retro_completed": 3}
+    ]
+
+    # Act
+    history = get_completed_history(summaries)
+
+    # Assert
+    assert history == [26, 21]
+
+
+def test_empty_history():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        forecast_story_points([40], [], [3], SPRINT_CONTROLS)
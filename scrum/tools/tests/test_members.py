@@ -0,0 +1,114 @@
+"""
+test_members.py
+
+This module contains unit tests for the MemberDirectory class. A fake API client stands in for
+the Trello API and counts requests, so no requests are sent.
+
+Tests:
+    - test_resolve_with_one_board_request: Tests that board members resolve in one request.
+    - test_former_members_requested_individually: Tests the fallback for members off the board.
+    - test_persistent_cache_and_ttl: Tests that resolved members persist until the TTL expires.
+    - test_add_members: Tests that snapshot members resolve without requests.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from trello.members import MemberDirectory
+
+BOARD_MEMBERS = [
+    {"id": "m1", "fullName": "Ada Lovelace", "username": "ada"},
+    {"id": "m2", "fullName": "Alan Turing", "username": "alan"}
+]
+
+
+class FakeAPI:
+    """ Counts member requests and answers them from fixed data """
+    def __init__(self):
+        self.board_requests = 0
+        self.member_requests = []
+
+    def get_board_members(self, fields=None):
+        """ Return the current board members """
+        self.board_requests += 1
+        return [dict(member) for member in BOARD_MEMBERS]
+
+    def get_member_details(self, member_id, fields=None):
+        """ Return a member who is no longer on the board """
+        self.member_requests.append(member_id)
+        return {"id": member_id, "fullName": f"Former {member_id}", "username": member_id}
+
+
+class FakeClock:
+    """ Clock advanced by hand """
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_resolve_with_one_board_request():
+    """
+    Tests that every board member is resolved with a single request.
+    """
+    api = FakeAPI()
+    directory = MemberDirectory(api, cache_path=None)
+
+    names = directory.get_full_names(["m2", "m1"])
+
+    assert names == {"m2": "Alan Turing", "m1": "Ada Lovelace"}
+    assert api.board_requests == 1
+    assert not api.member_requests
+
+
+def test_former_members_requested_individually():
+    """
+    Tests that only members missing from the board are requested one by one.
+    """
+    api = FakeAPI()
+    directory = MemberDirectory(api, cache_path=None)
+
+    names = directory.get_full_names(["m1", "gone"])
+
+    assert names == {"m1": "Ada Lovelace", "gone": "Former gone"}
+    assert api.member_requests == ["gone"]
+    assert directory.get_stats() == {"hits": 0, "board_requests": 1, "member_requests": 1}
+
+
+def test_persistent_cache_and_ttl(tmp_path):
+    """
+    Tests that a new directory reuses persisted members until they expire.
+    """
+    api = FakeAPI()
+    clock = FakeClock()
+    cache_path = tmp_path / "members.json"
+    MemberDirectory(api, cache_path=cache_path, ttl=60, clock=clock).resolve(["m1"])
+
+    # Act: Resolve again from a new directory, before and after the TTL
+    reopened = MemberDirectory(api, cache_path=cache_path, ttl=60, clock=clock)
+    reopened.resolve(["m1", "m2"])
+    requests_before_expiry = api.board_requests
+    clock.now += 61
+    reopened.resolve(["m1"])
+
+    # Assert: Verify only the expired lookup went back to the API
+    assert requests_before_expiry == 1
+    assert api.board_requests == 2
+    assert reopened.get_stats()["hits"] == 2
+
+
+def test_add_members():
+    """
+    Tests that members added from a board snapshot resolve without requests.
+    """
+    api = FakeAPI()
+    directory = MemberDirectory(api, cache_path=None)
+    directory.add_members(BOARD_MEMBERS)
+
+    assert directory.get_full_names(["m1", "m2"]) == {"m1": "Ada Lovelace", "m2": "Alan Turing"}
+    assert api.board_requests == 0
@@ -0,0 +1,129 @@
+"""
+test_pipeline.py
+
+This module contains unit tests for the headless sprint pipeline. Fake Trello and database
+clients stand in for the live services, so no requests are sent and no config.json is needed.
+
+Tests:
+    - test_run_pipeline: Tests the results and stage timings of a full run.
+    - test_run_pipeline_without_db: Tests that nothing is forecast or stored without a database.
+    - test_run_pipeline_stage_error: Tests that a failing stage stops the run and is reported.
+    - test_get_board_job: Tests merging per-board overrides and command line controls.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from conftest import BOARD_CONFIG as SHARED_BOARD_CONFIG, BOARD_ID, FakeTrelloAPI, make_card
+from sprint_pipeline import STAGES, get_board_job, run_pipeline
+
+BOARD_CONFIG = {**SHARED_BOARD_CONFIG, "name": "Team board"}
+CARDS = [
+    make_card("c1", id_list="done", total=20, spent=20),
+    make_card("c2", id_list="done", labels=("UNPLANNED",), total=5, spent=4),
+    make_card("c3", labels=("RETRO",), total=3, spent=0),
+    {**make_card("calc", id_list="done"),
+     "desc": "SP Unplanned: 4(T) SP Unplanned: 6(T) SP Retro: 2(T)"}
+]
+
+
+class FakeDBManager:
+    """ Records inserted sprint summaries and stored snapshots """
+    def __init__(self):
+        self.summaries = []
+        self.snapshots = []
+
+    def get_sprint_summary_from_db(self, board_id):
+        """ Return one past sprint """
+        return [{"planned_completed": 20, "unplanned_completed": 4, "retro_completed": 1}]
+
+    def insert_data(self, table, insert_data):
+        """ Record the row and return its ID """
+        self.summaries.append((table, insert_data))
+        return len(self.summaries)
+
+    def store_board_snapshot(self, board_id, board_name, board_data):
+        """ Record the snapshot and return its ID """
+        self.snapshots.append((board_id, board_name, board_data))
+        return len(self.snapshots)
+
+
+def test_run_pipeline():
+    # Arrange
+    db_manager = FakeDBManager()
+    job = {
+        "sprint_controls": {"members": 4},
+        "corrections": {"planned": {"spent": 18}},
+        "store_snapshot": True
+    }
+
+    # Act
+    result = run_pipeline(
+        BOARD_CONFIG, job, sprint_db_manager=db_manager, trello_api=FakeTrelloAPI(CARDS))
+
+    # Assert
+    assert "error" not in result
+    assert list(result["timings"]) == [name for name, _ in STAGES]
+    assert result["story_points"]["planned"] == {"total": 20, "spent": 18, "remaining": 0}
+    assert result["sprint_controls"]["members"] == 4
+    # 18 + 4 + 0 spent, less the median unplanned (5) and retro (2) points
+    assert result["recommendation"] == 15
+    assert set(result["forecast"]["commitments"]) == {50, 80, 95}
+    assert (result["summary_id"], result["snapshot_id"]) == (1, 1)
+    assert db_manager.summaries[0][1]["planned_completed"] == 18
+    assert db_manager.snapshots[0][1] == "Team board"
+
+
+def test_run_pipeline_without_db():
+    # Act
+    result = run_pipeline(BOARD_CONFIG, {}, trello_api=FakeTrelloAPI(CARDS))
+
+    # Assert
+    assert result["recommendation"] == 17
+    assert result["forecast"] is None
+    assert (result["summary_id"], result["snapshot_id"]) == (None, None)
+
+
+def test_run_pipeline_stage_error():
+    # Arrange
+    job = {"corrections": {"planned": {"velocity": 3}}}
+
+    # Act
+    result = run_pipeline(BOARD_CONFIG, job, trello_api=FakeTrelloAPI(CARDS))
+
+    # Assert
+    assert result["error"]["stage"] == "calculate"
+    assert "planned.velocity" in result["error"]["message"]
+    assert list(result["timings"]) == ["fetch", "extract", "calculate"]
+    assert "recommendation" not in result
+
+
+def test_get_board_job():
+    # Arrange
+    job = {
+        "sprint_controls": {"members": 4, "next_sprint_days": 8},
+        "corrections": {"planned": {"spent": 18, "total": 20}},
+        "boards": {
+            "other": {"members": 9},
+            BOARD_ID: {
+                "sprint_controls": {"members": 6, "missed_next_sprint": 3},
+                "corrections": {"planned": {"spent": 19}, "retro": {"spent": 1}},
+                "store_snapshot": True
+            }
+        }
+    }
+
+    # Act
+    board_job = get_board_job(job, BOARD_ID, sprint_controls={"missed_next_sprint": 5})
+
+    # Assert
+    assert board_job["sprint_controls"] == {
+        "members": 6, "next_sprint_days": 8, "missed_next_sprint": 5}
+    assert board_job["corrections"] == {
+        "planned": {"spent": 19, "total": 20}, "retro": {"spent": 1}}
+    assert board_job["store_snapshot"] is True
+    assert job["corrections"]["planned"] == {"spent": 18, "total": 20}
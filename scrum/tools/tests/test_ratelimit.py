@@ -0,0 +1,99 @@
+"""
+test_ratelimit.py
+
+This module contains unit tests for the TokenBucket and RequestScheduler classes. A fake clock
+and fake responses stand in for time and the Trello API, so no requests are sent.
+
+Tests:
+    - test_bucket_queues_when_empty: Tests that an empty bucket hands out waits in order.
+    - test_bucket_sync_from_headers: Tests that response headers correct the bucket.
+    - test_retry_on_throttle: Tests that a 429 is retried after Retry-After and counted.
+    - test_retry_on_server_error: Tests that 5xx responses are retried until exhausted.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from trello.ratelimit import RequestScheduler, TokenBucket
+
+
+class FakeClock:
+    """ Monotonic clock that only advances when slept on """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        """ Advance the clock instead of sleeping """
+        self.now += seconds
+
+
+class FakeResponse:
+    """ Minimal stand-in for requests.Response """
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_bucket_queues_when_empty():
+    """ Verify reservations beyond capacity wait for tokens to refill """
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=2, interval=1.0, clock=clock)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    # Two tokens per second: the third and fourth requests queue behind each other
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+
+def test_bucket_sync_from_headers():
+    """ Verify rate limit headers lower the local token estimate """
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=100, interval=10.0, clock=clock)
+    scheduler = RequestScheduler({"api-token": bucket}, sleep=clock.sleep, clock=clock)
+    scheduler.observe({
+        "x-rate-limit-api-token-remaining": "0",
+        "x-rate-limit-api-token-max": "100",
+        "x-rate-limit-api-token-interval-ms": "10000"
+    })
+    assert bucket.reserve() == 0.1
+
+
+def test_retry_on_throttle():
+    """ Verify a 429 is retried after Retry-After and recorded in the metrics """
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=100, interval=10.0, clock=clock)
+    scheduler = RequestScheduler({"api-token": bucket}, sleep=clock.sleep, clock=clock)
+    responses = iter([FakeResponse(429, {"Retry-After": "3"}), FakeResponse(200)])
+
+    response = scheduler.send(lambda: next(responses))
+
+    assert response.status_code == 200
+    assert clock.now >= 3
+    metrics = scheduler.get_metrics()
+    assert metrics["requests"] == 2
+    assert metrics["retries"] == 1
+    assert metrics["throttled"] == 1
+    assert metrics["queued_time"] >= 3
+
+
+def test_retry_on_server_error():
+    """ Verify 5xx responses are retried up to max_retries and the last one is returned """
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=100, interval=10.0, clock=clock)
+    scheduler = RequestScheduler(
+        {"api-token": bucket}, max_retries=2, sleep=clock.sleep, clock=clock)
+
+    response = scheduler.send(lambda: FakeResponse(503))
+
+    assert response.status_code == 503
+    metrics = scheduler.get_metrics()
+    assert metrics["requests"] == 3
+    assert metrics["retries"] == 2
+    assert metrics["server_errors"] == 2
@@ -0,0 +1,155 @@
+"""
+test_snapshot.py
+
+This module contains unit tests for the snapshot encoding functions used to store board
+snapshots compressed and keyed by content.
+
+Tests:
+    - test_content_hash: Tests that the hash depends only on content, not key order.
+    - test_encode_decode_round_trip: Tests that each available codec round-trips board data.
+    - test_decode_rejects_unknown_data: Tests that data without a snapshot header is rejected.
+    - test_snapshot_reference: Tests building and recognizing stored snapshot references.
+    - test_diff_and_apply_delta: Tests that a delta rebuilds the new board from its parent.
+    - test_diff_cards_without_ids: Tests that boards without unique card IDs are not diffed.
+    - test_snapshot_cache: Tests LRU eviction and that cached snapshots are returned as copies.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from trello import snapshot
+from trello.snapshot import (SnapshotCache, apply_delta, content_hash, decode_snapshot,
+                             diff_cards, encode_snapshot, get_reference_hash, is_delta,
+                             snapshot_reference)
+
+
+@pytest.fixture
+def board_data():
+    """
+    Fixture to provide board data in the format returned by Board.get_data.
+
+    Returns:
+        list: Card dictionaries.
+    """
+    return [
+        {
+            "id": f"{i:024x}",
+            "title": f"Card {i}",
+            "labels": ["UNPLANNED"] if i % 3 == 0 else [],
+            "list_name": "Done" if i % 2 else "Doing",
+            "story_points": {"total": i % 5, "spent": i % 3, "remaining": 0}
+        }
+        for i in range(200)
+    ]
+
+
+def test_content_hash(board_data):
+    """
+    Tests that equal board data hashes equally whatever its key order.
+    """
+    reordered = [dict(reversed(list(card.items()))) for card in board_data]
+
+    assert content_hash(reordered) == content_hash(board_data)
+    assert content_hash(board_data[:-1]) != content_hash(board_data)
+
+
+def test_encode_decode_round_trip(board_data):
+    """
+    Tests that each available codec round-trips the board data and compresses it.
+    """
+    codecs = ["none", "zlib"] + (["zstd"] if snapshot.zstandard is not None else [])
+    raw_size = len(json.dumps(board_data))
+
+    for codec in codecs:
+        blob = encode_snapshot(board_data, codec=codec)
+
+        assert blob.startswith(snapshot.MAGIC)
+        assert decode_snapshot(blob) == board_data
+        if codec != "none":
+            assert len(blob) < raw_size / 4
+
+
+def test_decode_rejects_unknown_data(board_data):
+    """
+    Tests that data without a snapshot header, or with an unknown codec, is rejected.
+    """
+    with pytest.raises(ValueError):
+        decode_snapshot(json.dumps(board_data).encode("utf-8"))
+    with pytest.raises(ValueError):
+        decode_snapshot(snapshot.MAGIC + bytes([255]) + b"{}")
+    with pytest.raises(ValueError):
+        encode_snapshot(board_data, codec="lz4")
+
+
+def test_snapshot_reference(board_data):
+    """
+    Tests that references are recognized and inline board data is not mistaken for one.
+    """
+    snapshot_hash = content_hash(board_data)
+
+    assert get_reference_hash(json.loads(snapshot_reference(snapshot_hash))) == snapshot_hash
+    assert get_reference_hash(board_data) is None
+    assert get_reference_hash({"snapshot_hash": snapshot_hash, "cards": []}) is None
+
+
+def test_diff_and_apply_delta(board_data):
+    """
+    Tests that a delta covering added, removed, changed and reordered cards rebuilds the board.
+    """
+    # Arrange: Change, drop, add and reorder cards
+    new_cards = [dict(card) for card in board_data[1:]]
+    new_cards[0]["title"] = "Renamed"
+    del new_cards[1]["labels"]
+    new_cards.append({"id": "added", "title": "New card"})
+    new_cards[2], new_cards[3] = new_cards[3], new_cards[2]
+
+    # Act: Diff against the parent and apply the delta
+    delta = diff_cards(board_data, new_cards, "parent_hash", depth=1)
+    rebuilt = apply_delta(board_data, delta)
+
+    # Assert: Verify the delta is compact and rebuilds the board without touching the parent
+    assert is_delta(delta)
+    assert delta["removed"] == [board_data[0]["id"]]
+    assert delta["added"] == [{"id": "added", "title": "New card"}]
+    assert delta["changed"][new_cards[0]["id"]] == {"set": {"title": "Renamed"}}
+    assert delta["changed"][new_cards[1]["id"]] == {"set": {}, "unset": ["labels"]}
+    assert rebuilt == new_cards
+    assert content_hash(rebuilt) == content_hash(new_cards)
+    assert "labels" in board_data[2]
+
+
+def test_diff_cards_without_ids(board_data):
+    """
+    Tests that boards whose cards cannot be matched by ID are not diffed.
+    """
+    duplicated = board_data + [board_data[0]]
+
+    assert diff_cards(board_data, duplicated, "parent_hash", depth=1) is None
+    assert diff_cards([{"title": "No ID"}], board_data, "parent_hash", depth=1) is None
+    assert not is_delta(board_data)
+
+
+def test_snapshot_cache(board_data):
+    """
+    Tests that the cache evicts the least recently used snapshot and returns copies.
+    """
+    cache = SnapshotCache(max_entries=2)
+    cache.put("a", board_data, 0)
+    cache.put("b", board_data[:1], 1)
+
+    # Act: Use 'a', then add a third snapshot
+    cached_cards, depth = cache.get("a")
+    cached_cards[0]["title"] = "Modified"
+    cache.put("c", board_data[:2], 2)
+
+    # Assert: Verify 'b' was evicted and the cached copy of 'a' was not modified
+    assert cache.get("b") is None
+    assert cache.get("a") == (board_data, 0)
+    assert depth == 0
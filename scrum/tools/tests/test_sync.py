@@ -0,0 +1,130 @@
+"""
+test_sync.py
+
+This module contains unit tests for the BoardSync class and the apply_action function. A fake
+API client replays recorded-style board actions, so no requests are sent.
+
+Tests:
+    - test_apply_action: Tests that each action type updates the stored cards.
+    - test_sync_applies_actions: Tests that a sync replays new actions, fetches new cards and
+      refreshes the members.
+    - test_sync_resumes_from_disk: Tests that a new BoardSync continues from the saved state.
+    - test_sync_falls_back_to_full: Tests the full download when too many actions are pending.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from conftest import SP_TOTAL, FakeTrelloAPI, make_card
+from trello.sync import BoardSync, apply_action
+
+def action(action_id, action_type, card_id, **data):
+    """
+    Builds a Trello action.
+
+    Returns:
+        dict: The action.
+    """
+    card = data.pop("card", {})
+    return {"id": action_id, "type": action_type, "data": {"card": {"id": card_id, **card}, **data}}
+
+
+def make_api():
+    """
+    Builds a fake API serving a board of three cards with one story point each.
+
+    Returns:
+        FakeTrelloAPI: The fake API.
+    """
+    return FakeTrelloAPI([make_card(card_id, total=1) for card_id in ("c1", "c2", "c3")])
+
+
+def test_apply_action():
+    """
+    Tests that moves, label, member and custom field changes, archiving and deletion apply.
+    """
+    cards = {card_id: make_card(card_id) for card_id in ("c1", "c2", "c3")}
+    label = {"id": "l1", "name": "UNPLANNED"}
+
+    apply_action(cards, action("a1", "updateCard", "c1", card={"idList": "done"},
+                               old={"idList": "todo"}))
+    apply_action(cards, action("a2", "addLabelToCard", "c1", label=label))
+    apply_action(cards, action("a3", "addLabelToCard", "c1", label=label))
+    apply_action(cards, action("a4", "addMemberToCard", "c1", idMember="m1"))
+    apply_action(cards, action("a5", "updateCustomFieldItem", "c1",
+                               customFieldItem={"idCustomField": SP_TOTAL,
+                                                "value": {"number": "5"}}))
+    apply_action(cards, action("a6", "updateCard", "c2", card={"closed": True},
+                               old={"closed": False}))
+    apply_action(cards, action("a7", "deleteCard", "c3"))
+    needs_fetch = apply_action(cards, action("a8", "createCard", "c4"))
+
+    assert list(cards) == ["c1"]
+    assert cards["c1"]["idList"] == "done"
+    assert cards["c1"]["labels"] == [label]
+    assert cards["c1"]["idMembers"] == ["m1"]
+    assert cards["c1"]["customFieldItems"] == [
+        {"idCustomField": SP_TOTAL, "value": {"number": "5"}}]
+    assert needs_fetch == "c4"
+
+
+def test_sync_applies_actions(tmp_path):
+    """
+    Tests that a sync after the first one replays actions and fetches only created cards.
+    """
+    api = make_api()
+    api.actions.append(action("a0", "updateCard", "c1", card={"name": "Old"}, old={"name": ""}))
+    board_sync = BoardSync(api, state_dir=tmp_path)
+    board_sync.sync()
+
+    # Act: Move a card, create one, and sync again
+    api.cards["c1"]["idList"] = "done"
+    api.actions.append(action("a1", "updateCard", "c1", card={"idList": "done"},
+                              old={"idList": "todo"}))
+    api.cards["c4"] = make_card("c4", total=3)
+    api.actions.append(action("a2", "createCard", "c4"))
+    api.members.append({"id": "m1", "fullName": "New Member"})
+    api.calls.clear()
+    snapshot = board_sync.sync()
+
+    # Assert: Verify the synced cards and members match a full download with two small requests
+    assert api.calls == ["changes", "cards"]
+    assert snapshot["cards"] == api.get_board_snapshot()["cards"]
+    assert snapshot["members"] == [{"id": "m1", "fullName": "New Member"}]
+
+
+def test_sync_resumes_from_disk(tmp_path):
+    """
+    Tests that a new BoardSync continues from the state saved by the previous one.
+    """
+    api = make_api()
+    BoardSync(api, state_dir=tmp_path).sync()
+    api.actions.append(action("a1", "deleteCard", "c2"))
+    del api.cards["c2"]
+    api.calls.clear()
+
+    snapshot = BoardSync(api, state_dir=tmp_path).sync()
+
+    assert api.calls == ["changes"]
+    assert [card["id"] for card in snapshot["cards"]] == ["c1", "c3"]
+
+
+def test_sync_falls_back_to_full(tmp_path):
+    """
+    Tests that the board is downloaded in full when more actions are pending than fit a request.
+    """
+    api = make_api()
+    board_sync = BoardSync(api, state_dir=tmp_path, action_limit=2)
+    board_sync.sync()
+    for i in range(3):
+        api.actions.append(action(f"a{i}", "addMemberToCard", "c1", idMember=f"m{i}"))
+    api.cards["c1"]["idMembers"] = ["m0", "m1", "m2"]
+
+    snapshot = board_sync.sync()
+
+    assert board_sync.stats["full_syncs"] == 2
+    assert snapshot["cards"][0]["idMembers"] == ["m0", "m1", "m2"]
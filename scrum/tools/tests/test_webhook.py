@@ -0,0 +1,204 @@
+"""
+test_webhook.py
+
+This module contains unit tests for the LiveBoard class and the webhook HTTP service. Recorded
+webhook payloads are replayed against a board built in memory, so no requests are sent to
+Trello.
+
+Tests:
+    - test_replay_matches_board: Tests that replayed totals match a board built from the result.
+    - test_list_rename: Tests that renaming a list moves its cards' remaining points.
+    - test_created_card_fetched: Tests that created cards are fetched through the API.
+    - test_webhook_server: Tests the HEAD, POST and GET endpoints and signature checks.
+"""
+
+import base64
+import copy
+import hashlib
+import hmac
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from conftest import BOARD_CONFIG, BOARD_ID, LISTS, SP_SPENT, SP_TOTAL, FakeTrelloAPI, make_card
+from trello.board import Board
+from trello.webhook import LiveBoard, make_server, replay
+
+
+def make_board(cards):
+    """
+    Builds a board from snapshot cards without any API.
+
+    Returns:
+        Board: The board.
+    """
+    cards = copy.deepcopy(cards)
+    return Board(None, board_data=cards, lists=copy.deepcopy(LISTS), custom_fields_data=cards,
+                 board_config=BOARD_CONFIG)
+
+
+def payload(action_type, card_id, **data):
+    """
+    Builds a webhook payload as Trello sends it.
+
+    Returns:
+        dict: The payload.
+    """
+    card = data.pop("card", {})
+    return {
+        "model": {"id": BOARD_ID},
+        "action": {
+            "type": action_type,
+            "data": {"board": {"id": BOARD_ID}, "card": {"id": card_id, **card}, **data}
+        }
+    }
+
+
+CARDS = [
+    make_card("c1", total=5, spent=2),
+    make_card("c2", id_list="doing", labels=("UNPLANNED",), total=3, spent=4),
+    make_card("c3", labels=("RETRO",), total=2, spent=0),
+    make_card("c4", id_list="done", total=1, spent=1)
+]
+
+PAYLOADS = [
+    # Move c1 to Done
+    payload("updateCard", "c1", card={"idList": "done"}, old={"idList": "todo"}),
+    # Log more spent points on c3, turning it from retro to planned
+    payload("updateCustomFieldItem", "c3",
+            customFieldItem={"idCustomField": SP_SPENT, "value": {"number": "1"}}),
+    # Mark c4 unplanned
+    payload("addLabelToCard", "c4", label={"id": "UNPLANNED", "name": "UNPLANNED"}),
+    # Drop the unplanned label from c2
+    payload("removeLabelFromCard", "c2", label={"id": "UNPLANNED", "name": "UNPLANNED"}),
+    # Archive c4 again after the label change
+    payload("updateCard", "c4", card={"closed": True}, old={"closed": False}),
+    # Clear c1's total points
+    payload("updateCustomFieldItem", "c1",
+            customFieldItem={"idCustomField": SP_TOTAL, "value": None})
+]
+
+
+def expected_calcs(cards):
+    """
+    Calculates totals the way Board does for a fresh board.
+
+    Returns:
+        dict: The board totals.
+    """
+    board = make_board(cards)
+    board.extract_cards()
+    return board.calculate_story_points()
+
+
+def test_replay_matches_board():
+    # Arrange
+    live_board = LiveBoard(make_board(CARDS))
+    initial_calcs = live_board.get_calcs()
+
+    # Act
+    calcs = replay(live_board, PAYLOADS)
+
+    # Assert
+    assert initial_calcs == expected_calcs(CARDS)
+    final_cards = copy.deepcopy(CARDS)
+    final_cards[0]["idList"] = "done"
+    final_cards[0]["customFieldItems"] = final_cards[0]["customFieldItems"][1:]
+    final_cards[1]["labels"] = []
+    final_cards[2]["customFieldItems"][1]["value"] = {"number": "1"}
+    del final_cards[3]
+    assert calcs == expected_calcs(final_cards)
+    assert live_board.get_stats() == {"cards": 3, "actions_applied": len(PAYLOADS)}
+
+
+def test_list_rename():
+    # Arrange
+    live_board = LiveBoard(make_board(CARDS))
+    remaining = live_board.get_calcs()["planned"]["remaining"]
+
+    # Act
+    live_board.apply_action(
+        {"type": "updateList", "data": {"list": {"id": "todo", "name": "Done"}}})
+
+    # Assert
+    # c1 had 3 points remaining; c3 is retro and unaffected by the list name alone
+    assert live_board.get_calcs()["planned"]["remaining"] == remaining - 3
+    assert {card.get_list_name() for card in live_board.get_cards()} == {"Done", "Doing"}
+
+
+def test_created_card_fetched():
+    # Arrange
+    new_card = make_card("c5", labels=("UNPLANNED",), total=8, spent=1)
+    reads_blocked = []
+
+    def read_during_fetch():
+        # Reads must not wait for the fetch to finish
+        reader = threading.Thread(target=live_board.get_calcs)
+        reader.start()
+        reader.join(timeout=5)
+        reads_blocked.append(reader.is_alive())
+
+    api = FakeTrelloAPI([new_card], on_fetch=read_during_fetch)
+    live_board = LiveBoard(make_board(CARDS), api=api)
+
+    # Act
+    calcs = replay(live_board, [payload("createCard", "c5", card={"name": "Card c5"},
+                                        list={"id": "todo"})])
+
+    # Assert
+    assert api.requested == ["c5"]
+    assert reads_blocked == [False]
+    assert calcs == expected_calcs(CARDS + [new_card])
+
+
+def test_webhook_server():
+    # Arrange
+    secret = "secret"
+    callback_url = "https://example.com/trello"
+    live_board = LiveBoard(make_board(CARDS))
+    server = make_server(live_board, port=0, secret=secret, callback_url=callback_url)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    body = json.dumps(PAYLOADS[0]).encode("utf-8")
+
+    def sign(data):
+        return base64.b64encode(hmac.new(
+            secret.encode("utf-8"), data + callback_url.encode("utf-8"), hashlib.sha1
+        ).digest()).decode("ascii")
+
+    def post(headers, data=body):
+        request = urllib.request.Request(base_url, data=data, headers=headers, method="POST")
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status
+        except urllib.error.HTTPError as error:
+            return error.code
+
+    try:
+        # Act
+        with urllib.request.urlopen(urllib.request.Request(base_url, method="HEAD")) as response:
+            head_status = response.status
+        rejected_status = post({"X-Trello-Webhook": "invalid"})
+        accepted_status = post({"X-Trello-Webhook": sign(body)})
+        non_object_status = post({"X-Trello-Webhook": sign(b"[1, 2]")}, data=b"[1, 2]")
+        with urllib.request.urlopen(f"{base_url}/calcs") as response:
+            result = json.load(response)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Assert
+    assert (head_status, rejected_status, accepted_status) == (200, 401, 200)
+    assert non_object_status == 400
+    assert result["actions_applied"] == 1
+    assert result["calcs"] == live_board.get_calcs()
+    expected_remaining = expected_calcs(CARDS)["planned"]["remaining"] - 3
+    assert result["calcs"]["planned"]["remaining"] == expected_remaining
@@ -0,0 +1,87 @@
+"""
+test_whatif.py
+
+This module contains unit tests for the what-if grid of sprint controls, ensuring that every
+scenario matches the single scenario recommendation.
+
+Tests:
+    - test_parse_range: Tests parsing single values, ranges, steps and lists.
+    - test_evaluate_grid: Tests the grid against sprint_math.recommend_story_points.
+    - test_format_grid: Tests the compact table layout.
+"""
+
+import itertools
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from sprint_math import recommend_story_points
+from sprint_whatif import CONTROL_NAMES, evaluate_grid, format_grid, parse_range
+
+STORY_POINTS = {
+    "planned": {"spent": 30},
+    "unplanned": {"spent": 6},
+    "retro": {"spent": 4}
+}
+UNPLANNED_PAST_SPRINTS = [5, 8, 3, 6]
+RETRO_PAST_SPRINTS = [2, 4, 1]
+
+
+def test_parse_range():
+    # Act / Assert
+    assert parse_range("8") == [8]
+    assert parse_range("8-10") == [8, 9, 10]
+    assert parse_range("0-10:5") == [0, 5, 10]
+    assert parse_range("6, 8-9,8") == [6, 8, 9]
+    for invalid in ("10-8", "1-5:0", "a"):
+        with pytest.raises(ValueError):
+            parse_range(invalid)
+
+
+def test_evaluate_grid():
+    # Arrange
+    control_ranges = {
+        "last_sprint_days": [8, 10],
+        "next_sprint_days": [8, 10, 12],
+        "missed_next_sprint": [0, 3, 7],
+        "members": [5, 6, 7, 8]
+    }
+
+    # Act
+    grid = evaluate_grid(STORY_POINTS, UNPLANNED_PAST_SPRINTS, RETRO_PAST_SPRINTS,
+                         control_ranges, base_controls={"missed_last_sprint": 2})
+
+    # Assert
+    recommendations = grid["recommendations"]
+    assert recommendations.shape == (2, 3, 1, 3, 4)
+    for index in itertools.product(*(range(size) for size in recommendations.shape)):
+        sprint_controls = {
+            name: int(grid["axes"][name][position])
+            for name, position in zip(CONTROL_NAMES, index)
+        }
+        assert recommendations[index] == recommend_story_points(
+            STORY_POINTS, UNPLANNED_PAST_SPRINTS, RETRO_PAST_SPRINTS, sprint_controls)
+    with pytest.raises(ValueError):
+        evaluate_grid(STORY_POINTS, UNPLANNED_PAST_SPRINTS, RETRO_PAST_SPRINTS, {"members": [0]})
+
+
+def test_format_grid():
+    # Arrange
+    grid = evaluate_grid(STORY_POINTS, UNPLANNED_PAST_SPRINTS, RETRO_PAST_SPRINTS,
+                         {"missed_next_sprint": [0, 8], "members": [4, 8]})
+
+    # Act
+    table = format_grid(grid)
+
+    # Assert
+    assert table.splitlines() == [
+        "Fixed: last_sprint_days=10, next_sprint_days=10, missed_last_sprint=0",
+        "missed_next_sprint members:  4  8",
+        "                 0          33 33",
+        "                 8          31 32"
+    ]
@@ -0,0 +1,109 @@
+"""
+test_writeback.py
+
+This module contains unit tests for writing story points back to Trello. A fake Trello API
+records the writes and fails on demand, so no requests are sent and no config.json is needed.
+
+Tests:
+    - test_diff_story_points: Tests that only changed or unset fields are selected.
+    - test_write: Tests the per-card report of a write with every outcome.
+    - test_write_retries: Tests that transient failures are retried and client errors are not.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+# Add the parent directory to the Python path
+parent_path = Path(__file__).parent.parent
+sys.path.append(str(parent_path))
+
+from conftest import BOARD_CONFIG, FakeTrelloAPI, make_card
+from trello.writeback import StoryPointWriter, diff_story_points
+
+
+def http_error(status_code):
+    """
+    Builds the error raise_for_status() raises for a status code.
+
+    Returns:
+        requests.exceptions.HTTPError: The error.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.exceptions.HTTPError(f"{status_code} Error", response=response)
+
+
+def test_diff_story_points():
+    # Arrange
+    cards = [make_card("c1", total=5, spent=3), make_card("c2", total=5, spent=3), make_card("c3")]
+    desired = {
+        "c1": {"total": 5, "spent": 3},
+        "c2": {"total": 8, "spent": 3},
+        "c3": {"spent": 0},
+        "c4": {"total": 1}
+    }
+
+    # Act
+    changes = diff_story_points(cards, desired, "sp_total", "sp_spent")
+
+    # Assert
+    assert changes == {"c2": {"sp_total": 8}, "c3": {"sp_spent": 0}}
+    with pytest.raises(ValueError):
+        diff_story_points(cards, {"c1": {"remaining": 2}}, "sp_total", "sp_spent")
+
+
+def test_write():
+    # Arrange
+    api = FakeTrelloAPI(
+        [make_card(card_id, total=total, spent=spent)
+         for card_id, total, spent in (("c1", 5, 3), ("c2", 5, 3), ("c3", 2, 0))],
+        errors={"c3": [http_error(400)]}
+    )
+    writer = StoryPointWriter(api, BOARD_CONFIG, sleep=lambda seconds: None)
+    desired = {
+        "c1": {"total": 5, "spent": 3},
+        "c2": {"total": 8, "spent": 5},
+        "c3": {"spent": 1},
+        "c4": {"total": 1}
+    }
+
+    # Act
+    report = writer.write(desired)
+
+    # Assert
+    assert (report["updated"], report["unchanged"], report["failed"], report["missing"]) \
+        == (1, 1, 1, 1)
+    results = report["cards"]
+    assert list(results) == ["c1", "c2", "c3", "c4"]
+    assert results["c1"]["status"] == "unchanged"
+    assert results["c2"] == {"status": "updated", "fields": {"sp_total": 8, "sp_spent": 5},
+                             "attempts": 1, "error": None}
+    assert results["c3"]["status"] == "failed"
+    assert "400" in results["c3"]["error"]
+    assert results["c4"]["status"] == "missing"
+    assert sorted(card_id for card_id, _ in api.writes) == ["c2", "c3"]
+
+
+def test_write_retries():
+    # Arrange
+    cards = [make_card("c1", total=1, spent=0), make_card("c2", total=1, spent=0)]
+    api = FakeTrelloAPI(cards, errors={
+        "c1": [requests.exceptions.ConnectionError("reset"), http_error(503)],
+        "c2": [requests.exceptions.Timeout("slow")] * 3
+    })
+    delays = []
+    writer = StoryPointWriter(api, BOARD_CONFIG, max_attempts=3, sleep=delays.append)
+
+    # Act
+    report = writer.write({"c1": {"spent": 1}, "c2": {"spent": 1}}, cards=cards)
+
+    # Assert
+    assert report["cards"]["c1"]["status"] == "updated"
+    assert report["cards"]["c1"]["attempts"] == 3
+    assert report["cards"]["c2"]["status"] == "failed"
+    assert report["cards"]["c2"]["attempts"] == 3
+    assert "Timeout" in report["cards"]["c2"]["error"]
+    assert len(delays) == 4
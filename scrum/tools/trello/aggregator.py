@@ -0,0 +1,166 @@
+"""
+aggregator.py
+
+This module contains the `StoryPointAggregator` class, which keeps a board's story point totals
+from the contribution of each card.
+
+Each card's contribution to the planned, unplanned and retro categories is remembered, so adding,
+updating or removing a card moves the totals by the difference alone. Recalculating is
+therefore idempotent, and costs only as many updates as there are changed cards.
+
+Classes:
+    - StoryPointAggregator: Tracks per-card contributions to the board's story point totals.
+
+Functions:
+    - story_point_contribution: Computes what one card adds to each story point category.
+
+Example Usage:
+    aggregator = StoryPointAggregator()
+    aggregator.update_all(board.get_cards())
+    aggregator.update(changed_card)
+    calcs = aggregator.get_calcs()
+"""
+
+CATEGORIES = ("unplanned", "planned", "retro")
+
+
+def story_point_contribution(card):
+    """
+    Computes how much one card adds to each story point category of the board totals.
+
+    Args:
+        card (Card): The card.
+
+    Returns:
+        dict: Points added to 'total', 'spent' and 'remaining', keyed by each category the
+            card counts towards.
+    """
+    labels = set(card.get_labels())
+    list_name = card.get_list_name()
+
+    is_unplanned = 'UNPLANNED' in labels
+    is_retro = 'RETRO' in labels
+    is_done = 'Done' in list_name
+
+    total_points = card.get_total_story_points()
+    spent_points = card.get_spent_story_points()
+    remaining_points = card.get_remaining_story_points()
+
+    # Determine category
+    if is_unplanned:
+        category = 'unplanned'
+    elif is_retro and not (is_done or spent_points > 0):
+        category = 'retro'
+    else:
+        category = 'planned'
+
+    # Update total points
+    contribution = {category: {"total": total_points, "spent": 0, "remaining": 0}}
+
+    # Calculate actual spent and extra spent points
+    if category in ('planned', 'unplanned'):
+        actual_spent = min(spent_points, total_points)
+        extra_spent = max(spent_points - total_points, 0)
+        contribution[category]['spent'] = actual_spent
+        if extra_spent:
+            contribution['retro'] = {"total": extra_spent, "spent": extra_spent, "remaining": 0}
+    else:
+        contribution[category]['spent'] = spent_points
+
+    # Update remaining points if card is not done
+    if not is_done:
+        contribution[category]['remaining'] = remaining_points
+
+    return contribution
+
+
+class StoryPointAggregator:
+    """
+    Initializes a StoryPointAggregator with no cards.
+
+    The aggregator is not thread-safe; callers sharing one between threads must lock around it.
+    """
+    def __init__(self):
+        self._contributions = {}
+        self._calcs = {
+            category: {"total": 0, "spent": 0, "remaining": 0} for category in CATEGORIES
+        }
+
+    def __len__(self):
+        return len(self._contributions)
+
+    def __contains__(self, card_id):
+        return card_id in self._contributions
+
+    def _add(self, contribution, sign):
+        """
+        Adds a contribution to the totals, or removes it.
+
+        Args:
+            contribution (dict): Result of story_point_contribution().
+            sign (int): 1 to add the contribution, -1 to remove it.
+        """
+        for category, values in contribution.items():
+            for key, value in values.items():
+                self._calcs[category][key] += sign * value
+
+    def update(self, card):
+        """
+        Adds a card, or replaces the contribution of a card already counted.
+
+        Args:
+            card (Card): The card in its current state.
+
+        Returns:
+            bool: True if the totals changed.
+        """
+        card_id = card.get_card_id()
+        contribution = story_point_contribution(card)
+        previous = self._contributions.get(card_id)
+        if contribution == previous:
+            return False
+        if previous is not None:
+            self._add(previous, -1)
+        self._add(contribution, 1)
+        self._contributions[card_id] = contribution
+        return True
+
+    def remove(self, card_id):
+        """
+        Removes a card's contribution from the totals.
+
+        Args:
+            card_id (str): The card ID.
+
+        Returns:
+            bool: True if the card was counted.
+        """
+        previous = self._contributions.pop(card_id, None)
+        if previous is None:
+            return False
+        self._add(previous, -1)
+        return True
+
+    def update_all(self, cards):
+        """
+        Makes the totals those of exactly the given cards, removing any card not among them.
+
+        Args:
+            cards (iterable of Card): Every card of the board in its current state.
+        """
+        seen = set()
+        for card in cards:
+            self.update(card)
+            seen.add(card.get_card_id())
+        for card_id in [card_id for card_id in self._contributions if card_id not in seen]:
+            self.remove(card_id)
+
+    def get_calcs(self):
+        """
+        Returns the story point totals.
+
+        Returns:
+            dict: A dictionary with story points for 'planned', 'unplanned', and 'retro'
+                categories.
+        """
+        return {category: dict(values) for category, values in self._calcs.items()}
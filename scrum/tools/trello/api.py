@@ -4,12 +4,35 @@ api.py
 This module contains the `TrelloAPI` class, which handles interactions with the Trello API,
 including fetching board and card data, retrieving story points, and deleting cards.
 
+All requests made by a `TrelloAPI` instance share one pooled `requests.Session`, so repeated
+calls to api.trello.com reuse kept-alive connections instead of paying a new TCP + TLS
+handshake each time. Requests are also queued through a shared `RequestScheduler` so they stay
+within Trello's rate limits, and throttled or failed requests are retried with backoff.
+
+Passing a `ResponseCache` enables caching of GET responses on disk: fresh entries are served
+without a request, and expired ones are revalidated with ETag/If-Modified-Since where Trello
+returns those headers.
+
 Classes:
     - TrelloAPI: Manages API requests to Trello.
+
+Example Usage:
+    with TrelloAPI(board_id, api_key, api_token) as trello_api:
+        cards = trello_api.get_board_cards()
+        lists = trello_api.get_board_lists()
+        print(trello_api.get_connection_stats())
+        print(trello_api.get_rate_limit_metrics())
 """
 
 import json
+import threading
+from urllib.parse import urlencode
 import requests
+from requests.adapters import HTTPAdapter
+from trello.ratelimit import get_scheduler
+
+# Most routes Trello accepts in a single /batch request
+BATCH_SIZE = 10
 
 class TrelloAPI:
     """
@@ -19,19 +42,148 @@ class TrelloAPI:
         board_id (str): The ID of the Trello board.
         api_key (str): Your Trello API key.
         api_token (str): Your Trello API token.
+        pool_connections (int, optional): Number of per-host connection pools to cache.
+            Defaults to 4.
+        pool_maxsize (int, optional): Maximum number of connections kept open per host.
+            Defaults to 10.
+        pool_block (bool, optional): Block when all connections to a host are in use instead
+            of opening an extra, unpooled connection. Defaults to False.
+        keep_alive (bool, optional): Keep connections open between requests. Defaults to True.
+        gzip (bool, optional): Ask Trello for gzip-compressed responses. Defaults to True.
+        timeout (int, optional): Request timeout in seconds. Defaults to 60.
+        scheduler (RequestScheduler, optional): Rate limit scheduler to queue requests through.
+            Defaults to the scheduler shared by all clients using the same key and token.
+        cache (ResponseCache, optional): Cache for GET responses. Defaults to None (no caching).
     """
-    def __init__(self, board_id, api_key, api_token):
+    def __init__(
+            self,
+            board_id,
+            api_key,
+            api_token,
+            pool_connections=4,
+            pool_maxsize=10,
+            pool_block=False,
+            keep_alive=True,
+            gzip=True,
+            timeout=60,
+            scheduler=None,
+            cache=None):
         self.board_id = board_id
         self.api_key = api_key
         self.api_token = api_token
         self.base_url = "https://api.trello.com/1"
+        self.timeout = timeout
+        self.scheduler = scheduler or get_scheduler(api_key, api_token)
+        self.cache = cache
+
+        # Build a session shared by every request this instance makes
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Accept-Encoding"] = "gzip, deflate" if gzip else "identity"
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+        # Connection pools seen so far, used to count new vs. reused connections
+        self._pools = {}
+        self._pools_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the session and every pooled connection it holds."""
+        self.session.close()
+
+    def get_connection_stats(self):
+        """Summarizes connection reuse across all requests made by this instance.
+
+        Returns:
+            dict: Counts of 'requests', 'new_connections' and 'reused_connections'.
+        """
+        with self._pools_lock:
+            pools = list(self._pools.values())
+        total_requests = sum(pool.num_requests for pool in pools)
+        new_connections = sum(pool.num_connections for pool in pools)
+        return {
+            "requests": total_requests,
+            "new_connections": new_connections,
+            "reused_connections": max(total_requests - new_connections, 0)
+        }
+
+    def get_rate_limit_metrics(self):
+        """Reports how requests fared against the rate limits.
+
+        The metrics belong to the scheduler, so they cover every client sharing it.
+
+        Returns:
+            dict: Request, retry, throttled and server error counts plus queued seconds.
+        """
+        return self.scheduler.get_metrics()
 
-    def request_call(self, url, have_headers):
-        """Makes a GET request to the specified URL using the requests library.
+    def get_cache_stats(self):
+        """Reports response cache hits, misses and size.
+
+        Returns:
+            dict or None: The cache statistics, or None when caching is disabled.
+        """
+        return self.cache.get_stats() if self.cache is not None else None
+
+    def _request(self, method, url, params=None, headers=None, data=None):
+        """Sends an authenticated request through the pooled session and rate limit scheduler.
+
+        Args:
+            method (str): HTTP method, e.g. 'GET' or 'PUT'.
+            url (str): The URL to send the request to.
+            params (dict, optional): Query parameters added to the key and token.
+            headers (dict, optional): Request headers.
+            data (str, optional): Request body.
+
+        Returns:
+            requests.Response: The response from the API.
+        """
+        query = {
+            'key': self.api_key,
+            'token': self.api_token
+        }
+        if params:
+            query.update(params)
+
+        response = self.scheduler.send(
+            lambda: self.session.request(
+                method,
+                url,
+                params=query,
+                headers=headers,
+                data=data,
+                timeout=self.timeout
+            )
+        )
+        # Remember the pool that served this request so its counters can be reported
+        pool = getattr(response.raw, "_pool", None)
+        if pool is not None:
+            with self._pools_lock:
+                self._pools.setdefault(id(pool), pool)
+        return response
+
+    def request_call(self, url, have_headers, params=None):
+        """Makes a GET request to the specified URL using the pooled session.
+
+        With a cache, fresh cached responses are returned without a request and expired ones
+        are revalidated when they carry validators.
 
         Args:
             url (str): The URL to make the GET request to.
             have_headers (bool): Specifies if the request should include headers.
+            params (dict, optional): Additional query parameters.
 
         Returns:
             dict or list: The JSON response from the API.
@@ -40,18 +192,22 @@ class TrelloAPI:
             requests.exceptions.HTTPError: If the HTTP request returned an unsuccessful status code.
         """
         headers = {"Accept": "application/json"} if have_headers else {}
-        query = {
-            'key': self.api_key,
-            'token': self.api_token
-        }
+        if self.cache is None:
+            response = self._request("GET", url, params=params, headers=headers)
+            response.raise_for_status()
+            return response.json()
 
-        response = requests.get(
-            url,
-            params=query,
-            headers=headers,
-            timeout=60
-        )
+        entry = self.cache.lookup("GET", url, params)
+        if entry is not None:
+            if entry.is_fresh(self.cache.clock()):
+                return entry.json()
+            headers.update(entry.get_validators())
+        response = self._request("GET", url, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidated(entry)
+            return entry.json()
         response.raise_for_status()
+        self.cache.store("GET", url, params, response.text, response.headers)
         return response.json()
 
     def put_call(self, card_id, custom_field_id, value):
@@ -61,57 +217,247 @@ class TrelloAPI:
             card_id (str): ID of the target card
             custom_field_id (str): ID of the target custom field
             value (int): value to push to the custom field
+
+        Returns:
+            dict: The updated custom field item.
+
+        Raises:
+            requests.exceptions.HTTPError: If the HTTP request returned an unsuccessful status code.
         """
         # Define api endpoint to update custom field on the given card
-        url = f"https://api.trello.com/1/cards/{card_id}/customField/{custom_field_id}/item"
+        url = f"{self.base_url}/cards/{card_id}/customField/{custom_field_id}/item"
         # Set connection parameters
         headers = {
             "Content-Type": "application/json"
         }
-        query = {
-            'key': self.api_key,
-            'token': self.api_token
-        }
         payload = json.dumps({
             "value": {
                 "number": str(value)
             }
         })
         # Execute request
-        response = requests.request(
-            "PUT",
-            url,
-            data=payload,
-            headers=headers,
-            params=query,
-            timeout=60
-        )
-        # Print reason on http failure
-        try:
-            response.raise_for_status()
-        except:
-            print(response.reason)
+        response = self._request("PUT", url, headers=headers, data=payload)
+        response.raise_for_status()
+        return response.json()
+
+    def put_custom_fields(self, card_id, values):
+        """Updates several number custom fields on a card in a single PUT request.
+
+        Args:
+            card_id (str): ID of the target card.
+            values (dict): Values to push, keyed by custom field ID.
+
+        Returns:
+            dict or list: The JSON response from the API.
+
+        Raises:
+            requests.exceptions.HTTPError: If the HTTP request returned an unsuccessful status code.
+        """
+        url = f"{self.base_url}/cards/{card_id}/customFields"
+        headers = {
+            "Content-Type": "application/json"
+        }
+        payload = json.dumps({
+            "customFieldItems": [
+                {"idCustomField": custom_field_id, "value": {"number": str(value)}}
+                for custom_field_id, value in values.items()
+            ]
+        })
+        response = self._request("PUT", url, headers=headers, data=payload)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _fields_params(fields, param="fields"):
+        """Builds the query parameter projecting a response onto the given fields.
+
+        Args:
+            fields (tuple of str or None): Fields to return; None keeps Trello's defaults.
+            param (str, optional): Name of the query parameter. Defaults to 'fields'.
+
+        Returns:
+            dict: The query parameter, or an empty dict when fields is None.
+        """
+        if fields is None:
+            return {}
+        return {param: ",".join(fields)}
 
-    def get_board_cards(self):
+    def get_board_cards(self, fields=None):
         """Retrieves all cards from the Trello board.
 
+        Args:
+            fields (tuple of str, optional): Card fields to return. Defaults to all fields.
+
         Returns:
             list: A list of card dictionaries from the board.
         """
         cards_url = f"{self.base_url}/boards/{self.board_id}/cards"
-        sprint_cards = self.request_call(url=cards_url, have_headers=False)
+        sprint_cards = self.request_call(
+            url=cards_url, have_headers=False, params=self._fields_params(fields))
         return sprint_cards
 
-    def get_board_lists(self):
+    def get_board_lists(self, fields=None):
         """Retrieves all lists from the Trello board.
 
+        Args:
+            fields (tuple of str, optional): List fields to return. Defaults to all fields.
+
         Returns:
             list: A list of list dictionaries from the board.
         """
         lists_url = f"{self.base_url}/boards/{self.board_id}/lists"
-        sprint_lists = self.request_call(url=lists_url, have_headers=False)
+        sprint_lists = self.request_call(
+            url=lists_url, have_headers=False, params=self._fields_params(fields))
         return sprint_lists
 
+    def get_board_snapshot(self, card_fields=None, list_fields=None, member_fields=None):
+        """Retrieves the board's cards, lists and members in a single request.
+
+        Trello nests the cards (with their customFieldItems), open lists and members in the
+        board resource, so this replaces separate calls to get_board_cards, get_board_lists
+        and get_custom_fields_data.
+
+        Args:
+            card_fields (tuple of str, optional): Card fields to return. Defaults to all fields.
+            list_fields (tuple of str, optional): List fields to return. Defaults to all fields.
+            member_fields (tuple of str, optional): Member fields to return.
+                Defaults to Trello's default member fields.
+
+        Returns:
+            dict: The board with nested 'cards', 'lists' and 'members' lists.
+        """
+        board_url = f"{self.base_url}/boards/{self.board_id}"
+        params = {
+            "fields": "id,name",
+            "cards": "visible",
+            "card_customFieldItems": "true",
+            "lists": "open",
+            "members": "all",
+            **self._fields_params(card_fields, "card_fields"),
+            **self._fields_params(list_fields, "list_fields"),
+            **self._fields_params(member_fields, "member_fields")
+        }
+        return self.request_call(url=board_url, have_headers=True, params=params)
+
+    def _card_params(self, fields, custom_field_items):
+        """Builds the query parameters of a card request.
+
+        Args:
+            fields (tuple of str or None): Card fields to return; None keeps all fields.
+            custom_field_items (bool): Include the card's customFieldItems.
+
+        Returns:
+            dict: The query parameters.
+        """
+        params = self._fields_params(fields)
+        if custom_field_items:
+            params["customFieldItems"] = "true"
+        return params
+
+    def get_card(self, card_id, fields=None, custom_field_items=False):
+        """Retrieves a single card.
+
+        Args:
+            card_id (str): The card ID or shortLink.
+            fields (tuple of str, optional): Card fields to return. Defaults to all fields.
+            custom_field_items (bool, optional): Include the card's customFieldItems.
+                Defaults to False.
+
+        Returns:
+            dict: The card.
+
+        Raises:
+            requests.exceptions.HTTPError: If the card does not exist or cannot be accessed.
+        """
+        url = f"{self.base_url}/cards/{card_id}"
+        return self.request_call(
+            url=url, have_headers=True, params=self._card_params(fields, custom_field_items))
+
+    def get_cards_batch(self, card_ids, fields=None, custom_field_items=False):
+        """Retrieves up to BATCH_SIZE cards in a single request through Trello's batch endpoint.
+
+        Args:
+            card_ids (list of str): Card IDs or shortLinks, at most BATCH_SIZE of them.
+            fields (tuple of str, optional): Card fields to return. Defaults to all fields.
+            custom_field_items (bool, optional): Include each card's customFieldItems.
+                Defaults to False.
+
+        Returns:
+            dict: Cards keyed by the requested ID; None for cards that could not be retrieved.
+
+        Raises:
+            ValueError: If more than BATCH_SIZE cards are requested.
+        """
+        card_ids = list(card_ids)
+        if len(card_ids) > BATCH_SIZE:
+            raise ValueError(f"At most {BATCH_SIZE} cards can be requested per batch.")
+        if not card_ids:
+            return {}
+        # Routes are comma-separated, so commas inside a route must stay percent-encoded
+        query = urlencode(self._card_params(fields, custom_field_items))
+        routes = [f"/cards/{card_id}" + (f"?{query}" if query else "") for card_id in card_ids]
+        results = self.request_call(
+            url=f"{self.base_url}/batch", have_headers=True, params={"urls": ",".join(routes)})
+        # Each result is {"200": card} on success, or an error object
+        return {
+            card_id: result.get("200") if isinstance(result, dict) else None
+            for card_id, result in zip(card_ids, results)
+        }
+
+    def get_cards(self, card_ids, fields=None, custom_field_items=False):
+        """Retrieves many cards with one batch request per BATCH_SIZE cards.
+
+        Args:
+            card_ids (list of str): Card IDs or shortLinks.
+            fields (tuple of str, optional): Card fields to return. Defaults to all fields.
+            custom_field_items (bool, optional): Include each card's customFieldItems.
+                Defaults to False.
+
+        Returns:
+            dict: Cards keyed by the requested ID, in request order; None for cards that
+                could not be retrieved.
+        """
+        card_ids = list(dict.fromkeys(card_ids))
+        cards = {}
+        for start in range(0, len(card_ids), BATCH_SIZE):
+            cards.update(self.get_cards_batch(
+                card_ids[start:start + BATCH_SIZE],
+                fields=fields,
+                custom_field_items=custom_field_items
+            ))
+        return cards
+
+    def get_board_changes(self, since, action_types, list_fields=None, limit=1000,
+                          member_fields=None):
+        """Retrieves the board's actions since a given action, and its open lists and members,
+        in one request.
+
+        Args:
+            since (str): ID of the last action already seen; only newer actions are returned.
+            action_types (tuple of str): Action types to return, e.g. 'updateCard'.
+            list_fields (tuple of str, optional): List fields to return. Defaults to all fields.
+            limit (int, optional): Most actions to return, newest first. Defaults to 1000,
+                Trello's maximum.
+            member_fields (tuple of str, optional): Member fields to return.
+                Defaults to Trello's default member fields.
+
+        Returns:
+            dict: The board with nested 'actions' (newest first), 'lists' and 'members' lists.
+        """
+        board_url = f"{self.base_url}/boards/{self.board_id}"
+        params = {
+            "fields": "id",
+            "actions": ",".join(action_types),
+            "actions_since": since,
+            "actions_limit": limit,
+            "action_fields": "id,type,date,data",
+            "lists": "open",
+            "members": "all",
+            **self._fields_params(list_fields, "list_fields"),
+            **self._fields_params(member_fields, "member_fields")
+        }
+        return self.request_call(url=board_url, have_headers=True, params=params)
+
     def get_custom_fields_data(self):
         """Retrieves the story points (size, spent, remaining) for a given card.
 
@@ -142,11 +488,7 @@ class TrelloAPI:
             print(delete_response)
         """
         url = f"{self.base_url}/cards/{card_id}"
-        query = {
-            'key': self.api_key,
-            'token': self.api_token
-        }
-        response = requests.delete(url, params=query, timeout=60)
+        response = self._request("DELETE", url)
         response.raise_for_status()
         return response.text
 
@@ -156,56 +498,39 @@ class TrelloAPI:
         Returns:
             list of trello member IDs
         """
-        # Set connection parameters
-        url = f"https://api.trello.com/1/boards/{self.board_id}/memberships"
-
-        headers = {
-            "Accept": "application/json"
-        }
-        query = {
-            'key': self.api_key,
-            'token': self.api_token
-        }
-        response = requests.request(
-            "GET",
-            url,
-            headers=headers,
-            params=query,
-            timeout=60
-        )
+        url = f"{self.base_url}/boards/{self.board_id}/memberships"
         # Parse results to extract ID and drop inactive members
         members = [
-            member["idMember"] for member in json.loads(response.text)
+            member["idMember"] for member in self.request_call(url=url, have_headers=True)
             if not member["deactivated"]
         ]
         # Return results
         return members
 
-    def get_member_details(self, member_id):
+    def get_board_members(self, fields=None):
+        """ Request the members of the board with their details in one call
+
+        Args:
+            fields (tuple of str, optional): Member fields to return.
+                Defaults to Trello's default member fields.
+
+        Returns:
+            list of member dictionaries
+        """
+        url = f"{self.base_url}/boards/{self.board_id}/members"
+        return self.request_call(
+            url=url, have_headers=True, params=self._fields_params(fields))
+
+    def get_member_details(self, member_id, fields=None):
         """ Request member details from Trello
 
         Args:
             member_id (str, hex): The trello member id
+            fields (tuple of str, optional): Member fields to return. Defaults to all fields.
 
         Returns:
             json object containing member details
         """
-        # Set connection parameters
-        url = f"https://api.trello.com/1/members/{member_id}"
-        headers = {
-            "Accept": "application/json"
-        }
-        query = {
-            'key': self.api_key,
-            'token': self.api_token
-        }
-        # Execute request
-        response = requests.request(
-            "GET",
-            url,
-            headers=headers,
-            params=query,
-            timeout=60
-        )
-        # Return result
-        return json.loads(response.text)
+        url = f"{self.base_url}/members/{member_id}"
+        return self.request_call(
+            url=url, have_headers=True, params=self._fields_params(fields))
@@ -0,0 +1,558 @@
+"""
+async_api.py
+
+This module contains the `AsyncTrelloAPI` class, an asyncio client with the same surface as
+`TrelloAPI`, and the `SyncTrelloAPI` facade that lets blocking callers such as `Board` use it.
+
+Requests run on a bounded thread pool through the pooled session of a wrapped `TrelloAPI`
+instance, and a semaphore caps how many are in flight at once. Loading a whole board therefore
+takes about as long as its slowest request instead of the sum of all of them.
+
+Classes:
+    - AsyncTrelloAPI: Issues Trello API requests concurrently on asyncio.
+    - SyncTrelloAPI: Blocking facade that prefetches board data concurrently.
+
+Example Usage:
+    trello_api = SyncTrelloAPI(board_id, api_key, api_token)
+    trello_api.prefetch()
+    board = Board(trello_api, trello_api.get_board_cards())
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from trello.api import BATCH_SIZE, TrelloAPI
+
+
+class AsyncTrelloAPI:
+    """
+    Initializes the AsyncTrelloAPI instance with board credentials.
+
+    Args:
+        board_id (str): The ID of the Trello board.
+        api_key (str): Your Trello API key.
+        api_token (str): Your Trello API token.
+        max_concurrency (int, optional): Maximum number of requests in flight at once.
+            Defaults to 8.
+        api (TrelloAPI, optional): Existing TrelloAPI instance to issue requests through.
+            If None, one is created with a connection pool sized to max_concurrency.
+        cache (ResponseCache, optional): Cache for GET responses of the TrelloAPI created
+            when api is None. Defaults to None (no caching).
+    """
+    def __init__(self, board_id, api_key, api_token, max_concurrency=8, api=None, cache=None):
+        if api is None:
+            api = TrelloAPI(
+                board_id=board_id,
+                api_key=api_key,
+                api_token=api_token,
+                pool_maxsize=max_concurrency,
+                cache=cache
+            )
+        self.api = api
+        self.board_id = board_id
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="trello-api"
+        )
+        # Semaphores are bound to an event loop, so one is kept per loop
+        self._loop = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Shuts down the worker threads and closes the underlying session."""
+        self._executor.shutdown(wait=True)
+        self.api.close()
+
+    async def _call(self, func, *args, **kwargs):
+        """Runs a blocking TrelloAPI method on the worker pool within the concurrency limit.
+
+        Args:
+            func (callable): The TrelloAPI method to run.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            object: The return value of the method.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(func, *args, **kwargs)
+            )
+
+    async def get_board_cards(self, fields=None):
+        """Retrieves all cards from the Trello board.
+
+        Args:
+            fields (tuple of str, optional): Card fields to return. Defaults to all fields.
+
+        Returns:
+            list: A list of card dictionaries from the board.
+        """
+        return await self._call(self.api.get_board_cards, fields=fields)
+
+    async def get_board_lists(self, fields=None):
+        """Retrieves all lists from the Trello board.
+
+        Args:
+            fields (tuple of str, optional): List fields to return. Defaults to all fields.
+
+        Returns:
+            list: A list of list dictionaries from the board.
+        """
+        return await self._call(self.api.get_board_lists, fields=fields)
+
+    async def get_board_snapshot(self, card_fields=None, list_fields=None, member_fields=None):
+        """Retrieves the board's cards, lists and members in a single request.
+
+        Args:
+            card_fields (tuple of str, optional): Card fields to return.
+            list_fields (tuple of str, optional): List fields to return.
+            member_fields (tuple of str, optional): Member fields to return.
+
+        Returns:
+            dict: The board with nested 'cards', 'lists' and 'members' lists.
+        """
+        return await self._call(
+            self.api.get_board_snapshot,
+            card_fields=card_fields,
+            list_fields=list_fields,
+            member_fields=member_fields
+        )
+
+    async def get_card(self, card_id, fields=None, custom_field_items=False):
+        """Retrieves a single card.
+
+        Args:
+            card_id (str): The card ID or shortLink.
+            fields (tuple of str, optional): Card fields to return. Defaults to all fields.
+            custom_field_items (bool, optional): Include the card's customFieldItems.
+
+        Returns:
+            dict: The card.
+        """
+        return await self._call(
+            self.api.get_card, card_id, fields=fields, custom_field_items=custom_field_items)
+
+    async def get_cards(self, card_ids, fields=None, custom_field_items=False):
+        """Retrieves many cards, sending their batch requests concurrently.
+
+        Args:
+            card_ids (list of str): Card IDs or shortLinks.
+            fields (tuple of str, optional): Card fields to return. Defaults to all fields.
+            custom_field_items (bool, optional): Include each card's customFieldItems.
+
+        Returns:
+            dict: Cards keyed by the requested ID, in request order; None for cards that
+                could not be retrieved.
+        """
+        card_ids = list(dict.fromkeys(card_ids))
+        batches = await asyncio.gather(*(
+            self._call(
+                self.api.get_cards_batch,
+                card_ids[start:start + BATCH_SIZE],
+                fields=fields,
+                custom_field_items=custom_field_items
+            )
+            for start in range(0, len(card_ids), BATCH_SIZE)
+        ))
+        cards = {}
+        for batch in batches:
+            cards.update(batch)
+        return cards
+
+    async def get_board_changes(self, since, action_types, list_fields=None, limit=1000,
+                                member_fields=None):
+        """Retrieves the board's actions since a given action, and its open lists and members.
+
+        Args:
+            since (str): ID of the last action already seen.
+            action_types (tuple of str): Action types to return.
+            list_fields (tuple of str, optional): List fields to return.
+            limit (int, optional): Most actions to return, newest first. Defaults to 1000.
+            member_fields (tuple of str, optional): Member fields to return.
+
+        Returns:
+            dict: The board with nested 'actions', 'lists' and 'members' lists.
+        """
+        return await self._call(
+            self.api.get_board_changes,
+            since,
+            action_types,
+            list_fields=list_fields,
+            limit=limit,
+            member_fields=member_fields
+        )
+
+    async def get_custom_fields_data(self):
+        """Retrieves the custom field items of every card on the board.
+
+        Returns:
+            list: Card dictionaries holding 'id', 'name' and 'customFieldItems'.
+        """
+        return await self._call(self.api.get_custom_fields_data)
+
+    async def get_board_member_ids(self):
+        """Requests the IDs of the active members of the board.
+
+        Returns:
+            list: Trello member IDs.
+        """
+        return await self._call(self.api.get_board_member_ids)
+
+    async def get_board_members(self, fields=None):
+        """Requests the members of the board with their details in one call.
+
+        Args:
+            fields (tuple of str, optional): Member fields to return.
+
+        Returns:
+            list: Member dictionaries.
+        """
+        return await self._call(self.api.get_board_members, fields=fields)
+
+    async def get_member_details(self, member_id, fields=None):
+        """Requests member details from Trello.
+
+        Args:
+            member_id (str, hex): The trello member id
+            fields (tuple of str, optional): Member fields to return. Defaults to all fields.
+
+        Returns:
+            dict: The member details.
+        """
+        return await self._call(self.api.get_member_details, member_id, fields=fields)
+
+    async def put_call(self, card_id, custom_field_id, value):
+        """Updates a custom field on a card.
+
+        Args:
+            card_id (str): ID of the target card
+            custom_field_id (str): ID of the target custom field
+            value (int): value to push to the custom field
+        """
+        return await self._call(self.api.put_call, card_id, custom_field_id, value)
+
+    async def put_custom_fields(self, card_id, values):
+        """Updates several number custom fields on a card in a single request.
+
+        Args:
+            card_id (str): ID of the target card.
+            values (dict): Values to push, keyed by custom field ID.
+        """
+        return await self._call(self.api.put_custom_fields, card_id, values)
+
+    async def delete_card(self, card_id):
+        """Deletes a card from the Trello board.
+
+        Args:
+            card_id (str): The 24-character hexadecimal ID of the card (not shortLink).
+
+        Returns:
+            str: The response text from the Trello API.
+        """
+        return await self._call(self.api.delete_card, card_id)
+
+    async def get_board_data(self, include_cards=True, card_fields=None, list_fields=None):
+        """Fetches the cards, lists and custom field data of the board concurrently.
+
+        Args:
+            include_cards (bool, optional): Fetch the board cards as well. Defaults to True.
+            card_fields (tuple of str, optional): Card fields to return.
+            list_fields (tuple of str, optional): List fields to return.
+
+        Returns:
+            dict: Results keyed by 'cards', 'lists' and 'custom_fields'.
+        """
+        pending = {
+            "lists": self.get_board_lists(fields=list_fields),
+            "custom_fields": self.get_custom_fields_data()
+        }
+        if include_cards:
+            pending["cards"] = self.get_board_cards(fields=card_fields)
+        results = await asyncio.gather(*pending.values())
+        return dict(zip(pending.keys(), results))
+
+    async def get_members_details(self, member_ids, fields=None):
+        """Requests the details of many members concurrently.
+
+        Args:
+            member_ids (list of str): Trello member IDs.
+            fields (tuple of str, optional): Member fields to return. Defaults to all fields.
+
+        Returns:
+            dict: Member details keyed by member ID.
+        """
+        member_ids = list(member_ids)
+        details = await asyncio.gather(
+            *(self.get_member_details(member_id, fields=fields) for member_id in member_ids))
+        return dict(zip(member_ids, details))
+
+
+class SyncTrelloAPI:
+    """
+    Blocking facade over `AsyncTrelloAPI` that can stand in for `TrelloAPI`.
+
+    Calling `prefetch()` loads the board's cards, lists and custom field data concurrently.
+    Each prefetched result is handed out once by the matching getter called with the same
+    fields, so a `Board` built afterwards makes no further round trips; later calls, and calls
+    asking for other fields, go back to the API.
+
+    Args:
+        board_id (str): The ID of the Trello board.
+        api_key (str): Your Trello API key.
+        api_token (str): Your Trello API token.
+        max_concurrency (int, optional): Maximum number of requests in flight at once.
+            Defaults to 8.
+        cache (ResponseCache, optional): Cache for GET responses. Defaults to None (no caching).
+
+    Note:
+        Methods call `asyncio.run` and therefore cannot be used from inside a running event
+        loop; use `AsyncTrelloAPI` there instead.
+    """
+    def __init__(self, board_id, api_key, api_token, max_concurrency=8, cache=None):
+        self.async_api = AsyncTrelloAPI(
+            board_id=board_id,
+            api_key=api_key,
+            api_token=api_token,
+            max_concurrency=max_concurrency,
+            cache=cache
+        )
+        self.board_id = board_id
+        self._prefetched = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Releases the worker threads and pooled connections."""
+        self.async_api.close()
+
+    def prefetch(self, include_cards=True, card_fields=None, list_fields=None):
+        """Fetches the board data concurrently and holds it for the next getter calls.
+
+        Args:
+            include_cards (bool, optional): Prefetch the board cards as well; skip this when
+                the cards come from the database. Defaults to True.
+            card_fields (tuple of str, optional): Card fields to return.
+            list_fields (tuple of str, optional): List fields to return.
+        """
+        board_data = asyncio.run(self.async_api.get_board_data(
+            include_cards=include_cards,
+            card_fields=card_fields,
+            list_fields=list_fields
+        ))
+        fields_by_key = {"cards": card_fields, "lists": list_fields, "custom_fields": None}
+        for key, result in board_data.items():
+            self._prefetched[self._prefetch_key(key, fields_by_key[key])] = result
+
+    @staticmethod
+    def _prefetch_key(key, fields):
+        """Identifies a prefetched result by what it holds and the fields it was fetched with.
+
+        Args:
+            key (str): Name of the result, e.g. 'lists'.
+            fields (tuple of str or None): The requested fields.
+
+        Returns:
+            tuple: The key.
+        """
+        return key, tuple(fields) if fields is not None else None
+
+    def _get(self, key, coroutine_func, **kwargs):
+        """Returns a prefetched result, or runs the request if nothing matching was prefetched.
+
+        Args:
+            key (str): Name of the prefetched result.
+            coroutine_func (callable): AsyncTrelloAPI method to run otherwise.
+            **kwargs: Keyword arguments for the method; a prefetched result is only served
+                if it was fetched with the same 'fields'.
+
+        Returns:
+            object: The API result.
+        """
+        prefetch_key = self._prefetch_key(key, kwargs.get("fields"))
+        if prefetch_key in self._prefetched:
+            return self._prefetched.pop(prefetch_key)
+        return asyncio.run(coroutine_func(**kwargs))
+
+    def get_board_cards(self, fields=None):
+        """Retrieves all cards from the Trello board.
+
+        Args:
+            fields (tuple of str, optional): Card fields to return. Defaults to all fields.
+
+        Returns:
+            list: A list of card dictionaries from the board.
+        """
+        return self._get("cards", self.async_api.get_board_cards, fields=fields)
+
+    def get_board_lists(self, fields=None):
+        """Retrieves all lists from the Trello board.
+
+        Args:
+            fields (tuple of str, optional): List fields to return. Defaults to all fields.
+
+        Returns:
+            list: A list of list dictionaries from the board.
+        """
+        return self._get("lists", self.async_api.get_board_lists, fields=fields)
+
+    def get_board_snapshot(self, card_fields=None, list_fields=None, member_fields=None):
+        """Retrieves the board's cards, lists and members in a single request.
+
+        Args:
+            card_fields (tuple of str, optional): Card fields to return.
+            list_fields (tuple of str, optional): List fields to return.
+            member_fields (tuple of str, optional): Member fields to return.
+
+        Returns:
+            dict: The board with nested 'cards', 'lists' and 'members' lists.
+        """
+        return asyncio.run(self.async_api.get_board_snapshot(
+            card_fields=card_fields,
+            list_fields=list_fields,
+            member_fields=member_fields
+        ))
+
+    def get_custom_fields_data(self):
+        """Retrieves the custom field items of every card on the board.
+
+        Returns:
+            list: Card dictionaries holding 'id', 'name' and 'customFieldItems'.
+        """
+        return self._get("custom_fields", self.async_api.get_custom_fields_data)
+
+    def get_card(self, card_id, fields=None, custom_field_items=False):
+        """Retrieves a single card.
+
+        Args:
+            card_id (str): The card ID or shortLink.
+            fields (tuple of str, optional): Card fields to return. Defaults to all fields.
+            custom_field_items (bool, optional): Include the card's customFieldItems.
+
+        Returns:
+            dict: The card.
+        """
+        return asyncio.run(self.async_api.get_card(
+            card_id, fields=fields, custom_field_items=custom_field_items))
+
+    def get_cards(self, card_ids, fields=None, custom_field_items=False):
+        """Retrieves many cards, sending their batch requests concurrently.
+
+        Args:
+            card_ids (list of str): Card IDs or shortLinks.
+            fields (tuple of str, optional): Card fields to return. Defaults to all fields.
+            custom_field_items (bool, optional): Include each card's customFieldItems.
+
+        Returns:
+            dict: Cards keyed by the requested ID, in request order; None for cards that
+                could not be retrieved.
+        """
+        return asyncio.run(self.async_api.get_cards(
+            card_ids, fields=fields, custom_field_items=custom_field_items))
+
+    def get_board_changes(self, since, action_types, list_fields=None, limit=1000,
+                          member_fields=None):
+        """Retrieves the board's actions since a given action, and its open lists and members.
+
+        Args:
+            since (str): ID of the last action already seen.
+            action_types (tuple of str): Action types to return.
+            list_fields (tuple of str, optional): List fields to return.
+            limit (int, optional): Most actions to return, newest first. Defaults to 1000.
+            member_fields (tuple of str, optional): Member fields to return.
+
+        Returns:
+            dict: The board with nested 'actions', 'lists' and 'members' lists.
+        """
+        return asyncio.run(self.async_api.get_board_changes(
+            since, action_types, list_fields=list_fields, limit=limit,
+            member_fields=member_fields))
+
+    def get_board_member_ids(self):
+        """Requests the IDs of the active members of the board.
+
+        Returns:
+            list: Trello member IDs.
+        """
+        return asyncio.run(self.async_api.get_board_member_ids())
+
+    def get_board_members(self, fields=None):
+        """Requests the members of the board with their details in one call.
+
+        Args:
+            fields (tuple of str, optional): Member fields to return.
+
+        Returns:
+            list: Member dictionaries.
+        """
+        return asyncio.run(self.async_api.get_board_members(fields=fields))
+
+    def get_member_details(self, member_id, fields=None):
+        """Requests member details from Trello.
+
+        Args:
+            member_id (str, hex): The trello member id
+            fields (tuple of str, optional): Member fields to return. Defaults to all fields.
+
+        Returns:
+            dict: The member details.
+        """
+        return asyncio.run(self.async_api.get_member_details(member_id, fields=fields))
+
+    def get_members_details(self, member_ids, fields=None):
+        """Requests the details of many members concurrently.
+
+        Args:
+            member_ids (list of str): Trello member IDs.
+            fields (tuple of str, optional): Member fields to return. Defaults to all fields.
+
+        Returns:
+            dict: Member details keyed by member ID.
+        """
+        return asyncio.run(self.async_api.get_members_details(member_ids, fields=fields))
+
+    def put_call(self, card_id, custom_field_id, value):
+        """Updates a custom field on a card.
+
+        Args:
+            card_id (str): ID of the target card
+            custom_field_id (str): ID of the target custom field
+            value (int): value to push to the custom field
+        """
+        return asyncio.run(self.async_api.put_call(card_id, custom_field_id, value))
+
+    def put_custom_fields(self, card_id, values):
+        """Updates several number custom fields on a card in a single request.
+
+        Args:
+            card_id (str): ID of the target card.
+            values (dict): Values to push, keyed by custom field ID.
+        """
+        return asyncio.run(self.async_api.put_custom_fields(card_id, values))
+
+    def delete_card(self, card_id):
+        """Deletes a card from the Trello board.
+
+        Args:
+            card_id (str): The 24-character hexadecimal ID of the card (not shortLink).
+
+        Returns:
+            str: The response text from the Trello API.
+        """
+        return asyncio.run(self.async_api.delete_card(card_id))
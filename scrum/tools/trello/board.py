@@ -6,43 +6,207 @@ fetch board data, extract card information, and calculate story points.
 
 Classes:
     - Board: Represents a Trello board and includes methods for data fetching and calculations.
+
+Functions:
+    - index_custom_fields: Indexes custom field values by card ID and custom field ID.
+    - card_story_points: Reads a card's story points from its custom field values.
+    - parse_past_sprints: Reads past sprint story points from the sprint summary card.
 """
 
 import re
 from pathlib import Path
+from trello.aggregator import StoryPointAggregator
 from trello.card import Card
 from sprint_utils import load_config
 
 
+def index_custom_fields(custom_fields_data):
+    """
+    Indexes the custom field values of every card in a single pass.
+
+    Args:
+        custom_fields_data (list): Card dictionaries holding 'id' and 'customFieldItems',
+            as returned by TrelloAPI.get_custom_fields_data().
+
+    Returns:
+        dict: Maps each card ID to a dictionary of custom field ID to value.
+    """
+    return {
+        card['id']: {
+            item['idCustomField']: item.get('value')
+            for item in card.get('customFieldItems', [])
+        }
+        for card in custom_fields_data
+    }
+
+
+def _story_point_value(value):
+    """
+    Parses a story point custom field value, defaulting missing values to 0.
+
+    Args:
+        value (dict or None): The custom field value, e.g. {'number': '3'}.
+
+    Returns:
+        int: The story points.
+    """
+    if not value or 'number' not in value:
+        return 0
+    return int(value['number'])
+
+
+def card_story_points(card_fields, sp_total_id, sp_spent_id):
+    """
+    Reads a card's story points from its custom field values.
+
+    Args:
+        card_fields (dict): The card's custom field values keyed by custom field ID.
+        sp_total_id (str): ID of the total story points custom field.
+        sp_spent_id (str): ID of the spent story points custom field.
+
+    Returns:
+        dict: The card's 'total', 'spent' and 'remaining' story points.
+    """
+    total_sp = _story_point_value(card_fields.get(sp_total_id))
+    spent_sp = _story_point_value(card_fields.get(sp_spent_id))
+    # Calculate difference for remaining and retro
+    #  Positive indicates remaining, negative indicates retro
+    diff_sp = total_sp - spent_sp
+    return {
+        "total": total_sp,
+        "spent": spent_sp,
+        "remaining": diff_sp if diff_sp >= 0 else 0
+    }
+
+
+# Past sprint totals as written on the sprint summary card
+UNPLANNED_PATTERN = re.compile(r"SP Unplanned:\s*(\d+)\(T\)", re.IGNORECASE)
+RETRO_PATTERN = re.compile(r"SP Retro:\s*(\d+)\(T\)", re.IGNORECASE)
+
+
+def parse_past_sprints(desc):
+    """
+    Reads past sprint story points from the sprint summary card's description.
+
+    Args:
+        desc (str): The card description.
+
+    Returns:
+        tuple: The unplanned and the retro story points of each past sprint, as lists of int.
+    """
+    return (
+        [int(i) for i in UNPLANNED_PATTERN.findall(desc)],
+        [int(i) for i in RETRO_PATTERN.findall(desc)]
+    )
+
+
 class Board:
     """
     Initializes a Board instance.
 
+    The fields Board reads from each Trello resource are declared in CARD_FIELDS, LIST_FIELDS
+    and MEMBER_FIELDS, and only those are requested from the API.
+
     Args:
         api (TrelloAPI): An instance of the TrelloAPI class.
         board_data (dict, optional): Initial data for the board.
             If None, data will be fetched using the API.
+        lists (list, optional): The board's lists. If None, they will be fetched using the API.
+        custom_fields_data (list, optional): Cards with their 'customFieldItems'.
+            If None, they will be fetched using the API when story points are assigned.
+        board_config (dict, optional): The board configuration, as in the 'board' block of
+            config.json. If None, it is loaded from config.json.
     """
-    def __init__(self, api, board_data=None):
+    # Fields read by extract_cards and the bin scripts; everything else is left on the server
+    CARD_FIELDS = ("id", "shortLink", "name", "labels", "idList", "idMembers", "desc")
+    LIST_FIELDS = ("id", "name")
+    MEMBER_FIELDS = ("id", "fullName", "username")
+
+    def __init__(self, api, board_data=None, lists=None, custom_fields_data=None,
+                 board_config=None):
         self.api = api
         self.cards = []
+        self.members = []
         self.unplanned_past_sprints = []
         self.retro_past_sprints = []
-        self.calcs = {
-            "unplanned": {"total": 0, "spent": 0, "remaining": 0},
-            "planned": {"total": 0, "spent": 0, "remaining": 0},
-            "retro": {"total": 0, "spent": 0, "remaining": 0}
-        }
-        self.lists = api.get_board_lists()
+        self.aggregator = StoryPointAggregator()
+        self.calcs = self.aggregator.get_calcs()
+        if lists is None:
+            lists = api.get_board_lists(fields=self.LIST_FIELDS)
+        self.lists = lists
+        self.custom_fields_data = custom_fields_data
         if board_data is None:
             self.fetch_data()
         else:
             self.board_data = board_data
 
         # Load board configuration
-        self.board_config = load_config(
-            Path(__file__).parent.parent /
-            "config.json")['board']
+        if board_config is None:
+            board_config = load_config(
+                Path(__file__).parent.parent /
+                "config.json")['board']
+        self.board_config = board_config
+
+    @classmethod
+    def from_snapshot(cls, api, snapshot=None, board_config=None):
+        """
+        Creates a Board from a board snapshot holding nested cards, lists and members.
+
+        The snapshot's cards carry their customFieldItems, so building the board and assigning
+        story points needs no further requests. Any part missing from the snapshot is fetched
+        using the API as usual.
+
+        Args:
+            api (TrelloAPI): An instance of the TrelloAPI class.
+            snapshot (dict, optional): Result of TrelloAPI.get_board_snapshot().
+                If None, it will be fetched using the API.
+            board_config (dict, optional): The board configuration. If None, it is loaded
+                from config.json.
+
+        Returns:
+            Board: The new Board instance.
+        """
+        if snapshot is None:
+            snapshot = api.get_board_snapshot(
+                card_fields=cls.CARD_FIELDS,
+                list_fields=cls.LIST_FIELDS,
+                member_fields=cls.MEMBER_FIELDS
+            )
+        cards = snapshot.get('cards')
+        # Cards stored before snapshots existed have no customFieldItems to reuse
+        has_custom_fields = cards is not None and all(
+            'customFieldItems' in card for card in cards)
+        board = cls(
+            api,
+            board_data=cards,
+            lists=snapshot.get('lists'),
+            custom_fields_data=cards if has_custom_fields else None,
+            board_config=board_config
+        )
+        board.members = snapshot.get('members', [])
+        return board
+
+    @classmethod
+    def from_sync(cls, api, board_sync=None):
+        """
+        Creates a Board from a locally synchronized copy of the board.
+
+        Only the actions since the previous sync are requested, so keeping a large board
+        current costs one small request instead of a full download.
+
+        Args:
+            api (TrelloAPI): An instance of the TrelloAPI class.
+            board_sync (BoardSync, optional): The synchronizer holding the board state.
+                Defaults to one using the default state directory.
+
+        Returns:
+            Board: The new Board instance.
+        """
+        # Imported here because trello.sync builds on Board
+        from trello.sync import BoardSync
+        if board_sync is None:
+            board_sync = BoardSync(api)
+        return cls.from_snapshot(api, board_sync.sync())
 
     def get_data(self):
         """
@@ -62,6 +226,15 @@ class Board:
         """
         return self.cards
 
+    def get_members(self):
+        """
+        Returns the board members included in the board snapshot.
+
+        Returns:
+            list: Member dictionaries; empty if the board was not built from a snapshot.
+        """
+        return self.members
+
     def get_unplanned_past_sprints(self):
         """
         Returns the unplanned story points from past sprints.
@@ -84,7 +257,7 @@ class Board:
         """
         Fetches board data from the Trello API and sets the board_data attribute.
         """
-        self.board_data = self.api.get_board_cards()
+        self.board_data = self.api.get_board_cards(fields=self.CARD_FIELDS)
 
     def extract_cards(self, calc_sp = True):
         """
@@ -97,142 +270,130 @@ class Board:
         list_id_to_name = {list_obj['id']: list_obj['name']
                            for list_obj in self.lists}
 
-        # Compile regex patterns once to improve performance
-        unplanned_pattern = re.compile(r"SP Unplanned:\s*(\d+)\(T\)", re.IGNORECASE)
-        retro_pattern = re.compile(r"SP Retro:\s*(\d+)\(T\)", re.IGNORECASE)
-
         # Iterate board data to parse individual cards into Card() objects
         for card in self.board_data:
             curr_card_id = card.get("id")
-            curr_card_short_link = card.get("shortLink")
-            curr_card_name = card.get("name", "")
-            curr_card_labels = [
-                label.get(
-                    "name",
-                    "") for label in card.get(
-                    "labels",
-                    [])]
             curr_card_list = list_id_to_name.get(card.get('idList'), '')
-            curr_card_id_members = card.get('idMembers')
-
-            # Skip if card is in 'Monitoring' list
-            if "Monitoring" in curr_card_list:
-                continue
 
-            # Skip the unplanned template card
-            if curr_card_id == self.board_config['unplanned_template_card']:
+            # Skip cards that do not count towards story points
+            if not self.is_tracked_card(curr_card_id, curr_card_list):
+                # Process the sprint summary card
+                if (curr_card_id == self.board_config['sprint_calc_card']
+                        and "Monitoring" not in curr_card_list):
+                    self.unplanned_past_sprints, self.retro_past_sprints = \
+                        parse_past_sprints(card.get("desc", ""))
                 continue
 
-            # Process the sprint summary card
-            if curr_card_id == self.board_config['sprint_calc_card']:
-                desc = card.get("desc", "")
-                self.unplanned_past_sprints = [
-                    int(i) for i in unplanned_pattern.findall(desc)]
-                self.retro_past_sprints = [
-                    int(i) for i in retro_pattern.findall(desc)]
-                continue
-
-            # Default SP to zero
-            story_points = {
-                "total": 0,
-                "spent": 0,
-                "remaining": 0
-            }
-
             # Create and append the Card object
-            self.cards.append(
-                Card(
-                    card_id=curr_card_id,
-                    short_link=curr_card_short_link,
-                    story_points=story_points,
-                    title=curr_card_name,
-                    labels=curr_card_labels,
-                    list_name=curr_card_list,
-                    id_members=curr_card_id_members
-                )
-            )
+            self.cards.append(self.make_card(card, curr_card_list))
+
         # Extract story points
         if calc_sp:
             self.assign_story_points()
 
-    def calculate_story_points(self):
+    def is_tracked_card(self, card_id, list_name):
+        """
+        Tells whether a card counts towards the board's story points.
+
+        Cards in a 'Monitoring' list, the unplanned template card and the sprint summary card
+        are not tracked.
+
+        Args:
+            card_id (str): The card ID.
+            list_name (str): Name of the card's list.
+
+        Returns:
+            bool: True if the card is tracked.
+        """
+        if "Monitoring" in list_name:
+            return False
+        return card_id not in (
+            self.board_config['unplanned_template_card'],
+            self.board_config['sprint_calc_card']
+        )
+
+    def make_card(self, card, list_name):
+        """
+        Creates a Card with zero story points from a card's JSON data.
+
+        Args:
+            card (dict): The card as returned by the Trello API.
+            list_name (str): Name of the card's list.
+
+        Returns:
+            Card: The new Card instance.
+        """
+        # Default SP to zero
+        story_points = {
+            "total": 0,
+            "spent": 0,
+            "remaining": 0
+        }
+        return Card(
+            card_id=card.get("id"),
+            short_link=card.get("shortLink"),
+            story_points=story_points,
+            title=card.get("name", ""),
+            labels=[label.get("name", "") for label in card.get("labels", [])],
+            list_name=list_name,
+            id_members=card.get('idMembers')
+        )
+
+    def to_columns(self):
+        """
+        Converts the board's cards to a columnar, NumPy-backed representation.
+
+        Returns:
+            CardColumns: The cards as column arrays.
+        """
+        # Imported here so NumPy is only required when the columnar path is used
+        from trello.columnar import CardColumns
+        return CardColumns.from_cards(self.cards)
+
+    def calculate_story_points(self, columnar=False, cards=None):
         """
         Calculates story points for the board.
 
+        Each card's contribution is tracked, so calling this again only moves the totals by
+        what changed and never counts a card twice. Cards removed from the board are dropped
+        from the totals on the next full calculation, or at once with aggregator.remove().
+
+        Args:
+            columnar (bool, optional): Compute the totals with vectorized NumPy operations
+                on the columnar card store instead of looping over the cards. The totals are
+                then recomputed in full rather than tracked per card. Defaults to False.
+            cards (list of Card, optional): Only the cards added or changed since the last
+                calculation. If None, every card on the board is counted. Defaults to None.
+
         Returns:
             dict: A dictionary with calculated story points for
                 'planned', 'unplanned', and 'retro' categories.
         """
-        for card in self.cards:
-            labels = set(card.get_labels())
-            list_name = card.get_list_name()
-
-            is_unplanned = 'UNPLANNED' in labels
-            is_retro = 'RETRO' in labels
-            is_done = 'Done' in list_name
-
-            total_points = card.get_total_story_points()
-            spent_points = card.get_spent_story_points()
-            remaining_points = card.get_remaining_story_points()
-
-            # Determine category
-            if is_unplanned:
-                category = 'unplanned'
-            elif is_retro and not (is_done or spent_points > 0):
-                category = 'retro'
-            else:
-                category = 'planned'
-
-            # Update total points
-            self.calcs[category]['total'] += total_points
-
-            # Calculate actual spent and extra spent points
-            if category in ('planned', 'unplanned'):
-                actual_spent = min(spent_points, total_points)
-                extra_spent = max(spent_points - total_points, 0)
-                self.calcs[category]['spent'] += actual_spent
-                self.calcs['retro']['spent'] += extra_spent
-                self.calcs['retro']['total'] += extra_spent
-            else:
-                self.calcs[category]['spent'] += spent_points
-
-            # Update remaining points if card is not done
-            if not is_done:
-                self.calcs[category]['remaining'] += remaining_points
+        if columnar:
+            self.calcs = self.to_columns().calculate_story_points()
+            return self.calcs
 
+        if cards is None:
+            self.aggregator.update_all(self.cards)
+        else:
+            for card in cards:
+                self.aggregator.update(card)
+        self.calcs = self.aggregator.get_calcs()
         return self.calcs
 
     def assign_story_points(self):
         """Sets story points on each card using Trello custom field data
         """
-        # Request custom_fields data from Trello
-        board_story_points = self.api.get_custom_fields_data()
+        # Request custom_fields data from Trello unless the board snapshot provided it
+        board_story_points = self.custom_fields_data
+        if board_story_points is None:
+            board_story_points = self.api.get_custom_fields_data()
+        # Index custom field values by card once instead of scanning them for every card
+        custom_field_index = index_custom_fields(board_story_points)
+        sp_total_id = self.board_config['sp_total_id']
+        sp_spent_id = self.board_config['sp_spent_id']
         # Iterate trello cards
         for card in self.cards:
-            # Extract story points from custom_fields object
-            card_story_points = [
-                x['customFieldItems'] for x in board_story_points
-                if x['id'] == card.get_card_id()
-            ]
-            # Extract story point values and format result
-            total_sp = [
-                int(x["value"]["number"]) for x in card_story_points[0]
-                if x["idCustomField"] == self.board_config['sp_total_id']
-            ]
-            spent_sp = [
-                int(x["value"]["number"]) for x in card_story_points[0]
-                if x["idCustomField"] == self.board_config['sp_spent_id']
-            ]
-            # Extract list and default missing to 0
-            total_sp = total_sp[0] if len(total_sp) > 0 else 0
-            spent_sp = spent_sp[0] if len(spent_sp) > 0 else 0
-            # Calculate difference for remaining and retro
-            #  Positive indicates remaining, negative indicates retro
-            diff_sp = total_sp - spent_sp
-            story_points = {
-                "total": total_sp,
-                "spent": spent_sp,
-                "remaining": diff_sp if diff_sp >= 0 else 0
-            }
-
-            card.set_story_points(story_points)
+            # Cards missing from the custom field data have no story points
+            card_fields = custom_field_index.get(card.get_card_id(), {})
+            card.set_story_points(card_story_points(card_fields, sp_total_id, sp_spent_id))
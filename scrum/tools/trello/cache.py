@@ -0,0 +1,351 @@
+"""
+cache.py
+
+This module contains the `ResponseCache` class, a persistent on-disk cache of Trello API GET
+responses, so scripts run back to back do not download the same board data again.
+
+Entries are keyed by method, URL and query parameters; the API key and token are never part of
+the key or of anything written to disk. Each endpoint has its own time to live, matched on the
+URL path. Expired entries that carried an ETag or Last-Modified header are revalidated with a
+conditional request, and a 304 response renews them without downloading the body again. The
+cache is bounded in size and evicts the least recently used entries first.
+
+Classes:
+    - CacheEntry: A cached response body and its validators.
+    - ResponseCache: Stores API responses on disk with TTLs, revalidation and LRU eviction.
+
+Example Usage:
+    cache = ResponseCache()
+    trello_api = TrelloAPI(board_id, api_key, api_token, cache=cache)
+    cards = trello_api.get_board_cards()
+    print(cache.get_stats())
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "trello"
+
+# Seconds each endpoint stays fresh, matched in order against the URL path
+DEFAULT_TTLS = (
+    (r"/members/[^/]+$", 86400),
+    (r"/boards/[^/]+/(memberships|members|customFields)$", 3600),
+    (r"/boards/[^/]+/lists$", 600),
+    (r"/boards/[^/]+(/cards)?/?$", 60),
+    (r"/cards/", 60),
+)
+DEFAULT_TTL = 60
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Query parameters that identify the caller rather than the resource
+EXCLUDED_PARAMS = ("key", "token")
+
+
+class CacheEntry:
+    """
+    Initializes a CacheEntry holding a cached response.
+
+    Args:
+        key (str): The cache key.
+        body (str): The response body.
+        stored_at (float): When the entry was stored or last revalidated, in epoch seconds.
+        ttl (float): Seconds the entry stays fresh after stored_at.
+        etag (str, optional): The response ETag header. Defaults to None.
+        last_modified (str, optional): The response Last-Modified header. Defaults to None.
+    """
+    def __init__(self, key, body, stored_at, ttl, etag=None, last_modified=None):
+        self.key = key
+        self.body = body
+        self.stored_at = stored_at
+        self.ttl = ttl
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, now):
+        """
+        Tells whether the entry can be used without contacting the API.
+
+        Args:
+            now (float): The current time in epoch seconds.
+
+        Returns:
+            bool: True if the entry is within its time to live.
+        """
+        return now - self.stored_at < self.ttl
+
+    def get_validators(self):
+        """
+        Builds the conditional request headers that revalidate this entry.
+
+        Returns:
+            dict: If-None-Match and If-Modified-Since headers, where available.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def json(self):
+        """
+        Parses the cached body.
+
+        Returns:
+            dict or list: The JSON response.
+        """
+        return json.loads(self.body)
+
+
+class ResponseCache:
+    """
+    Initializes a ResponseCache storing entries under a directory.
+
+    Args:
+        cache_dir (str or Path, optional): Directory holding the entries.
+            Defaults to the `.cache/trello` directory under the tools directory.
+        ttls (tuple of (str, float), optional): Pairs of URL path regex and seconds fresh,
+            matched in order. Defaults to DEFAULT_TTLS.
+        default_ttl (float, optional): Seconds fresh for paths matching no pattern.
+            Defaults to 60.
+        max_bytes (int, optional): Size bound of the cache on disk. Defaults to 64 MB.
+        clock (callable, optional): Returns the current epoch time. Defaults to time.time.
+    """
+    def __init__(
+            self,
+            cache_dir=DEFAULT_CACHE_DIR,
+            ttls=DEFAULT_TTLS,
+            default_ttl=DEFAULT_TTL,
+            max_bytes=DEFAULT_MAX_BYTES,
+            clock=time.time):
+        self.cache_dir = Path(cache_dir)
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self._lock = threading.Lock()
+        # Entry sizes in least to most recently used order, loaded from disk on first use
+        self._index = None
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "stores": 0,
+            "evictions": 0
+        }
+
+    @staticmethod
+    def make_key(method, url, params=None):
+        """
+        Builds the cache key of a request, leaving out the API key and token.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL, possibly with a query string.
+            params (dict, optional): Query parameters.
+
+        Returns:
+            str: Hex SHA-256 of the method, URL and sorted parameters.
+        """
+        params = {
+            name: str(value) for name, value in (params or {}).items()
+            if name not in EXCLUDED_PARAMS
+        }
+        identity = json.dumps([method.upper(), url, sorted(params.items())])
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def get_ttl(self, url):
+        """
+        Returns the time to live for an endpoint.
+
+        Args:
+            url (str): Request URL.
+
+        Returns:
+            float: Seconds a response from the endpoint stays fresh.
+        """
+        path = url.split("?", 1)[0]
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+    def _path(self, key):
+        """ Returns the file holding an entry """
+        return self.cache_dir / f"{key}.json"
+
+    def _load_index(self):
+        """ Builds the LRU index from the entries on disk, oldest access first """
+        if self._index is not None:
+            return
+        entries = []
+        if self.cache_dir.is_dir():
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path.stem, stat.st_size))
+        entries.sort()
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+
+    def _touch(self, key):
+        """ Marks an entry as most recently used, in memory and on disk """
+        self._index.move_to_end(key)
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def lookup(self, method, url, params=None):
+        """
+        Finds the cached entry of a request, fresh or not.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            params (dict, optional): Query parameters.
+
+        Returns:
+            CacheEntry or None: The entry, or None if the request is not cached.
+        """
+        key = self.make_key(method, url, params)
+        path = self._path(key)
+        with self._lock:
+            self._load_index()
+            try:
+                with open(path, encoding="utf-8") as entry_file:
+                    meta = json.loads(entry_file.readline())
+                    body = entry_file.read()
+            except (OSError, ValueError):
+                self._index.pop(key, None)
+                self._stats["misses"] += 1
+                return None
+            entry = CacheEntry(key, body, ttl=self.get_ttl(url), **meta)
+            if entry.is_fresh(self.clock()):
+                self._stats["hits"] += 1
+                self._index.setdefault(key, path.stat().st_size)
+                self._touch(key)
+            else:
+                self._stats["misses"] += 1
+            return entry
+
+    def store(self, method, url, params, body, headers=None):
+        """
+        Stores a response, evicting least recently used entries beyond the size bound.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            params (dict): Query parameters.
+            body (str): The response body.
+            headers (Mapping, optional): Response headers, read for ETag and Last-Modified.
+
+        Returns:
+            CacheEntry: The stored entry.
+        """
+        headers = headers or {}
+        entry = CacheEntry(
+            key=self.make_key(method, url, params),
+            body=body,
+            stored_at=self.clock(),
+            ttl=self.get_ttl(url),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified")
+        )
+        with self._lock:
+            self._load_index()
+            size = self._write(entry)
+            self._index[entry.key] = size
+            self._index.move_to_end(entry.key)
+            self._stats["stores"] += 1
+            self._evict()
+        return entry
+
+    def revalidated(self, entry):
+        """
+        Renews an entry after the API confirmed it is unchanged (HTTP 304).
+
+        Args:
+            entry (CacheEntry): The entry that was revalidated.
+        """
+        entry.stored_at = self.clock()
+        with self._lock:
+            self._load_index()
+            self._index[entry.key] = self._write(entry)
+            self._index.move_to_end(entry.key)
+            self._stats["revalidated"] += 1
+
+    def _write(self, entry):
+        """
+        Writes an entry atomically.
+
+        Args:
+            entry (CacheEntry): The entry to write.
+
+        Returns:
+            int: Size of the entry on disk in bytes.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "stored_at": entry.stored_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified
+        }
+        data = (json.dumps(meta) + "\n" + entry.body).encode("utf-8")
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, self._path(entry.key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return len(data)
+
+    def _evict(self):
+        """ Deletes least recently used entries until the cache fits within max_bytes """
+        total = sum(self._index.values())
+        while total > self.max_bytes and len(self._index) > 1:
+            key, size = self._index.popitem(last=False)
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+            total -= size
+            self._stats["evictions"] += 1
+
+    def clear(self):
+        """ Deletes every cached entry """
+        with self._lock:
+            self._load_index()
+            for key in list(self._index):
+                try:
+                    self._path(key).unlink()
+                except OSError:
+                    pass
+            self._index.clear()
+
+    def get_stats(self):
+        """
+        Reports how the cache has been used since it was created.
+
+        Returns:
+            dict: Counts of 'hits', 'misses', 'revalidated', 'stores' and 'evictions', plus
+                the number of 'entries' and their total 'bytes' on disk.
+        """
+        with self._lock:
+            self._load_index()
+            stats = dict(self._stats)
+            stats["entries"] = len(self._index)
+            stats["bytes"] = sum(self._index.values())
+        return stats
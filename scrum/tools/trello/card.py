@@ -4,10 +4,33 @@ card.py
 This module contains the `Card` class, which represents a Trello card and includes methods to
 hold and manipulate card data.
 
+Cards are slotted and keep their story points as plain integer fields, with labels and member
+IDs held as tuples, so large boards need far less memory per card.
+
 Classes:
     - Card: Represents a Trello card and holds card data.
 """
 
+import sys
+
+
+def _intern_all(values):
+    """
+    Converts a sequence of strings to a tuple of interned strings.
+
+    Label and list names repeat across every card on a board, so interning them keeps a
+    single copy of each name.
+
+    Args:
+        values (iterable of str or None): The strings to intern.
+
+    Returns:
+        tuple: The interned strings.
+    """
+    if not values:
+        return ()
+    return tuple(sys.intern(value) for value in values)
+
 
 class Card:
     """
@@ -19,26 +42,40 @@ class Card:
         with keys 'total', 'spent', 'remaining'.
         short_link (str, optional): The shortLink for the card URL. Defaults to an empty string.
         title (str, optional): The title of the card. Defaults to an empty string.
-        labels (list, optional): The labels of the card. Defaults to an empty list.
-        list_name (str, optional): The name of the list the card is in.
-        Defaults to an empty string.
+        labels (list, optional): The labels of the card. Defaults to no labels.
+        list_name (str, optional): The name of the list the card is in. None is stored as an
+        empty string. Defaults to an empty string.
+        id_members (list, optional): The IDs of the members assigned to the card.
+        Defaults to no members.
     """
+    __slots__ = (
+        "card_id",
+        "short_link",
+        "title",
+        "labels",
+        "list_name",
+        "id_members",
+        "total_story_points",
+        "spent_story_points",
+        "remaining_story_points"
+    )
+
     def __init__(
             self,
             card_id,
             story_points,
             short_link='',
             title='',
-            labels=[],
+            labels=None,
             list_name='',
-            id_members=[]):
+            id_members=None):
         self.card_id = card_id
         self.short_link = short_link
-        self.story_points = story_points
         self.title = title
-        self.labels = labels
-        self.list_name = list_name
-        self.id_members = id_members
+        self.labels = _intern_all(labels)
+        self.list_name = sys.intern(list_name or '')
+        self.id_members = tuple(id_members) if id_members else ()
+        self.set_story_points(story_points)
 
     # Getters
     def get_card_id(self):
@@ -63,10 +100,17 @@ class Card:
         """
         Returns the story points dictionary.
 
+        The dictionary is built on each call, so changing it does not change the card;
+        use the setters instead.
+
         Returns:
             dict: The story points of the card.
         """
-        return self.story_points
+        return {
+            "total": self.total_story_points,
+            "spent": self.spent_story_points,
+            "remaining": self.remaining_story_points
+        }
 
     def get_total_story_points(self):
         """
@@ -75,7 +119,7 @@ class Card:
         Returns:
             int: The total story points.
         """
-        return self.story_points.get("total", 0)
+        return self.total_story_points
 
     def get_spent_story_points(self):
         """
@@ -84,7 +128,7 @@ class Card:
         Returns:
             int: The spent story points.
         """
-        return self.story_points.get("spent", 0)
+        return self.spent_story_points
 
     def get_remaining_story_points(self):
         """
@@ -93,7 +137,7 @@ class Card:
         Returns:
             int: The remaining story points.
         """
-        return self.story_points.get("remaining", 0)
+        return self.remaining_story_points
 
     def get_title(self):
         """
@@ -109,7 +153,7 @@ class Card:
         Returns the labels attached to the card.
 
         Returns:
-            list: A list of label names.
+            tuple: The label names.
         """
         return self.labels
 
@@ -124,10 +168,10 @@ class Card:
 
     def get_id_members(self):
         """
-        Returns the list of trello users assigned to the card.
+        Returns the trello users assigned to the card.
 
         Returns:
-            str: list of trello user IDs.
+            tuple: The trello user IDs.
         """
         return self.id_members
 
@@ -146,9 +190,11 @@ class Card:
         Sets the story points dictionary.
 
         Args:
-            story_points (dict): The new story points dictionary.
+            story_points (dict): The new story points dictionary. Missing keys default to 0.
         """
-        self.story_points = story_points
+        self.total_story_points = story_points.get("total", 0)
+        self.spent_story_points = story_points.get("spent", 0)
+        self.remaining_story_points = story_points.get("remaining", 0)
 
     def set_total_story_points(self, total_points):
         """
@@ -157,7 +203,7 @@ class Card:
         Args:
             total_points (int): The total story points.
         """
-        self.story_points["total"] = total_points
+        self.total_story_points = total_points
 
     def set_spent_story_points(self, spent_points):
         """
@@ -166,7 +212,7 @@ class Card:
         Args:
             spent_points (int): The spent story points.
         """
-        self.story_points["spent"] = spent_points
+        self.spent_story_points = spent_points
 
     def set_remaining_story_points(self, remaining_points):
         """
@@ -175,7 +221,7 @@ class Card:
         Args:
             remaining_points (int): The remaining story points.
         """
-        self.story_points["remaining"] = remaining_points
+        self.remaining_story_points = remaining_points
 
     def set_title(self, title):
         """
@@ -193,13 +239,13 @@ class Card:
         Args:
             labels (list): A list of label names.
         """
-        self.labels = labels
+        self.labels = _intern_all(labels)
 
     def set_list_name(self, list_name):
         """
         Sets the name of the list the card is in.
 
         Args:
-            list_name (str): The new list name.
+            list_name (str or None): The new list name. None is stored as an empty string.
         """
-        self.list_name = list_name
+        self.list_name = sys.intern(list_name or '')
@@ -0,0 +1,175 @@
+"""
+columnar.py
+
+This module contains the `CardColumns` class, a columnar, NumPy-backed view of a board's cards.
+It computes the same story point totals as `Board.calculate_story_points` as vectorized masks
+and sums, so recomputing across many boards does not loop over `Card` objects in Python.
+
+Classes:
+    - CardColumns: Column arrays for card story points, list names and labels.
+
+Example Usage:
+    columns = CardColumns.from_cards(board.get_cards())
+    calcs = columns.calculate_story_points()
+"""
+
+import numpy as np
+
+
+class CardColumns:
+    """
+    Initializes a CardColumns instance from prepared column arrays.
+
+    Args:
+        total (numpy.ndarray): int32 total story points per card.
+        spent (numpy.ndarray): int32 spent story points per card.
+        remaining (numpy.ndarray): int32 remaining story points per card.
+        list_codes (numpy.ndarray): int32 index into list_names per card.
+        list_names (list of str): Distinct list names.
+        label_bits (numpy.ndarray): Bitmask of the labels on each card, one bit per entry
+            in label_names.
+        label_names (list of str): Distinct label names.
+    """
+    def __init__(
+            self,
+            total,
+            spent,
+            remaining,
+            list_codes,
+            list_names,
+            label_bits,
+            label_names):
+        self.total = total
+        self.spent = spent
+        self.remaining = remaining
+        self.list_codes = list_codes
+        self.list_names = list_names
+        self.label_bits = label_bits
+        self.label_names = label_names
+        self.label_index = {name: bit for bit, name in enumerate(label_names)}
+
+    @classmethod
+    def from_cards(cls, cards):
+        """
+        Builds the columns from a list of Card objects.
+
+        Args:
+            cards (list of Card): The cards to convert.
+
+        Returns:
+            CardColumns: The columnar representation of the cards.
+        """
+        n_cards = len(cards)
+        total = np.fromiter(
+            (card.get_total_story_points() for card in cards), dtype=np.int32, count=n_cards)
+        spent = np.fromiter(
+            (card.get_spent_story_points() for card in cards), dtype=np.int32, count=n_cards)
+        remaining = np.fromiter(
+            (card.get_remaining_story_points() for card in cards), dtype=np.int32, count=n_cards)
+
+        # Encode list names as categorical codes
+        list_lookup = {}
+        list_codes = np.fromiter(
+            (list_lookup.setdefault(card.get_list_name(), len(list_lookup)) for card in cards),
+            dtype=np.int32,
+            count=n_cards
+        )
+
+        # Encode labels as one bit per distinct label name
+        label_lookup = {}
+        bits = []
+        for card in cards:
+            card_bits = 0
+            for label in card.get_labels():
+                card_bits |= 1 << label_lookup.setdefault(label, len(label_lookup))
+            bits.append(card_bits)
+        # Boards with more than 64 distinct labels fall back to arbitrary-size integers
+        label_dtype = np.uint64 if len(label_lookup) <= 64 else object
+        label_bits = np.array(bits, dtype=label_dtype)
+
+        return cls(
+            total=total,
+            spent=spent,
+            remaining=remaining,
+            list_codes=list_codes,
+            list_names=list(list_lookup),
+            label_bits=label_bits,
+            label_names=list(label_lookup)
+        )
+
+    def __len__(self):
+        return len(self.total)
+
+    def has_label(self, label):
+        """
+        Flags the cards carrying a label.
+
+        Args:
+            label (str): The label name.
+
+        Returns:
+            numpy.ndarray: Boolean mask, True for cards with the label.
+        """
+        bit = self.label_index.get(label)
+        if bit is None:
+            return np.zeros(len(self), dtype=bool)
+        mask = self.label_bits.dtype.type(1 << bit)
+        return (self.label_bits & mask) != 0
+
+    def in_list_containing(self, text):
+        """
+        Flags the cards whose list name contains the given text.
+
+        Args:
+            text (str): Text to look for in the list name, e.g. 'Done'.
+
+        Returns:
+            numpy.ndarray: Boolean mask, True for matching cards.
+        """
+        matching_lists = np.array([text in name for name in self.list_names], dtype=bool)
+        if len(matching_lists) == 0:
+            return np.zeros(len(self), dtype=bool)
+        return matching_lists[self.list_codes]
+
+    def calculate_story_points(self):
+        """
+        Calculates story points for the cards with vectorized masks and sums.
+
+        Returns:
+            dict: A dictionary with calculated story points for
+                'planned', 'unplanned', and 'retro' categories.
+        """
+        is_unplanned = self.has_label('UNPLANNED')
+        is_retro = self.has_label('RETRO')
+        is_done = self.in_list_containing('Done')
+        not_done = ~is_done
+
+        # Determine category
+        retro = ~is_unplanned & is_retro & ~(is_done | (self.spent > 0))
+        planned = ~is_unplanned & ~retro
+
+        # Spent points above the total count as retro work for planned and unplanned cards
+        actual_spent = np.minimum(self.spent, self.total)
+        extra_spent = np.maximum(self.spent - self.total, 0)
+        extra_retro = int(extra_spent[~retro].sum(dtype=np.int64))
+
+        def masked_sum(values, mask):
+            return int(values[mask].sum(dtype=np.int64))
+
+        return {
+            "unplanned": {
+                "total": masked_sum(self.total, is_unplanned),
+                "spent": masked_sum(actual_spent, is_unplanned),
+                "remaining": masked_sum(self.remaining, is_unplanned & not_done)
+            },
+            "planned": {
+                "total": masked_sum(self.total, planned),
+                "spent": masked_sum(actual_spent, planned),
+                "remaining": masked_sum(self.remaining, planned & not_done)
+            },
+            "retro": {
+                "total": masked_sum(self.total, retro) + extra_retro,
+                "spent": masked_sum(self.spent, retro) + extra_retro,
+                "remaining": masked_sum(self.remaining, retro & not_done)
+            }
+        }
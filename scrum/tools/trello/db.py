@@ -8,15 +8,48 @@ This module contains the `SprintDBManager` class for interacting
 Classes:
     - SprintDBManager: Manages database operations for sprint data.
 
+Setting `pool_size` in the `mysql` config block enables pooled mode: connections are taken
+from a per-database `mysql.connector.pooling` pool and returned to it on close, instead of
+being opened and torn down for every call. The pool pings each connection as it is checked
+out and reconnects stale ones.
+
+The `iter_*` methods stream results and yield rows one at a time, so scanning the whole board
+archive keeps memory flat however many boards are stored.
+
+`store_board_snapshot` stores board data compressed in the `board_snapshots` table, keyed by
+the SHA-256 of its content, and leaves only that hash in the `boards` row: in its
+`snapshot_hash` column and as a small reference in `json_data`. Identical snapshots are stored
+once, and saving a board unchanged since its latest row reuses that row. Reads load and
+decompress the snapshot from `board_snapshots`; rows holding inline JSON are still read as is.
+The codec is chosen with `snapshot_codec` in the `mysql` config block ('zlib' by default). The
+table and column are created by `sql/board_snapshots.sql`.
+
+Setting `snapshot_mode` to 'delta' stores each new snapshot as the per-card differences from
+the board's previous snapshot, with a full keyframe every `keyframe_interval` snapshots (10 by
+default) or whenever the delta would not be smaller. Reads by row ID, board ID or through
+`iter_board_data_from_db` rebuild delta snapshots from the nearest keyframe, and an LRU cache
+of rebuilt snapshots (`snapshot_cache_size`, 16 by default) keeps walking or extending a
+board's history from re-reading the chain.
+
 Example Usage:
     db_manager = SprintDBManager(config)
     db_manager.insert_data(table='boards', insert_data=board_data)
+    db_manager.store_board_snapshot('your_board_id', 'SPRINT-Now Board', board.get_data())
     board_data = db_manager.get_board_data_from_db(board_id='your_board_id')
+    for board in db_manager.iter_board_data_from_db(board_id='your_board_id'):
+        print(board['id'], len(board['json_data']))
 """
 
 import json
+import re
+import threading
+import time
 import traceback
 import mysql.connector
+from mysql.connector import pooling
+
+from .snapshot import (SnapshotCache, apply_delta, content_hash, decode_snapshot, diff_cards,
+                       encode_snapshot, get_reference_hash, is_delta, snapshot_reference)
 
 
 class SprintDBManager:
@@ -26,9 +59,106 @@ class SprintDBManager:
         Initializes a SprintDBManager instance with MySQL configuration.
 
         Args:
-            config (dict): MySQL configuration parameters.
+            config (dict): MySQL configuration parameters. Optional pooling keys:
+                pool_size (int): Connections per database pool; pooling is off when unset or 0.
+                pool_timeout (float): Seconds to wait for a free pooled connection.
+                    Defaults to 30.
+                reconnect_attempts (int): Attempts to check out a healthy connection when
+                    reconnecting a stale one fails. Defaults to 3.
+                snapshot_codec (str): Codec for stored board snapshots, 'zlib', 'zstd' or
+                    'none'. Defaults to 'zlib'.
+                snapshot_mode (str): 'full' to store every snapshot whole, or 'delta' to
+                    store differences from the board's previous snapshot. Defaults to 'full'.
+                keyframe_interval (int): In delta mode, the most snapshots in a chain that
+                    starts at a full keyframe. Defaults to 10.
+                snapshot_cache_size (int): Rebuilt snapshots kept in memory. Defaults to 16.
         """
         self.mysql_config = config
+        self.pool_size = config.get("pool_size", 0)
+        self.pool_timeout = config.get("pool_timeout", 30)
+        self.reconnect_attempts = config.get("reconnect_attempts", 3)
+        self.snapshot_codec = config.get("snapshot_codec", "zlib")
+        self.snapshot_mode = config.get("snapshot_mode", "full")
+        self.keyframe_interval = config.get("keyframe_interval", 10)
+        self._snapshot_cache = SnapshotCache(config.get("snapshot_cache_size", 16))
+        # Pools are created lazily, one per target database
+        self._pools = {}
+        self._pools_lock = threading.Lock()
+
+    def _connect_args(self, database):
+        """
+        Builds the connection arguments for a database.
+
+        Args:
+            database (str): Target database name.
+
+        Returns:
+            dict: Keyword arguments for mysql.connector.
+        """
+        return {
+            "user": self.mysql_config["user"],
+            "password": self.mysql_config["password"],
+            "host": self.mysql_config["host"],
+            "database": database
+        }
+
+    def _get_pool(self, database):
+        """
+        Returns the connection pool for a database, creating it on first use.
+
+        Args:
+            database (str): Target database name.
+
+        Returns:
+            mysql.connector.pooling.MySQLConnectionPool: The pool.
+        """
+        with self._pools_lock:
+            pool = self._pools.get(database)
+            if pool is None:
+                # Pool names only allow a limited character set and 64 characters
+                pool_name = re.sub(r"[^a-zA-Z0-9._:\-*$#]", "_", f"sprint_db.{database}")[:64]
+                pool = pooling.MySQLConnectionPool(
+                    pool_name=pool_name,
+                    pool_size=self.pool_size,
+                    **self._connect_args(database)
+                )
+                self._pools[database] = pool
+            return pool
+
+    def _get_pooled_cnx(self, database):
+        """
+        Checks out a healthy connection from the database's pool.
+
+        Waits up to pool_timeout seconds for a connection to be returned when the pool is
+        exhausted, and retries when a stale connection cannot be reconnected.
+
+        Args:
+            database (str): Target database name.
+
+        Returns:
+            mysql.connector.pooling.PooledMySQLConnection: A pooled connection; closing it
+                returns it to the pool.
+
+        Raises:
+            mysql.connector.errors.PoolError: If no connection is freed within pool_timeout.
+            mysql.connector.errors.InterfaceError: If reconnecting keeps failing.
+        """
+        pool = self._get_pool(database)
+        deadline = time.monotonic() + self.pool_timeout
+        failed_reconnects = 0
+        while True:
+            try:
+                # The pool pings the connection and reconnects it if the server dropped it
+                return pool.get_connection()
+            except mysql.connector.errors.PoolError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.05)
+            except mysql.connector.errors.InterfaceError:
+                failed_reconnects += 1
+                if failed_reconnects >= self.reconnect_attempts:
+                    raise
+                time.sleep(failed_reconnects)
 
     def get_cnx(self, database="default"):
         """
@@ -39,19 +169,18 @@ class SprintDBManager:
                 Defaults to the one specified in the config.
 
         Returns:
-            mysql.connector.connection.MySQLConnection: A MySQL connection object.
+            mysql.connector.connection.MySQLConnection: A MySQL connection object. In pooled
+                mode this is a pooled connection that returns to its pool when closed.
         """
         if database == "default":
             target_database = self.mysql_config["database"]
         else:
             target_database = database
 
-        cnx = mysql.connector.connect(
-            user=self.mysql_config["user"],
-            password=self.mysql_config["password"],
-            host=self.mysql_config["host"],
-            database=target_database
-        )
+        if self.pool_size:
+            return self._get_pooled_cnx(target_database)
+
+        cnx = mysql.connector.connect(**self._connect_args(target_database))
         return cnx
 
     def insert_data(self, table, insert_data):
@@ -95,6 +224,67 @@ class SprintDBManager:
 
         return inserted_id
 
+    def insert_many(self, table, rows, batch_size=500):
+        """
+        Inserts many rows into a specified table using batched multi-row inserts.
+
+        Each batch is sent as one parameterized multi-row INSERT through executemany and
+        committed on its own, so a failure rolls back only the batch being written.
+
+        Args:
+            table (str): The name of the table to insert data into.
+            rows (list of dict): Rows to insert, all with the same keys (column names).
+            batch_size (int, optional): Number of rows per INSERT and commit. Defaults to 500.
+
+        Returns:
+            tuple: The (first, last) IDs assigned to the inserted rows, or None if rows is
+                empty. The range assumes MySQL assigns consecutive IDs within each batch.
+
+        Raises:
+            ValueError: If the rows do not all have the same columns.
+            Exception: If an error occurs during the insertion.
+        """
+        rows = list(rows)
+        if not rows:
+            return None
+        columns = list(rows[0].keys())
+        if any(set(row.keys()) != set(columns) for row in rows):
+            raise ValueError("All rows must have the same columns.")
+
+        # Prepare one parameterized statement for every batch
+        placeholders = ", ".join(["%s"] * len(columns))
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+        cnx = self.get_cnx()
+        cursor = cnx.cursor()
+        first_id = None
+        last_id = None
+
+        try:
+            for start in range(0, len(rows), batch_size):
+                batch = [
+                    tuple(row[column] for column in columns)
+                    for row in rows[start:start + batch_size]
+                ]
+                # executemany rewrites an INSERT into a single multi-row VALUES statement
+                cursor.executemany(sql, batch)
+                cnx.commit()
+
+                # The insert ID of a multi-row INSERT is the ID of its first row
+                batch_first_id = cursor.lastrowid
+                if first_id is None:
+                    first_id = batch_first_id
+                last_id = batch_first_id + len(batch) - 1
+        except Exception as e:
+            cnx.rollback()
+            traceback.print_exc()
+            raise Exception(
+                'Error occurred while inserting into the table') from e
+        finally:
+            cnx.close()
+
+        return first_id, last_id
+
     def get_board_data_from_db(self, board_id=None, assigned_board_id=None):
         """
         Retrieves board data from the database.
@@ -114,25 +304,217 @@ class SprintDBManager:
 
         try:
             if board_id is not None:
-                select_statement = "SELECT json_data FROM boards WHERE board_id = %s;"
+                # Only the first snapshot of the board is returned, so fetch only that one
+                select_statement = (
+                    "SELECT json_data, snapshot_hash FROM boards WHERE board_id = %s "
+                    "ORDER BY id LIMIT 1;")
                 cursor.execute(select_statement, (board_id,))
             elif assigned_board_id is not None:
-                select_statement = "SELECT json_data FROM boards WHERE id = %s;"
+                select_statement = "SELECT json_data, snapshot_hash FROM boards WHERE id = %s;"
                 cursor.execute(select_statement, (assigned_board_id,))
             else:
                 raise ValueError(
                     "Either 'board_id' or 'assigned_board_id' must be provided.")
 
+            # Read the whole result so the snapshot lookup can reuse the connection
             results = cursor.fetchall()
 
             if not results:
                 raise Exception("Board data not found in the database.")
 
-            board_data_json = results[0][0]
-            return json.loads(board_data_json)
+            return self._load_board_data(cursor, *results[0])
         finally:
             cnx.close()
 
+    def _fetch_snapshot_payload(self, cursor, snapshot_hash):
+        """
+        Reads and decodes a stored snapshot payload, which may be a delta.
+
+        Args:
+            cursor (mysql.connector.cursor.MySQLCursor): Cursor on a connection with no
+                unread results.
+            snapshot_hash (str): The snapshot's content hash.
+
+        Returns:
+            list or dict: The board data, or a delta from its parent snapshot.
+
+        Raises:
+            Exception: If the snapshot is missing.
+        """
+        cursor.execute(
+            "SELECT payload FROM board_snapshots WHERE content_hash = %s;", (snapshot_hash,))
+        result = cursor.fetchall()
+        if not result:
+            raise Exception(f"Board snapshot {snapshot_hash} not found in the database.")
+        return decode_snapshot(result[0][0])
+
+    def _rebuild_snapshot(self, cursor, snapshot_hash):
+        """
+        Rebuilds a snapshot, following its delta chain back to a cached snapshot or keyframe.
+
+        Args:
+            cursor (mysql.connector.cursor.MySQLCursor): Cursor on a connection with no
+                unread results.
+            snapshot_hash (str): The snapshot's content hash.
+
+        Returns:
+            tuple: (board_data, depth), where depth counts the deltas since the keyframe.
+        """
+        deltas = []
+        current_hash = snapshot_hash
+        cached = self._snapshot_cache.get(current_hash)
+        while cached is None:
+            payload = self._fetch_snapshot_payload(cursor, current_hash)
+            if not is_delta(payload):
+                cached = (payload, 0)
+                self._snapshot_cache.put(current_hash, payload, 0)
+                break
+            deltas.append((current_hash, payload))
+            current_hash = payload["parent"]
+            cached = self._snapshot_cache.get(current_hash)
+
+        # Replay the deltas from the oldest, caching each rebuilt snapshot on the way
+        board_data, depth = cached
+        for delta_hash, delta in reversed(deltas):
+            board_data = apply_delta(board_data, delta)
+            depth = delta["depth"]
+            self._snapshot_cache.put(delta_hash, board_data, depth)
+        return board_data, depth
+
+    def get_snapshot(self, snapshot_hash):
+        """
+        Rebuilds a stored board snapshot from its content hash.
+
+        Args:
+            snapshot_hash (str): The snapshot's content hash.
+
+        Returns:
+            list: The board data.
+
+        Raises:
+            Exception: If the snapshot, or a snapshot it is based on, is missing.
+        """
+        cnx = self.get_cnx()
+        cursor = cnx.cursor()
+
+        try:
+            return self._rebuild_snapshot(cursor, snapshot_hash)[0]
+        finally:
+            cnx.close()
+
+    def _load_board_data(self, cursor, json_data, snapshot_hash):
+        """
+        Loads the board data of a `boards` row.
+
+        Snapshots are rebuilt from `board_snapshots`, through the cache of rebuilt snapshots
+        and any delta chain. Rows saved before snapshots were stored separately hold the
+        board data inline in `json_data`, which is parsed as is.
+
+        Args:
+            cursor (mysql.connector.cursor.MySQLCursor): Cursor used to read the snapshot.
+            json_data (str): The row's `json_data`.
+            snapshot_hash (str or None): The row's `snapshot_hash`.
+
+        Returns:
+            list: The board data.
+        """
+        if snapshot_hash is None:
+            parsed = json.loads(json_data)
+            snapshot_hash = get_reference_hash(parsed)
+            if snapshot_hash is None:
+                return parsed
+        return self._rebuild_snapshot(cursor, snapshot_hash)[0]
+
+    def _encode_board_payload(self, cursor, board_data, parent_hash):
+        """
+        Encodes board data as a keyframe, or in delta mode as a delta from its parent.
+
+        Args:
+            cursor (mysql.connector.cursor.MySQLCursor): Cursor used to rebuild the parent.
+            board_data (list): The board data.
+            parent_hash (str or None): Content hash of the board's previous snapshot, or None
+                if it has no stored snapshot.
+
+        Returns:
+            tuple: (payload, depth), the encoded payload and its depth in the delta chain.
+        """
+        keyframe = encode_snapshot(board_data, self.snapshot_codec)
+        if self.snapshot_mode != "delta" or parent_hash is None:
+            return keyframe, 0
+
+        parent_data, parent_depth = self._rebuild_snapshot(cursor, parent_hash)
+        if parent_depth + 1 >= self.keyframe_interval:
+            return keyframe, 0
+        delta = diff_cards(parent_data, board_data, parent_hash, parent_depth + 1)
+        if delta is None:
+            return keyframe, 0
+        payload = encode_snapshot(delta, self.snapshot_codec)
+        if len(payload) >= len(keyframe):
+            return keyframe, 0
+        return payload, delta["depth"]
+
+    def store_board_snapshot(self, board_id, board_name, board_data):
+        """
+        Stores a compressed, content-addressed board snapshot.
+
+        The snapshot is written to `board_snapshots` once per distinct content, and a `boards`
+        row referencing it is added unless the latest row of the board already holds the
+        same content. In delta mode the snapshot is stored as a delta from that latest row.
+
+        Args:
+            board_id (str): The Trello board ID.
+            board_name (str): The board name.
+            board_data (list): The board data, as returned by Board.get_data.
+
+        Returns:
+            int: The ID of the `boards` row holding the snapshot.
+
+        Raises:
+            Exception: If an error occurs while storing the snapshot.
+        """
+        snapshot_hash = content_hash(board_data)
+        cnx = self.get_cnx()
+        cursor = cnx.cursor(buffered=True)
+
+        try:
+            cursor.execute(
+                "SELECT id, json_data, snapshot_hash FROM boards WHERE board_id = %s "
+                "ORDER BY id DESC LIMIT 1;",
+                (board_id,))
+            latest = cursor.fetchone()
+            parent_hash = None
+            if latest is not None:
+                # Rows saved before snapshots were stored separately hold their data inline
+                parent_hash = latest[2] or get_reference_hash(json.loads(latest[1]))
+                latest_hash = parent_hash or content_hash(json.loads(latest[1]))
+                if latest_hash == snapshot_hash:
+                    return latest[0]
+
+            payload, depth = self._encode_board_payload(cursor, board_data, parent_hash)
+            cursor.execute(
+                "INSERT IGNORE INTO board_snapshots (content_hash, codec, payload) "
+                "VALUES (%s, %s, %s);",
+                (snapshot_hash, self.snapshot_codec, payload))
+            # Content already stored keeps its original payload, whose depth may differ
+            if cursor.rowcount == 1:
+                self._snapshot_cache.put(snapshot_hash, board_data, depth)
+            cursor.execute(
+                "INSERT INTO boards (board_id, board_name, json_data, snapshot_hash) "
+                "VALUES (%s, %s, %s, %s);",
+                (board_id, board_name, snapshot_reference(snapshot_hash), snapshot_hash))
+            cnx.commit()
+
+            inserted_id = cursor.lastrowid
+        except Exception as e:
+            cnx.rollback()
+            traceback.print_exc()
+            raise Exception(
+                'Error occurred while storing the board snapshot') from e
+        finally:
+            cnx.close()
+
+        return inserted_id
+
     def get_sprint_summary_from_db(self, board_id):
         """
         Retrieves sprint summary data from the database for a given board ID.
@@ -185,3 +567,88 @@ class SprintDBManager:
             return result
         finally:
             cnx.close()
+
+    def iter_query(self, query, params=None, database="default", dic=False, fetch_size=500):
+        """
+        Executes a MySQL query and streams its results through an unbuffered cursor.
+
+        Rows are read from the server fetch_size at a time instead of being materialized at
+        once. The connection stays checked out until the generator is exhausted or closed;
+        closing it early drains the remaining rows so the connection can be reused.
+
+        Args:
+            query (str): The MySQL query to execute.
+            params (tuple, optional): Query parameters. Defaults to None.
+            database (str, optional): The database to use. Defaults to 'default'.
+            dic (bool, optional): Whether to yield rows as dictionaries. Defaults to False.
+            fetch_size (int, optional): Rows read from the server per fetch. Defaults to 500.
+
+        Yields:
+            tuple or dict: One result row at a time.
+        """
+        cnx = self.get_cnx(database)
+        cursor = cnx.cursor(buffered=False, dictionary=dic)
+        exhausted = False
+
+        try:
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    exhausted = True
+                    break
+                yield from rows
+        finally:
+            try:
+                # Unread rows must be consumed before the connection can be closed or reused
+                while not exhausted and cursor.fetchmany(fetch_size):
+                    pass
+            except mysql.connector.Error:
+                pass
+            cnx.close()
+
+    def iter_board_data_from_db(self, board_id=None, fetch_size=50):
+        """
+        Streams stored board snapshots, parsing each one only when it is yielded.
+
+        Rows are read fetch_size at a time, each page on a buffered cursor, so their
+        snapshots can be loaded and decompressed on the same connection. The connection is
+        returned before the page is yielded, so none is held while the caller processes the
+        rows.
+
+        Args:
+            board_id (str, optional): Only yield snapshots of this Trello board.
+                Defaults to every stored board.
+            fetch_size (int, optional): Snapshots read from the server per page.
+                Defaults to 50.
+
+        Yields:
+            dict: A snapshot with 'id', 'board_id', 'board_name', 'created_at' and the
+                parsed 'json_data', in ascending ID order.
+        """
+        select_statement = (
+            "SELECT id, board_id, board_name, created_at, json_data, snapshot_hash FROM boards "
+            "WHERE id > %s")
+        if board_id is not None:
+            select_statement += " AND board_id = %s"
+        select_statement += " ORDER BY id LIMIT %s;"
+
+        last_id = 0
+        while True:
+            params = (last_id, board_id, fetch_size) if board_id is not None else (
+                last_id, fetch_size)
+            cnx = self.get_cnx()
+            try:
+                cursor = cnx.cursor(buffered=True, dictionary=True)
+                cursor.execute(select_statement, params)
+                rows = cursor.fetchall()
+                lookup_cursor = cnx.cursor(buffered=True)
+                for row in rows:
+                    row['json_data'] = self._load_board_data(
+                        lookup_cursor, row['json_data'], row.pop('snapshot_hash'))
+            finally:
+                cnx.close()
+            yield from rows
+            if len(rows) < fetch_size:
+                return
+            last_id = rows[-1]['id']
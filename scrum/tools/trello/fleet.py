@@ -0,0 +1,217 @@
+"""
+fleet.py
+
+This module contains the fleet mode, which calculates story points for many boards in one run
+and consolidates them into a single report.
+
+Board snapshots are fetched concurrently on asyncio. Every client shares the rate limit
+scheduler of its API key and token, so the whole fleet stays within Trello's limits. Each
+snapshot is handed to a process pool as soon as it arrives, where the cards are extracted and
+the story points calculated, so parsing large boards overlaps with fetching the others and
+uses every CPU.
+
+Functions:
+    - get_fleet_configs: Builds the configuration of each board in the fleet.
+    - process_board: Extracts the cards of one board snapshot and calculates its story points.
+    - run_fleet: Fetches and processes every board and returns the consolidated report.
+
+Example Usage:
+    config = load_config("config.json")
+    report = run_fleet(get_fleet_configs(config))
+    print(report["boards_per_second"])
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from trello.aggregator import CATEGORIES
+from trello.async_api import AsyncTrelloAPI
+from trello.board import Board
+
+
+def get_fleet_configs(config):
+    """
+    Builds the configuration of each board in the fleet.
+
+    Each entry of the 'fleet' list is merged over the 'board' block, so shared settings such as
+    the API key and token only need to be given once.
+
+    Args:
+        config (dict): The loaded config.json.
+
+    Returns:
+        list of dict: One board configuration per fleet entry, or the 'board' block alone if
+            there is no 'fleet' list.
+
+    Raises:
+        ValueError: If a fleet entry has no board ID.
+    """
+    board_config = config.get('board', {})
+    fleet = config.get('fleet')
+    if not fleet:
+        return [board_config]
+    board_configs = []
+    for entry in fleet:
+        merged = {**board_config, **entry}
+        if not merged.get('board_id'):
+            raise ValueError(f"Fleet entry has no board_id: {entry}")
+        board_configs.append(merged)
+    return board_configs
+
+
+def process_board(board_config, snapshot):
+    """
+    Extracts the cards of one board snapshot and calculates its story points.
+
+    Runs in a worker process, so it only takes and returns plain data.
+
+    Args:
+        board_config (dict): The board configuration.
+        snapshot (dict): Result of TrelloAPI.get_board_snapshot().
+
+    Returns:
+        dict: The board's 'cards' count, story point 'calcs' and past sprint story points.
+    """
+    board = Board.from_snapshot(None, snapshot, board_config=board_config)
+    board.extract_cards()
+    return {
+        "cards": len(board.get_cards()),
+        "calcs": board.calculate_story_points(),
+        "unplanned_past_sprints": board.get_unplanned_past_sprints(),
+        "retro_past_sprints": board.get_retro_past_sprints()
+    }
+
+
+def _make_api(board_config, cache=None):
+    """
+    Creates the client fetching one board.
+
+    Args:
+        board_config (dict): The board configuration.
+        cache (ResponseCache, optional): Cache for GET responses. Defaults to None.
+
+    Returns:
+        AsyncTrelloAPI: The client.
+    """
+    # Concurrency is bounded across the fleet, so each board needs a single worker
+    return AsyncTrelloAPI(
+        board_id=board_config['board_id'],
+        api_key=board_config['api_key'],
+        api_token=board_config['api_token'],
+        max_concurrency=1,
+        cache=cache
+    )
+
+
+async def _run_board(board_config, api_factory, semaphore, pool, clock):
+    """
+    Fetches one board and processes it in the pool.
+
+    Args:
+        board_config (dict): The board configuration.
+        api_factory (callable): Creates the client for a board configuration.
+        semaphore (asyncio.Semaphore): Bounds the boards fetched at once.
+        pool (ProcessPoolExecutor): The worker processes.
+        clock (callable): Returns the current time in seconds.
+
+    Returns:
+        dict: The board's result, holding an 'error' instead if it could not be processed.
+    """
+    result = {
+        "board_id": board_config['board_id'],
+        "name": board_config.get('name', board_config['board_id'])
+    }
+    try:
+        started = clock()
+        async with semaphore:
+            api = api_factory(board_config)
+            try:
+                snapshot = await api.get_board_snapshot(
+                    card_fields=Board.CARD_FIELDS,
+                    list_fields=Board.LIST_FIELDS,
+                    member_fields=Board.MEMBER_FIELDS
+                )
+            finally:
+                api.close()
+        fetched = clock()
+        loop = asyncio.get_running_loop()
+        result.update(await loop.run_in_executor(pool, process_board, board_config, snapshot))
+        result["fetch_seconds"] = fetched - started
+        result["process_seconds"] = clock() - fetched
+    except Exception as e:
+        # One failing board must not stop the rest of the fleet
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+async def _run_boards(board_configs, api_factory, max_concurrency, pool, clock):
+    """
+    Runs every board concurrently.
+
+    Returns:
+        list of dict: The board results, in configuration order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return await asyncio.gather(*(
+        _run_board(board_config, api_factory, semaphore, pool, clock)
+        for board_config in board_configs
+    ))
+
+
+def run_fleet(
+        board_configs,
+        max_concurrency=8,
+        processes=None,
+        cache=None,
+        api_factory=None,
+        clock=time.perf_counter):
+    """
+    Fetches and processes every board and returns the consolidated report.
+
+    Args:
+        board_configs (list of dict): The board configurations, e.g. from get_fleet_configs().
+        max_concurrency (int, optional): Most boards fetched at once. Defaults to 8.
+        processes (int, optional): Worker processes calculating story points.
+            Defaults to the number of CPUs, capped at the number of boards.
+        cache (ResponseCache, optional): Cache for GET responses. Defaults to None.
+        api_factory (callable, optional): Creates the async client for a board configuration.
+            Defaults to an AsyncTrelloAPI using the configured credentials.
+        clock (callable, optional): Returns the current time in seconds.
+            Defaults to time.perf_counter.
+
+    Returns:
+        dict: The per-board results under 'boards', story points summed over the boards
+            under 'totals', the 'succeeded' and 'failed' counts, 'elapsed_seconds' and
+            'boards_per_second'.
+    """
+    if api_factory is None:
+        api_factory = functools.partial(_make_api, cache=cache)
+    if processes is None:
+        processes = min(os.cpu_count() or 1, max(len(board_configs), 1))
+
+    started = clock()
+    # Workers are spawned rather than forked, since the fetching threads are already running
+    with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn")) as pool:
+        boards = asyncio.run(
+            _run_boards(board_configs, api_factory, max_concurrency, pool, clock))
+    elapsed = clock() - started
+
+    totals = {category: {"total": 0, "spent": 0, "remaining": 0} for category in CATEGORIES}
+    succeeded = [board for board in boards if "error" not in board]
+    for board in succeeded:
+        for category, values in board["calcs"].items():
+            for key, value in values.items():
+                totals[category][key] += value
+    return {
+        "boards": boards,
+        "totals": totals,
+        "succeeded": len(succeeded),
+        "failed": len(boards) - len(succeeded),
+        "elapsed_seconds": elapsed,
+        "boards_per_second": len(boards) / elapsed if elapsed > 0 else 0.0
+    }
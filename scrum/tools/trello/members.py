@@ -0,0 +1,200 @@
+"""
+members.py
+
+This module contains the `MemberDirectory` class, which maps Trello member IDs to member
+details such as full names for every script that needs them.
+
+Members are resolved from a persistent on-disk cache first, since member names almost never
+change. Members missing from it are resolved with a single request for the board's members,
+and only members no longer on the board are requested individually, concurrently when the API
+client supports it. Members included in a board snapshot can be added without any request.
+
+Classes:
+    - MemberDirectory: Resolves member IDs to details with a persistent TTL cache.
+
+Example Usage:
+    directory = MemberDirectory(trello_api)
+    directory.add_members(board.get_members())
+    owner_lookup = directory.get_full_names(trello_api.get_board_member_ids())
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / ".cache" / "members.json"
+DEFAULT_TTL = 7 * 24 * 3600
+MEMBER_FIELDS = ("id", "fullName", "username")
+
+
+class MemberDirectory:
+    """
+    Initializes a MemberDirectory resolving members through a Trello API client.
+
+    Args:
+        api (TrelloAPI or SyncTrelloAPI): The API client used for members not in the cache.
+        cache_path (str or Path, optional): JSON file persisting resolved members, or None to
+            keep them in memory only. Defaults to `.cache/members.json` under the tools
+            directory.
+        ttl (float, optional): Seconds a resolved member is reused before it is requested
+            again. Defaults to 7 days.
+        fields (tuple of str, optional): Member fields to request. Defaults to MEMBER_FIELDS.
+        clock (callable, optional): Returns the current epoch time. Defaults to time.time.
+    """
+    def __init__(
+            self,
+            api,
+            cache_path=DEFAULT_CACHE_PATH,
+            ttl=DEFAULT_TTL,
+            fields=MEMBER_FIELDS,
+            clock=time.time):
+        self.api = api
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self.ttl = ttl
+        self.fields = tuple(fields)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._stats = {"hits": 0, "board_requests": 0, "member_requests": 0}
+
+    def _load(self):
+        """
+        Reads the persisted members.
+
+        Returns:
+            dict: Entries of 'fetched_at' and 'details' keyed by member ID; empty if the cache
+                file is missing or unreadable.
+        """
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """ Writes the members atomically so concurrent readers never see a partial file """
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(self._entries, tmp_file)
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _is_fresh(self, entry, now):
+        """
+        Tells whether a cached member can be reused.
+
+        Args:
+            entry (dict or None): The cached entry, or None if the member is not cached.
+            now (float): The current epoch time.
+
+        Returns:
+            bool: True if the entry is within the TTL and holds every requested field.
+        """
+        return (entry is not None
+                and now - entry["fetched_at"] < self.ttl
+                and all(field in entry["details"] for field in self.fields if field != "id"))
+
+    def add_members(self, members):
+        """
+        Adds members whose details are already known, e.g. from a board snapshot.
+
+        Args:
+            members (list of dict): Member dictionaries holding at least 'id'.
+        """
+        now = self.clock()
+        with self._lock:
+            for member in members:
+                self._entries[member["id"]] = {"fetched_at": now, "details": member}
+            self._save()
+
+    def resolve(self, member_ids):
+        """
+        Resolves member IDs to member details.
+
+        Args:
+            member_ids (list of str): Trello member IDs.
+
+        Returns:
+            dict: Member details keyed by member ID, in request order.
+        """
+        member_ids = list(dict.fromkeys(member_ids))
+        now = self.clock()
+        with self._lock:
+            missing = [
+                member_id for member_id in member_ids
+                if not self._is_fresh(self._entries.get(member_id), now)
+            ]
+            self._stats["hits"] += len(member_ids) - len(missing)
+            if missing:
+                self._fetch(missing)
+                self._save()
+            return {
+                member_id: self._entries[member_id]["details"]
+                for member_id in member_ids if member_id in self._entries
+            }
+
+    def _fetch(self, member_ids):
+        """
+        Requests missing members: the whole board in one call, then any members left over.
+
+        Args:
+            member_ids (list of str): IDs of the members to request.
+        """
+        now = self.clock()
+        board_members = self.api.get_board_members(fields=self.fields)
+        self._stats["board_requests"] += 1
+        for member in board_members:
+            self._entries[member["id"]] = {"fetched_at": now, "details": member}
+
+        # Members who left the board are not listed, so request them individually
+        listed = {member["id"] for member in board_members}
+        remaining = [member_id for member_id in member_ids if member_id not in listed]
+        if not remaining:
+            return
+        self._stats["member_requests"] += len(remaining)
+        if hasattr(self.api, "get_members_details"):
+            details = self.api.get_members_details(remaining, fields=self.fields)
+        else:
+            details = {
+                member_id: self.api.get_member_details(member_id, fields=self.fields)
+                for member_id in remaining
+            }
+        for member_id, member in details.items():
+            self._entries[member_id] = {"fetched_at": now, "details": member}
+
+    def get_full_names(self, member_ids):
+        """
+        Maps member IDs to full names.
+
+        Args:
+            member_ids (list of str): Trello member IDs.
+
+        Returns:
+            dict: Full names keyed by member ID.
+        """
+        return {
+            member_id: details.get("fullName", "")
+            for member_id, details in self.resolve(member_ids).items()
+        }
+
+    def get_stats(self):
+        """
+        Reports how members were resolved since the directory was created.
+
+        Returns:
+            dict: Counts of cache 'hits', 'board_requests' and individual 'member_requests'.
+        """
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,260 @@
+"""
+ratelimit.py
+
+This module contains the rate-limit-aware scheduler used by `TrelloAPI` to stay within the
+limits Trello publishes for each API key and each API token.
+
+Each limit is modeled as a token bucket. Requests wait in line for a token instead of
+failing. The buckets are corrected from the `x-rate-limit-*` response headers. A 429 or 5xx
+response is retried with jittered exponential backoff, and a 429 pauses every request that
+shares the exhausted limit.
+
+Classes:
+    - TokenBucket: Thread-safe token bucket that hands out reservations in order.
+    - RequestScheduler: Queues, sends and retries requests against a set of buckets.
+
+Functions:
+    - get_scheduler: Returns the scheduler shared by every client using the same credentials.
+
+Example Usage:
+    scheduler = get_scheduler(api_key, api_token)
+    response = scheduler.send(lambda: session.get(url, timeout=60))
+    print(scheduler.get_metrics())
+"""
+
+import random
+import threading
+import time
+
+# Published Trello limits: 300 requests per 10 seconds per key, 100 per 10 seconds per token
+API_KEY_LIMIT = 300
+API_TOKEN_LIMIT = 100
+LIMIT_INTERVAL = 10.0
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    """
+    Initializes a TokenBucket that refills continuously up to its capacity.
+
+    Args:
+        capacity (int): Number of requests allowed per interval.
+        interval (float): Length of the interval in seconds.
+        clock (callable, optional): Monotonic clock returning seconds. Defaults to
+            time.monotonic.
+    """
+    def __init__(self, capacity, interval, clock=time.monotonic):
+        self.capacity = capacity
+        self.interval = interval
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated_at = clock()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        """Adds the tokens earned since the last update. Must be called with the lock held."""
+        rate = self.capacity / self.interval
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * rate)
+        self.updated_at = now
+
+    def reserve(self):
+        """Takes one token, going into debt if none are left.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request.
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self.tokens -= 1
+            rate = self.capacity / self.interval
+            wait = -self.tokens / rate if self.tokens < 0 else 0.0
+            return max(wait, self.paused_until - now)
+
+    def sync(self, remaining, capacity=None, interval=None):
+        """Corrects the bucket with the state reported by the server.
+
+        Args:
+            remaining (int): Requests the server says are left in the current interval.
+            capacity (int, optional): Limit reported by the server.
+            interval (float, optional): Interval reported by the server, in seconds.
+        """
+        with self._lock:
+            self._refill(self.clock())
+            if capacity:
+                self.capacity = capacity
+            if interval:
+                self.interval = interval
+            self.tokens = min(self.tokens, float(remaining))
+
+    def pause(self, seconds):
+        """Holds back every reservation for the given number of seconds.
+
+        Args:
+            seconds (float): How long to pause.
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, self.clock() + seconds)
+
+
+class RequestScheduler:
+    """
+    Initializes a RequestScheduler over the given token buckets.
+
+    Args:
+        buckets (dict): TokenBucket instances keyed by the rate limit header prefix they
+            model, e.g. 'api-key' and 'api-token'.
+        max_retries (int, optional): Retries allowed per request after a 429 or 5xx.
+            Defaults to 5.
+        backoff_base (float, optional): Base backoff delay in seconds. Defaults to 0.5.
+        backoff_cap (float, optional): Upper bound of a backoff delay in seconds.
+            Defaults to 30.
+        sleep (callable, optional): Function used to wait. Defaults to time.sleep.
+        clock (callable, optional): Monotonic clock returning seconds. Defaults to
+            time.monotonic.
+    """
+    def __init__(
+            self,
+            buckets,
+            max_retries=5,
+            backoff_base=0.5,
+            backoff_cap=30.0,
+            sleep=time.sleep,
+            clock=time.monotonic):
+        self.buckets = buckets
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.sleep = sleep
+        self.clock = clock
+        self.metrics = {
+            "requests": 0,
+            "retries": 0,
+            "throttled": 0,
+            "server_errors": 0,
+            "queued_time": 0.0,
+            "max_queued_time": 0.0
+        }
+        self._metrics_lock = threading.Lock()
+
+    def get_metrics(self):
+        """
+        Returns a snapshot of the scheduler metrics.
+
+        Returns:
+            dict: Counts of requests, retries, throttled (429) and server_errors (5xx)
+                responses, plus total and maximum seconds spent queued.
+        """
+        with self._metrics_lock:
+            return dict(self.metrics)
+
+    def _record(self, **increments):
+        """Adds to the scheduler metrics."""
+        with self._metrics_lock:
+            for key, value in increments.items():
+                self.metrics[key] += value
+
+    def _wait_for_token(self):
+        """Reserves a token from every bucket and waits until all of them allow the request."""
+        wait = max((bucket.reserve() for bucket in self.buckets.values()), default=0.0)
+        if wait > 0:
+            self.sleep(wait)
+        with self._metrics_lock:
+            self.metrics["queued_time"] += wait
+            self.metrics["max_queued_time"] = max(self.metrics["max_queued_time"], wait)
+
+    def observe(self, headers):
+        """Updates the buckets from the rate limit headers of a response.
+
+        Args:
+            headers (Mapping): Response headers (case-insensitive).
+        """
+        for prefix, bucket in self.buckets.items():
+            remaining = headers.get(f"x-rate-limit-{prefix}-remaining")
+            if remaining is None:
+                continue
+            capacity = headers.get(f"x-rate-limit-{prefix}-max")
+            interval_ms = headers.get(f"x-rate-limit-{prefix}-interval-ms")
+            bucket.sync(
+                remaining=int(remaining),
+                capacity=int(capacity) if capacity else None,
+                interval=int(interval_ms) / 1000 if interval_ms else None
+            )
+
+    def backoff(self, attempt):
+        """Computes a full-jitter exponential backoff delay.
+
+        Args:
+            attempt (int): Zero-based retry attempt.
+
+        Returns:
+            float: Seconds to wait before retrying.
+        """
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def send(self, send_request):
+        """Sends a request once the rate limits allow it, retrying 429 and 5xx responses.
+
+        Args:
+            send_request (callable): Function performing the request and returning a
+                requests.Response.
+
+        Returns:
+            requests.Response: The final response; it may still be an error response once
+                the retries are exhausted.
+        """
+        attempt = 0
+        while True:
+            self._wait_for_token()
+            response = send_request()
+            self._record(requests=1)
+            self.observe(response.headers)
+
+            if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                return response
+
+            delay = self.backoff(attempt)
+            if response.status_code == 429:
+                self._record(throttled=1)
+                retry_after = response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+                # Hold back every request sharing these limits, not just this one
+                for bucket in self.buckets.values():
+                    bucket.pause(delay)
+            else:
+                self._record(server_errors=1)
+                self.sleep(delay)
+            self._record(retries=1)
+            attempt += 1
+
+
+_SCHEDULERS = {}
+_BUCKETS = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_scheduler(api_key, api_token):
+    """
+    Returns the scheduler shared by every client in this process using the same credentials.
+
+    The API key bucket is also shared between schedulers for different tokens of the same key.
+
+    Args:
+        api_key (str): Trello API key.
+        api_token (str): Trello API token.
+
+    Returns:
+        RequestScheduler: The shared scheduler.
+    """
+    with _REGISTRY_LOCK:
+        if (api_key, api_token) not in _SCHEDULERS:
+            key_bucket = _BUCKETS.setdefault(
+                ("api-key", api_key), TokenBucket(API_KEY_LIMIT, LIMIT_INTERVAL))
+            token_bucket = _BUCKETS.setdefault(
+                ("api-token", api_token), TokenBucket(API_TOKEN_LIMIT, LIMIT_INTERVAL))
+            _SCHEDULERS[(api_key, api_token)] = RequestScheduler(
+                {"api-key": key_bucket, "api-token": token_bucket})
+        return _SCHEDULERS[(api_key, api_token)]
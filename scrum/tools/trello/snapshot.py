@@ -0,0 +1,333 @@
+"""
+snapshot.py
+
+This module contains the functions used to store board snapshots compactly: a content hash
+that identifies identical snapshots, and a compressed encoding with a codec header so stored
+snapshots can be decoded whatever codec wrote them.
+
+Encoded snapshots start with the 4-byte magic b"SPB1" followed by a 1-byte codec ID, then the
+canonical JSON of the board data compressed with that codec.
+
+In delta mode a snapshot may instead hold the per-card differences from its parent snapshot:
+the cards added and removed, and the fields changed on the others. A delta is still stored
+under the content hash of the full board it rebuilds, so references never depend on how the
+snapshot was encoded.
+
+Classes:
+    - SnapshotCache: Thread-safe LRU cache of rebuilt snapshots.
+
+Functions:
+    - content_hash: Computes the SHA-256 of a snapshot's canonical JSON.
+    - encode_snapshot: Serializes and compresses board data behind a codec header.
+    - decode_snapshot: Reverses encode_snapshot.
+    - snapshot_reference: Builds a reference to a stored snapshot, as held in `boards.json_data`.
+    - get_reference_hash: Extracts the content hash from a stored reference.
+    - diff_cards: Computes the delta between two boards' cards.
+    - apply_delta: Rebuilds a board's cards from its parent's cards and a delta.
+    - is_delta: Tells delta payloads from full snapshots.
+
+Example Usage:
+    blob = encode_snapshot(board.get_data(), codec="zlib")
+    board_data = decode_snapshot(blob)
+    delta = diff_cards(previous_cards, board.get_data(), previous_hash, depth=1)
+"""
+
+import hashlib
+import json
+import threading
+import zlib
+from collections import OrderedDict
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC = b"SPB1"
+CODEC_IDS = {"none": 0, "zlib": 1, "zstd": 2}
+CODEC_NAMES = {codec_id: name for name, codec_id in CODEC_IDS.items()}
+REFERENCE_KEY = "snapshot_hash"
+DELTA_FORMAT = "board-delta-1"
+
+
+def _canonical_json(board_data):
+    """
+    Serializes board data deterministically so equal data always produces equal bytes.
+
+    Args:
+        board_data (list or dict): The board data.
+
+    Returns:
+        bytes: UTF-8 encoded JSON with sorted keys and no whitespace.
+    """
+    return json.dumps(board_data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(board_data):
+    """
+    Computes the content hash identifying a snapshot.
+
+    Args:
+        board_data (list or dict): The board data.
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical JSON.
+    """
+    return hashlib.sha256(_canonical_json(board_data)).hexdigest()
+
+
+def encode_snapshot(board_data, codec="zlib"):
+    """
+    Serializes and compresses board data behind a codec header.
+
+    Args:
+        board_data (list or dict): The board data.
+        codec (str, optional): 'zlib', 'zstd' (requires the zstandard package) or 'none'.
+            Defaults to 'zlib'.
+
+    Returns:
+        bytes: The encoded snapshot.
+
+    Raises:
+        ValueError: If the codec is unknown or its package is not installed.
+    """
+    raw = _canonical_json(board_data)
+    if codec == "zlib":
+        payload = zlib.compress(raw, 9)
+    elif codec == "zstd":
+        if zstandard is None:
+            raise ValueError("The 'zstd' codec requires the zstandard package.")
+        payload = zstandard.ZstdCompressor(level=10).compress(raw)
+    elif codec == "none":
+        payload = raw
+    else:
+        raise ValueError(f"Unknown snapshot codec '{codec}'.")
+    return MAGIC + bytes([CODEC_IDS[codec]]) + payload
+
+
+def decode_snapshot(blob):
+    """
+    Decodes a snapshot produced by encode_snapshot.
+
+    Args:
+        blob (bytes): The encoded snapshot.
+
+    Returns:
+        list or dict: The board data.
+
+    Raises:
+        ValueError: If the header is missing or names an unavailable codec.
+    """
+    blob = bytes(blob)
+    if blob[:len(MAGIC)] != MAGIC or len(blob) <= len(MAGIC):
+        raise ValueError("Not an encoded board snapshot.")
+    codec = CODEC_NAMES.get(blob[len(MAGIC)])
+    payload = blob[len(MAGIC) + 1:]
+    if codec == "zlib":
+        raw = zlib.decompress(payload)
+    elif codec == "zstd":
+        if zstandard is None:
+            raise ValueError("Decoding this snapshot requires the zstandard package.")
+        raw = zstandard.ZstdDecompressor().decompress(payload)
+    elif codec == "none":
+        raw = payload
+    else:
+        raise ValueError(f"Unknown snapshot codec ID {blob[len(MAGIC)]}.")
+    return json.loads(raw)
+
+
+def snapshot_reference(snapshot_hash):
+    """
+    Builds a reference to a content-addressed snapshot, as `boards.json_data` may hold.
+
+    Args:
+        snapshot_hash (str): The snapshot's content hash.
+
+    Returns:
+        str: JSON object pointing at the stored snapshot.
+    """
+    return json.dumps({REFERENCE_KEY: snapshot_hash})
+
+
+def get_reference_hash(json_data):
+    """
+    Extracts the content hash from parsed `boards.json_data`.
+
+    Args:
+        json_data (list or dict): Parsed `boards.json_data`.
+
+    Returns:
+        str or None: The content hash, or None if the row holds the board data inline.
+    """
+    if isinstance(json_data, dict) and set(json_data) == {REFERENCE_KEY}:
+        return json_data[REFERENCE_KEY]
+    return None
+
+
+def is_delta(payload):
+    """
+    Tells a delta payload from a full snapshot.
+
+    Args:
+        payload (list or dict): A decoded snapshot payload.
+
+    Returns:
+        bool: True if the payload is a delta produced by diff_cards.
+    """
+    return isinstance(payload, dict) and payload.get("format") == DELTA_FORMAT
+
+
+def _index_cards(cards):
+    """
+    Indexes cards by ID.
+
+    Args:
+        cards (list of dict): Card dictionaries.
+
+    Returns:
+        dict or None: Cards keyed by ID, or None if a card has no ID or IDs repeat.
+    """
+    if not isinstance(cards, list):
+        return None
+    cards_by_id = {}
+    for card in cards:
+        card_id = card.get("id") if isinstance(card, dict) else None
+        if card_id is None or card_id in cards_by_id:
+            return None
+        cards_by_id[card_id] = card
+    return cards_by_id
+
+
+def diff_cards(parent_cards, cards, parent_hash, depth):
+    """
+    Computes the delta that rebuilds a board's cards from its parent snapshot.
+
+    Args:
+        parent_cards (list of dict): Cards of the parent snapshot.
+        cards (list of dict): Cards of the new snapshot.
+        parent_hash (str): Content hash of the parent snapshot.
+        depth (int): Number of deltas between the new snapshot and its keyframe.
+
+    Returns:
+        dict or None: The delta, or None if either board's cards cannot be matched by ID.
+    """
+    parent_by_id = _index_cards(parent_cards)
+    cards_by_id = _index_cards(cards)
+    if parent_by_id is None or cards_by_id is None:
+        return None
+
+    added = [card for card in cards if card["id"] not in parent_by_id]
+    removed = [card_id for card_id in parent_by_id if card_id not in cards_by_id]
+    changed = {}
+    for card in cards:
+        parent_card = parent_by_id.get(card["id"])
+        if parent_card is None or parent_card == card:
+            continue
+        change = {
+            "set": {
+                field: value for field, value in card.items()
+                if field not in parent_card or parent_card[field] != value
+            }
+        }
+        unset = [field for field in parent_card if field not in card]
+        if unset:
+            change["unset"] = unset
+        changed[card["id"]] = change
+
+    delta = {
+        "format": DELTA_FORMAT,
+        "parent": parent_hash,
+        "depth": depth,
+        "added": added,
+        "removed": removed,
+        "changed": changed
+    }
+    # apply_delta keeps the parent order and appends added cards; record any other order
+    order = [card["id"] for card in cards]
+    default_order = [card_id for card_id in parent_by_id if card_id in cards_by_id]
+    default_order.extend(card["id"] for card in added)
+    if order != default_order:
+        delta["order"] = order
+    return delta
+
+
+def apply_delta(parent_cards, delta):
+    """
+    Rebuilds a board's cards from its parent snapshot and a delta.
+
+    The parent cards are not modified; unchanged cards are shared with the result.
+
+    Args:
+        parent_cards (list of dict): Cards of the parent snapshot.
+        delta (dict): The delta produced by diff_cards.
+
+    Returns:
+        list of dict: The rebuilt cards.
+    """
+    cards_by_id = {card["id"]: card for card in parent_cards}
+    for card_id in delta["removed"]:
+        del cards_by_id[card_id]
+    for card_id, change in delta["changed"].items():
+        card = dict(cards_by_id[card_id])
+        card.update(change["set"])
+        for field in change.get("unset", ()):
+            card.pop(field, None)
+        cards_by_id[card_id] = card
+    for card in delta["added"]:
+        cards_by_id[card["id"]] = card
+
+    if "order" in delta:
+        return [cards_by_id[card_id] for card_id in delta["order"]]
+    return list(cards_by_id.values())
+
+
+class SnapshotCache:
+    """
+    Initializes a thread-safe LRU cache of rebuilt snapshots.
+
+    Snapshots are kept as canonical JSON and parsed on every hit, so callers always receive
+    their own copy. Entries never go stale because snapshots are keyed by content hash.
+
+    Args:
+        max_entries (int, optional): Number of snapshots kept. Defaults to 16.
+    """
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, snapshot_hash):
+        """
+        Returns a cached snapshot and marks it as recently used.
+
+        Args:
+            snapshot_hash (str): The snapshot's content hash.
+
+        Returns:
+            tuple or None: (board_data, depth), or None if the snapshot is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(snapshot_hash)
+            if entry is None:
+                return None
+            self._entries.move_to_end(snapshot_hash)
+        raw, depth = entry
+        return json.loads(raw), depth
+
+    def put(self, snapshot_hash, board_data, depth):
+        """
+        Caches a snapshot, evicting the least recently used one when full.
+
+        Args:
+            snapshot_hash (str): The snapshot's content hash.
+            board_data (list): The board data.
+            depth (int): Number of deltas between the snapshot and its keyframe.
+        """
+        if self.max_entries <= 0:
+            return
+        raw = _canonical_json(board_data)
+        with self._lock:
+            self._entries[snapshot_hash] = (raw, depth)
+            self._entries.move_to_end(snapshot_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,277 @@
+"""
+sync.py
+
+This module contains the `BoardSync` class, which keeps a locally persisted copy of a board's
+cards current by replaying the board's actions instead of downloading every card again.
+
+The first sync downloads a full board snapshot. Later syncs request only the actions since the
+last one seen, together with the open lists and the members, in a single small request, and
+apply them to the stored cards. Cards an action does not fully describe (created, copied, moved
+in from another board or unarchived) are fetched in batches. If more actions are pending than
+one request can return, the board is downloaded in full again.
+
+Classes:
+    - BoardSync: Incrementally synchronizes a board's cards from its actions.
+
+Functions:
+    - apply_action: Applies one Trello action to cards keyed by ID.
+
+Example Usage:
+    board_sync = BoardSync(trello_api)
+    board = Board.from_snapshot(trello_api, board_sync.sync())
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from trello.board import Board
+
+DEFAULT_STATE_DIR = Path(__file__).parent.parent / ".cache" / "sync"
+
+# Actions that change the cards of a board
+ACTION_TYPES = (
+    "createCard",
+    "copyCard",
+    "convertToCardFromCheckItem",
+    "moveCardToBoard",
+    "moveCardFromBoard",
+    "updateCard",
+    "deleteCard",
+    "addLabelToCard",
+    "removeLabelFromCard",
+    "addMemberToCard",
+    "removeMemberFromCard",
+    "updateCustomFieldItem"
+)
+
+# Actions whose data does not hold the whole card, so the card must be fetched
+FETCH_ACTIONS = ("createCard", "copyCard", "convertToCardFromCheckItem", "moveCardToBoard")
+
+
+def apply_action(cards_by_id, action, card_fields=Board.CARD_FIELDS):
+    """
+    Applies one Trello action to cards keyed by ID, in place.
+
+    Args:
+        cards_by_id (dict): Card dictionaries keyed by card ID, each holding the card fields
+            and its 'customFieldItems'.
+        action (dict): A Trello action with 'type' and 'data'.
+        card_fields (tuple of str, optional): Card fields to keep up to date; changes to other
+            fields are ignored. Defaults to Board.CARD_FIELDS.
+
+    Returns:
+        str or None: ID of a card that must be fetched because the action does not describe
+            it fully, or None.
+    """
+    action_type = action.get("type")
+    data = action.get("data", {})
+    card_id = data.get("card", {}).get("id")
+    if card_id is None:
+        return None
+
+    if action_type in FETCH_ACTIONS:
+        return card_id
+    if action_type in ("deleteCard", "moveCardFromBoard"):
+        cards_by_id.pop(card_id, None)
+        return None
+
+    card = cards_by_id.get(card_id)
+    if card is None:
+        # Changes to cards that are not stored (archived or unknown) need the whole card
+        unarchived = action_type == "updateCard" and data["card"].get("closed") is False
+        return card_id if unarchived else None
+
+    if action_type == "updateCard":
+        if data["card"].get("closed"):
+            # Archived cards are not part of the visible board
+            del cards_by_id[card_id]
+            return None
+        for field in data.get("old", {}):
+            if field in card_fields and field in data["card"]:
+                card[field] = data["card"][field]
+    elif action_type == "addLabelToCard":
+        label = data["label"]
+        labels = card.setdefault("labels", [])
+        if all(existing.get("id") != label.get("id") for existing in labels):
+            labels.append(label)
+    elif action_type == "removeLabelFromCard":
+        label_id = data["label"].get("id")
+        card["labels"] = [
+            label for label in card.get("labels", []) if label.get("id") != label_id
+        ]
+    elif action_type == "addMemberToCard":
+        member_id = data.get("idMember") or data.get("member", {}).get("id")
+        id_members = card.setdefault("idMembers", [])
+        if member_id not in id_members:
+            id_members.append(member_id)
+    elif action_type == "removeMemberFromCard":
+        member_id = data.get("idMember") or data.get("member", {}).get("id")
+        card["idMembers"] = [
+            existing for existing in card.get("idMembers", []) if existing != member_id
+        ]
+    elif action_type == "updateCustomFieldItem":
+        item = data.get("customFieldItem", {})
+        field_id = item.get("idCustomField") or data.get("customField", {}).get("id")
+        items = [
+            existing for existing in card.get("customFieldItems", [])
+            if existing.get("idCustomField") != field_id
+        ]
+        if item.get("value") is not None:
+            items.append({"idCustomField": field_id, "value": item["value"]})
+        card["customFieldItems"] = items
+    return None
+
+
+class BoardSync:
+    """
+    Initializes a BoardSync persisting a board's state under a directory.
+
+    Args:
+        api (TrelloAPI or SyncTrelloAPI): The API client.
+        state_dir (str or Path, optional): Directory holding one state file per board.
+            Defaults to the `.cache/sync` directory under the tools directory.
+        action_limit (int, optional): Most actions requested per sync; when more are pending
+            the board is downloaded in full. Defaults to 1000, Trello's maximum.
+    """
+    def __init__(self, api, state_dir=DEFAULT_STATE_DIR, action_limit=1000):
+        self.api = api
+        self.state_path = Path(state_dir) / f"{api.board_id}.json"
+        self.action_limit = action_limit
+        self.state = self._load()
+        self.stats = {"full_syncs": 0, "actions_applied": 0, "cards_fetched": 0}
+
+    def _load(self):
+        """
+        Reads the persisted board state.
+
+        Returns:
+            dict or None: The state, or None if the board was never synchronized.
+        """
+        try:
+            with open(self.state_path, encoding="utf-8") as state_file:
+                return json.load(state_file)
+        except (OSError, ValueError):
+            return None
+
+    def _save(self):
+        """ Writes the board state atomically """
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(self.state, tmp_file)
+            os.replace(tmp_path, self.state_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def get_snapshot(self):
+        """
+        Returns the stored board in the format of TrelloAPI.get_board_snapshot.
+
+        Returns:
+            dict: The board with 'cards', 'lists' and 'members' lists, or None if the board
+                was never synchronized.
+        """
+        if self.state is None:
+            return None
+        return {
+            "id": self.state["id"],
+            "cards": list(self.state["cards"].values()),
+            "lists": self.state["lists"],
+            "members": self.state["members"]
+        }
+
+    def full_sync(self):
+        """
+        Downloads the whole board and records the latest action as the sync point.
+
+        Returns:
+            dict: The board snapshot.
+        """
+        # Record the sync point first, so actions racing the download are replayed next time
+        started_at = datetime.now(timezone.utc).isoformat()
+        latest = self.api.get_board_changes(
+            None, ACTION_TYPES, list_fields=Board.LIST_FIELDS, limit=1)
+        latest_actions = latest.get("actions", [])
+        snapshot = self.api.get_board_snapshot(
+            card_fields=Board.CARD_FIELDS,
+            list_fields=Board.LIST_FIELDS,
+            member_fields=Board.MEMBER_FIELDS
+        )
+        self.state = {
+            "board_id": self.api.board_id,
+            # The configured board ID may be a shortLink; cards refer to the full ID
+            "id": snapshot.get("id", self.api.board_id),
+            "since": latest_actions[0]["id"] if latest_actions else started_at,
+            "cards": {card["id"]: card for card in snapshot.get("cards", [])},
+            "lists": snapshot.get("lists", []),
+            "members": snapshot.get("members", [])
+        }
+        self.stats["full_syncs"] += 1
+        self._save()
+        return self.get_snapshot()
+
+    def sync(self):
+        """
+        Brings the stored board up to date, downloading it in full only when needed.
+
+        Returns:
+            dict: The board snapshot.
+        """
+        if self.state is None or self.state.get("board_id") != self.api.board_id:
+            return self.full_sync()
+
+        changes = self.api.get_board_changes(
+            self.state["since"],
+            ACTION_TYPES,
+            list_fields=Board.LIST_FIELDS,
+            limit=self.action_limit,
+            member_fields=Board.MEMBER_FIELDS
+        )
+        actions = changes.get("actions", [])
+        if len(actions) >= self.action_limit:
+            # Older pending actions were cut off, so the stored cards cannot be trusted
+            return self.full_sync()
+
+        # Actions arrive newest first
+        cards_by_id = self.state["cards"]
+        to_fetch = []
+        for action in reversed(actions):
+            card_id = apply_action(cards_by_id, action)
+            if card_id is not None:
+                to_fetch.append(card_id)
+        self._fetch_cards(list(dict.fromkeys(to_fetch)))
+
+        if actions:
+            self.state["since"] = actions[0]["id"]
+        self.state["lists"] = changes.get("lists", self.state["lists"])
+        self.state["members"] = changes.get("members", self.state["members"])
+        self.stats["actions_applied"] += len(actions)
+        self._save()
+        return self.get_snapshot()
+
+    def _fetch_cards(self, card_ids):
+        """
+        Fetches cards in batches and stores the ones still open on the board.
+
+        Args:
+            card_ids (list of str): IDs of the cards to fetch.
+        """
+        if not card_ids:
+            return
+        cards = self.api.get_cards(
+            card_ids,
+            fields=Board.CARD_FIELDS + ("closed", "idBoard"),
+            custom_field_items=True
+        )
+        self.stats["cards_fetched"] += len(card_ids)
+        for card_id, card in cards.items():
+            # Cards deleted, archived or moved to another board since the action are dropped
+            if card is None or card.pop("closed") or card.pop("idBoard") != self.state["id"]:
+                self.state["cards"].pop(card_id, None)
+                continue
+            self.state["cards"][card_id] = card
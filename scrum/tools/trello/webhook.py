@@ -0,0 +1,346 @@
+"""
+webhook.py
+
+This module contains the `LiveBoard` class, which keeps a board's cards and story point totals
+current from Trello webhook callbacks, and a small HTTP service receiving those callbacks.
+
+The live board starts from a Board and applies each action to the raw card it changes, then
+rebuilds only that Card. A StoryPointAggregator moves the board totals by the card's changed
+contribution, so they can be read at any time without recalculating.
+Actions received between loading the board and registering the webhook are not replayed, so
+the board should be loaded after the webhook is registered.
+
+Classes:
+    - LiveBoard: Keeps cards and story point totals current from Trello actions.
+
+Functions:
+    - verify_signature: Checks the signature Trello sends with each webhook callback.
+    - make_server: Creates an HTTP server receiving webhook callbacks for a live board.
+    - replay: Applies recorded webhook payloads to a live board.
+
+Example Usage:
+    live_board = LiveBoard(Board.from_snapshot(trello_api), api=trello_api)
+    make_server(live_board, port=8080).serve_forever()
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from trello.aggregator import StoryPointAggregator
+from trello.board import Board, card_story_points, index_custom_fields
+from trello.sync import apply_action
+
+SIGNATURE_HEADER = "X-Trello-Webhook"
+
+# Actions on lists whose new name must be applied to the list's cards
+LIST_ACTIONS = ("createList", "updateList")
+
+
+class LiveBoard:
+    """
+    Initializes a LiveBoard from a loaded board.
+
+    Args:
+        board (Board): The board, created from a snapshot or with its custom fields data so
+            every card carries its story point custom fields.
+        api (TrelloAPI or SyncTrelloAPI, optional): Fetches cards an action does not fully
+            describe, such as newly created cards. If None, those cards are built from the
+            action data alone. Defaults to None.
+    """
+    def __init__(self, board, api=None):
+        self.board = board
+        self.api = api
+        self._lock = threading.Lock()
+        self._list_names = {list_obj['id']: list_obj['name'] for list_obj in board.lists}
+        self._sp_ids = (board.board_config['sp_total_id'], board.board_config['sp_spent_id'])
+        self._cards = {}
+        self._aggregator = StoryPointAggregator()
+        self._actions_applied = 0
+
+        # Keep the raw cards with their custom fields so actions can be applied to them
+        custom_fields = board.custom_fields_data or []
+        items_by_card = {card['id']: card.get('customFieldItems', []) for card in custom_fields}
+        self._card_data = {}
+        for card in board.get_data():
+            card = dict(card)
+            card.setdefault('customFieldItems', items_by_card.get(card['id'], []))
+            self._card_data[card['id']] = card
+        for card_id in self._card_data:
+            self._refresh_card(card_id)
+
+    def get_calcs(self):
+        """
+        Returns the board's story point totals, as Board.calculate_story_points would.
+
+        Returns:
+            dict: A dictionary with story points for 'planned', 'unplanned', and 'retro'
+                categories.
+        """
+        with self._lock:
+            return self._aggregator.get_calcs()
+
+    def get_cards(self):
+        """
+        Returns the tracked cards.
+
+        Returns:
+            list of Card: The cards counting towards story points.
+        """
+        with self._lock:
+            return list(self._cards.values())
+
+    def get_stats(self):
+        """
+        Reports the size of the live board.
+
+        Returns:
+            dict: Counts of tracked 'cards' and 'actions_applied'.
+        """
+        with self._lock:
+            return {"cards": len(self._cards), "actions_applied": self._actions_applied}
+
+    def apply_action(self, action):
+        """
+        Applies one Trello action and updates the changed cards and board totals.
+
+        Args:
+            action (dict): A Trello action with 'type' and 'data', as sent in webhook payloads.
+        """
+        action_type = action.get("type")
+        data = action.get("data", {})
+        with self._lock:
+            self._actions_applied += 1
+            if action_type in LIST_ACTIONS:
+                self._apply_list_action(data.get("list", {}))
+                return
+
+            card_id = data.get("card", {}).get("id")
+            if card_id is None:
+                return
+            fetch_id = apply_action(self._card_data, action)
+            if fetch_id is None:
+                self._refresh_card(card_id)
+                return
+
+        # Fetch outside the lock, so a slow request holds up no other delivery or read
+        card = self._fetch_card(fetch_id, action)
+        with self._lock:
+            if card is None:
+                self._card_data.pop(fetch_id, None)
+            else:
+                self._card_data[fetch_id] = card
+            self._refresh_card(card_id)
+
+    def _apply_list_action(self, list_data):
+        """
+        Records a created, renamed or archived list and rebuilds the cards on it.
+
+        Args:
+            list_data (dict): The list from the action data.
+        """
+        list_id = list_data.get("id")
+        if list_id is None:
+            return
+        if list_data.get("closed"):
+            # Archived lists are not part of the visible board
+            self._list_names.pop(list_id, None)
+        elif "name" in list_data:
+            self._list_names[list_id] = list_data["name"]
+        for card_id, card in self._card_data.items():
+            if card.get("idList") == list_id:
+                self._refresh_card(card_id)
+
+    def _fetch_card(self, card_id, action):
+        """
+        Fetches the current state of a card the action does not fully describe.
+
+        Does not touch the live board's state, so it is called without holding the lock.
+
+        Args:
+            card_id (str): The card ID.
+            action (dict): The action that created, copied or restored the card.
+
+        Returns:
+            dict or None: The card data, or None if the card is no longer on the board.
+        """
+        data = action.get("data", {})
+        if self.api is None:
+            # Without an API only what the action names is known; labels, members and story
+            # points arrive with the card's later actions
+            card = data["card"]
+            return {
+                "id": card_id,
+                "shortLink": card.get("shortLink"),
+                "name": card.get("name", ""),
+                "labels": [],
+                "idList": card.get("idList") or data.get("list", {}).get("id"),
+                "idMembers": [],
+                "desc": "",
+                "customFieldItems": []
+            }
+
+        card = self.api.get_cards(
+            [card_id],
+            fields=Board.CARD_FIELDS + ("closed", "idBoard"),
+            custom_field_items=True
+        ).get(card_id)
+        # Cards deleted, archived or moved to another board before they were fetched are dropped
+        board_id = data.get("board", {}).get("id")
+        if card is None or card.pop("closed") or card.pop("idBoard") != board_id:
+            return None
+        return card
+
+    def _refresh_card(self, card_id):
+        """
+        Rebuilds one Card from its raw data and updates its contribution to the board totals.
+
+        Args:
+            card_id (str): The card ID.
+        """
+        data = self._card_data.get(card_id)
+        list_name = self._list_names.get(data.get("idList"), "") if data is not None else ""
+        if data is None or not self.board.is_tracked_card(card_id, list_name):
+            self._cards.pop(card_id, None)
+            self._aggregator.remove(card_id)
+            return
+        card = self.board.make_card(data, list_name)
+        card_fields = index_custom_fields([data])[card_id]
+        card.set_story_points(card_story_points(card_fields, *self._sp_ids))
+        self._cards[card_id] = card
+        self._aggregator.update(card)
+
+
+def verify_signature(body, signature, secret, callback_url):
+    """
+    Checks the signature Trello sends with each webhook callback.
+
+    Trello signs the request body followed by the webhook's callback URL with HMAC-SHA1,
+    keyed with the application secret, and sends the base64 digest.
+
+    Args:
+        body (bytes): The raw request body.
+        signature (str or None): The X-Trello-Webhook header value.
+        secret (str): The Trello application secret.
+        callback_url (str): The callback URL the webhook was registered with.
+
+    Returns:
+        bool: True if the signature matches.
+    """
+    if not signature:
+        return False
+    digest = hmac.new(
+        secret.encode("utf-8"),
+        body + callback_url.encode("utf-8"),
+        hashlib.sha1
+    ).digest()
+    return hmac.compare_digest(base64.b64encode(digest).decode("ascii"), signature)
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    """
+    Handles Trello webhook callbacks and story point queries for a live board.
+
+    HEAD answers the check Trello makes when a webhook is registered, POST applies the action
+    of a callback and GET /calcs returns the board totals as JSON. The live board and the
+    signature settings are set on subclasses created by make_server.
+    """
+    live_board = None
+    secret = None
+    callback_url = None
+
+    def _send_json(self, status, payload):
+        """
+        Sends a JSON response.
+
+        Args:
+            status (int): The HTTP status code.
+            payload: The JSON serializable response body.
+        """
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self): # pylint: disable=invalid-name
+        """ Acknowledges the webhook registration check """
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self): # pylint: disable=invalid-name
+        """ Returns the board totals and live board size """
+        if self.path.rstrip("/") != "/calcs":
+            self._send_json(404, {"error": "not found"})
+            return
+        self._send_json(200, {
+            "calcs": self.live_board.get_calcs(),
+            **self.live_board.get_stats()
+        })
+
+    def do_POST(self): # pylint: disable=invalid-name
+        """ Applies the action of a webhook callback """
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.secret is not None and not verify_signature(
+                body, self.headers.get(SIGNATURE_HEADER), self.secret, self.callback_url):
+            self._send_json(401, {"error": "invalid signature"})
+            return
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self._send_json(400, {"error": "invalid JSON"})
+            return
+        if not isinstance(payload, dict):
+            self._send_json(400, {"error": "payload must be a JSON object"})
+            return
+        self.live_board.apply_action(payload.get("action", {}))
+        self._send_json(200, {"status": "ok"})
+
+
+def make_server(live_board, host="127.0.0.1", port=8080, secret=None, callback_url=None):
+    """
+    Creates an HTTP server receiving webhook callbacks for a live board.
+
+    Args:
+        live_board (LiveBoard): The board to keep current.
+        host (str, optional): Address to listen on. Defaults to 127.0.0.1.
+        port (int, optional): Port to listen on. Defaults to 8080.
+        secret (str, optional): The Trello application secret. If set, callbacks without a
+            valid signature are rejected. Defaults to None.
+        callback_url (str, optional): The callback URL the webhook was registered with,
+            required to check signatures. Defaults to None.
+
+    Returns:
+        ThreadingHTTPServer: The server; call serve_forever() to start it.
+
+    Raises:
+        ValueError: If a secret is given without a callback URL.
+    """
+    if secret is not None and callback_url is None:
+        raise ValueError("A callback URL is required to verify webhook signatures")
+    handler = type("BoundWebhookHandler", (WebhookHandler,), {
+        "live_board": live_board,
+        "secret": secret,
+        "callback_url": callback_url
+    })
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def replay(live_board, payloads):
+    """
+    Applies recorded webhook payloads to a live board, in order.
+
+    Args:
+        live_board (LiveBoard): The board to update.
+        payloads (list of dict): Webhook payloads holding an 'action', or bare actions.
+
+    Returns:
+        dict: The board totals after the last payload.
+    """
+    for payload in payloads:
+        live_board.apply_action(payload.get("action", payload))
+    return live_board.get_calcs()
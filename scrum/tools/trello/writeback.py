@@ -0,0 +1,220 @@
+"""
+writeback.py
+
+This module contains the `StoryPointWriter` class, which writes story point values back to the
+custom fields of many Trello cards.
+
+The desired values are first compared with each card's current customFieldItems, so only the
+fields that actually change are sent, and all of a card's changed fields go in a single request.
+The requests run concurrently on a thread pool; every one of them goes through the rate limit
+scheduler of the API, so the writes stay within Trello's limits. Connection errors, timeouts and
+429/5xx responses left over after the scheduler's own retries are retried with backoff, while
+other client errors fail at once. The outcome of every card is returned as a report.
+
+Classes:
+    - StoryPointWriter: Writes story point values to many cards, sending only what changed.
+
+Functions:
+    - diff_story_points: Finds the story point fields whose values differ from the desired ones.
+
+Example Usage:
+    writer = StoryPointWriter(trello_api, board_config)
+    report = writer.write({"5f1a...": {"total": 5, "spent": 3}})
+    print(report["updated"], report["failed"])
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from trello.board import index_custom_fields
+from trello.ratelimit import RETRY_STATUSES
+
+# Story point names accepted in the desired values
+STORY_POINT_FIELDS = ("total", "spent")
+
+# Errors worth sending the request again for
+RETRYABLE_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+def _current_value(value):
+    """
+    Parses a custom field value as it is stored on the card.
+
+    Args:
+        value (dict or None): The custom field value, e.g. {'number': '3'}.
+
+    Returns:
+        int or None: The number, or None if the field is not set.
+    """
+    if not value or 'number' not in value:
+        return None
+    return int(value['number'])
+
+
+def diff_story_points(cards, desired, sp_total_id, sp_spent_id):
+    """
+    Finds the story point fields whose current values differ from the desired ones.
+
+    A field that is not set on the card is always sent, even when the desired value is 0.
+
+    Args:
+        cards (list of dict): Card dictionaries holding 'id' and 'customFieldItems'.
+        desired (dict): Desired story points keyed by card ID, e.g. {'total': 5, 'spent': 3}.
+            Story points left out are not changed.
+        sp_total_id (str): ID of the total story points custom field.
+        sp_spent_id (str): ID of the spent story points custom field.
+
+    Returns:
+        dict: Changed values keyed by custom field ID, keyed by card ID. Cards with nothing to
+            change and desired cards missing from cards are left out.
+
+    Raises:
+        ValueError: If a desired story point is not 'total' or 'spent'.
+    """
+    field_ids = {"total": sp_total_id, "spent": sp_spent_id}
+    current = index_custom_fields(cards)
+    changes = {}
+    for card_id, values in desired.items():
+        unknown = set(values) - set(STORY_POINT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown story points for card {card_id}: "
+                             f"{', '.join(sorted(unknown))}")
+        if card_id not in current:
+            continue
+        card_changes = {
+            field_ids[name]: int(value)
+            for name, value in values.items()
+            if _current_value(current[card_id].get(field_ids[name])) != int(value)
+        }
+        if card_changes:
+            changes[card_id] = card_changes
+    return changes
+
+
+class StoryPointWriter:
+    """
+    Initializes a StoryPointWriter instance.
+
+    Args:
+        api (TrelloAPI): The Trello API used for the writes. Its requests go through its rate
+            limit scheduler, so one instance may be shared by all the worker threads.
+        board_config (dict): The board configuration holding 'sp_total_id' and 'sp_spent_id'.
+        max_workers (int, optional): Most requests in flight at once. Defaults to 8.
+        max_attempts (int, optional): Most times a card's request is sent. Defaults to 3.
+        backoff_base (float, optional): Seconds of the first retry backoff, doubled on every
+            retry. Defaults to 0.5.
+        sleep (callable, optional): Waits a number of seconds. Defaults to time.sleep.
+    """
+    def __init__(self, api, board_config, max_workers=8, max_attempts=3, backoff_base=0.5,
+                 sleep=time.sleep):
+        self.api = api
+        self.sp_total_id = board_config['sp_total_id']
+        self.sp_spent_id = board_config['sp_spent_id']
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.sleep = sleep
+
+    @staticmethod
+    def is_retryable(error):
+        """
+        Tells whether a failed request is worth sending again.
+
+        Args:
+            error (Exception): The error the request raised.
+
+        Returns:
+            bool: True for connection errors, timeouts and 429/5xx responses.
+        """
+        if isinstance(error, RETRYABLE_ERRORS):
+            return True
+        response = getattr(error, 'response', None)
+        return (isinstance(error, requests.exceptions.HTTPError)
+                and response is not None and response.status_code in RETRY_STATUSES)
+
+    def plan(self, desired, cards=None):
+        """
+        Finds the story point fields that must be written.
+
+        Args:
+            desired (dict): Desired story points keyed by card ID, e.g. {'total': 5}.
+            cards (list of dict, optional): The cards' current 'id' and 'customFieldItems'.
+                Defaults to fetching the desired cards in batches.
+
+        Returns:
+            tuple: The changed values keyed by card ID, as diff_story_points() returns them,
+                and the set of desired card IDs that were not found.
+        """
+        if cards is None:
+            fetched = self.api.get_cards(list(desired), fields=("id",), custom_field_items=True)
+            cards = [card for card in fetched.values() if card is not None]
+        found = {card['id'] for card in cards}
+        missing = {card_id for card_id in desired if card_id not in found}
+        changes = diff_story_points(cards, desired, self.sp_total_id, self.sp_spent_id)
+        return changes, missing
+
+    def _write_card(self, card_id, values):
+        """
+        Sends one card's changed fields, retrying retryable failures.
+
+        Args:
+            card_id (str): ID of the card.
+            values (dict): Values to write keyed by custom field ID.
+
+        Returns:
+            dict: The card's 'status', 'fields', 'attempts' and 'error'.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self.api.put_custom_fields(card_id, values)
+                return {"status": "updated", "fields": values, "attempts": attempt, "error": None}
+            except requests.exceptions.RequestException as e:
+                if attempt >= self.max_attempts or not self.is_retryable(e):
+                    return {"status": "failed", "fields": values, "attempts": attempt,
+                            "error": f"{type(e).__name__}: {e}"}
+                self.sleep(random.uniform(0, self.backoff_base * 2 ** (attempt - 1)))
+
+    def write(self, desired, cards=None):
+        """
+        Writes the desired story points, sending only the fields that changed.
+
+        Args:
+            desired (dict): Desired story points keyed by card ID, e.g. {'total': 5, 'spent': 3}.
+            cards (list of dict, optional): The cards' current 'id' and 'customFieldItems'.
+                Defaults to fetching the desired cards in batches.
+
+        Returns:
+            dict: The outcome of each desired card under 'cards', each with a 'status' of
+                'updated', 'unchanged', 'failed' or 'missing', the 'fields' sent, the
+                'attempts' made and any 'error', plus the count of every status.
+
+        Raises:
+            ValueError: If a desired story point is not 'total' or 'spent'.
+        """
+        changes, missing = self.plan(desired, cards)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                card_id: executor.submit(self._write_card, card_id, values)
+                for card_id, values in changes.items()
+            }
+            written = {card_id: future.result() for card_id, future in futures.items()}
+
+        results = {}
+        for card_id in desired:
+            if card_id in written:
+                results[card_id] = written[card_id]
+            elif card_id in missing:
+                results[card_id] = {"status": "missing", "fields": {}, "attempts": 0,
+                                    "error": "Card not found"}
+            else:
+                results[card_id] = {"status": "unchanged", "fields": {}, "attempts": 0,
+                                    "error": None}
+        report = {"cards": results}
+        for status in ("updated", "unchanged", "failed", "missing"):
+            report[status] = sum(1 for result in results.values() if result["status"] == status)
+        return report